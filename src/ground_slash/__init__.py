@@ -14,6 +14,7 @@ def main():
     )
     parser.add_argument("-f", "--file", type=str, default=None)
     parser.add_argument("-o", "--outfile", type=str, default=None)
+    parser.add_argument("-c", "--cache", type=str, default=None)
 
     # parse command line arguments
     args = parser.parse_args()
@@ -30,7 +31,7 @@ def main():
         prog = Program.from_string(f.read())
 
     # ground program
-    ground_prog = Grounder(prog).ground()
+    ground_prog = Grounder(prog, cache=args.cache).ground()
 
     if args.outfile is None:
         # output ground program to console
@@ -1,2 +1,6 @@
+from .atoms import AtomTable  # noqa
+from .cache import GroundingCache  # noqa
 from .graphs import *  # noqa
 from .grounder import Grounder  # noqa
+from .store import LiteralStore  # noqa
+from .template import Template  # noqa
@@ -0,0 +1,147 @@
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+from ground_slash.program.literals import PredLiteral
+
+from .store import indexable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ground_slash.program.terms import Term
+
+
+class AtomTable:
+    """Table of ground atoms encoded as dense integer ids.
+
+    Each distinct ground term is assigned a term id and each distinct ground atom an
+    atom id (in order of insertion, starting at zero). The extension of each predicate
+    is stored column-wise, i.e., as one `array('q')` of term ids per argument position.
+    Literal stores sharing a table (see `LiteralStore`) register their atoms in it and
+    refer to them by their row in the predicate extension.
+
+    Only (positive or classically negated) atoms of type `PredLiteral` can be stored.
+    Default-negation is not part of an atom and is ignored.
+
+    Attributes:
+        terms: List of `Term` instances (indexed by term id).
+        term_ids: Dictionary mapping `Term` instances to term ids.
+        preds: List of triplets of predicate name, arity and classical negation
+            (indexed by predicate id).
+        pred_ids: Dictionary mapping predicate triplets to predicate ids.
+        columns: List of tuples of `array('q')` instances holding the term ids of each
+            argument position (indexed by predicate id).
+        atom_preds: `array('q')` of predicate ids (indexed by atom id).
+        atom_rows: `array('q')` of row numbers within the predicate extension
+            (indexed by atom id).
+        atom_ids: Dictionary mapping tuples of predicate id and term ids to atom ids.
+    """
+
+    def __init__(self: Self, literals: Optional[Iterable[PredLiteral]] = None) -> None:
+        """Initializes the atom table instance.
+
+        Args:
+            literals: Optional iterable over ground `PredLiteral` instances to be added.
+        """
+        self.terms: List["Term"] = []
+        self.term_ids: Dict["Term", int] = dict()
+        self.preds: List[Tuple[str, int, bool]] = []
+        self.pred_ids: Dict[Tuple[str, int, bool], int] = dict()
+        self.columns: List[Tuple[array, ...]] = []
+        self.atom_preds = array("q")
+        self.atom_rows = array("q")
+        self.atom_ids: Dict[Tuple[int, ...], int] = dict()
+
+        if literals is not None:
+            for literal in literals:
+                self.add(literal)
+
+    def __len__(self: Self) -> int:
+        return len(self.atom_preds)
+
+    def term_id(self: Self, term: "Term") -> int:
+        """Returns the id of a ground term (adding it to the table if necessary).
+
+        Args:
+            term: Ground `Term` instance.
+
+        Returns:
+            Integer representing the term id.
+
+        Raises:
+            ValueError: Non-ground term.
+        """
+        term_id = self.term_ids.get(term)
+
+        if term_id is None:
+            if not indexable(term):
+                raise ValueError(f"Cannot encode non-ground term {str(term)}.")
+
+            term_id = len(self.terms)
+            self.terms.append(term)
+            self.term_ids[term] = term_id
+
+        return term_id
+
+    def pred_id(self: Self, name: str, arity: int, neg: bool = False) -> int:
+        """Returns the id of a predicate (adding it to the table if necessary).
+
+        Args:
+            name: String representing the predicate name.
+            arity: Integer representing the predicate arity.
+            neg: Boolean indicating whether or not the predicate is classically
+                negated. Defaults to `False`.
+
+        Returns:
+            Integer representing the predicate id.
+        """
+        pred = (name, arity, neg)
+        pred_id = self.pred_ids.get(pred)
+
+        if pred_id is None:
+            pred_id = len(self.preds)
+            self.preds.append(pred)
+            self.pred_ids[pred] = pred_id
+            self.columns.append(tuple(array("q") for _ in range(arity)))
+
+        return pred_id
+
+    def add(self: Self, literal: PredLiteral) -> int:
+        """Returns the id of an atom (adding it to the table if necessary).
+
+        Args:
+            literal: Ground `PredLiteral` instance.
+
+        Returns:
+            Integer representing the atom id.
+
+        Raises:
+            ValueError: Literal is not a plain (ground) `PredLiteral` instance.
+        """
+        if type(literal) is not PredLiteral:
+            raise ValueError(f"Cannot encode literal {str(literal)} as an atom.")
+
+        name, arity = literal.pred()
+        key = (
+            self.pred_id(name, arity, literal.neg),
+            *(self.term_id(term) for term in literal.terms),
+        )
+        atom_id = self.atom_ids.get(key)
+
+        if atom_id is None:
+            atom_id = len(self.atom_preds)
+            pred_id = key[0]
+            columns = self.columns[pred_id]
+
+            self.atom_ids[key] = atom_id
+            self.atom_preds.append(pred_id)
+            # NOTE: nullary predicates have a single atom (in row zero)
+            self.atom_rows.append(len(columns[0]) if columns else 0)
+
+            for column, term_id in zip(columns, key[1:]):
+                column.append(term_id)
+
+        return atom_id
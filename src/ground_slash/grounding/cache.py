@@ -0,0 +1,206 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Optional
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ground_slash.program.program import Program
+
+
+class GroundingCache:
+    """Persistent on-disk cache of ground programs.
+
+    Entries are stored as compressed pickles in a cache directory and are keyed by a
+    stable hash of the input program (see `key`). Entries are written to temporary
+    files first and atomically moved into place, so that multiple processes can safely
+    share the same cache directory without any locks: readers either see a complete
+    entry or none at all.
+
+    The total size of the cache is bounded. If it is exceeded, the least recently
+    used entries (by modification time, updated on each hit) are evicted. Temporary
+    files count towards the size as well and are removed once they are older than
+    `grace_period` (e.g., left behind by a process killed while storing an entry).
+
+    NOTE: entries are unpickled when loaded and the cache directory must therefore
+    only be writable by trusted users.
+
+    Attributes:
+        path: String representing the path of the cache directory.
+        max_size: Integer representing the maximum total size of all entries in bytes.
+    """
+
+    # file extension of (complete) cache entries
+    suffix: str = ".pkl.z"
+    # file extension of temporary files (incomplete entries)
+    tmp_suffix: str = ".tmp"
+    # time in seconds after which temporary files are considered stale
+    grace_period: float = 3600.0
+
+    def __init__(self: Self, path: str, max_size: int = 2**30) -> None:
+        """Initializes the cache instance.
+
+        Args:
+            path: String representing the path of the cache directory. Created if it
+                does not exist yet.
+            max_size: Integer representing the maximum total size of all entries in
+                bytes. Defaults to 1 GiB.
+
+        Raises:
+            ValueError: Invalid maximum size.
+        """
+        if max_size < 0:
+            raise ValueError(f"Invalid maximum size for {type(self)}: {max_size}")
+
+        self.path = path
+        self.max_size = max_size
+
+        os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def key(prog: "Program") -> str:
+        """Computes a stable key for a program.
+
+        The key depends on the (normalized) statements of the program, i.e., their
+        string representations regardless of their order and duplicates, the query and
+        the package version.
+
+        Args:
+            prog: `Program` instance.
+
+        Returns:
+            String representing the hexadecimal SHA-256 digest.
+        """
+        from ground_slash import __version__
+
+        digest = hashlib.sha256()
+
+        for part in (
+            __version__,
+            *sorted(set(str(statement) for statement in prog.statements)),
+            str(prog.query) if prog.query is not None else "",
+        ):
+            digest.update(part.encode("utf-8"))
+            # separator (cannot occur in encoded strings)
+            digest.update(b"\xff")
+
+        return digest.hexdigest()
+
+    def entry(self: Self, key: str) -> str:
+        """Returns the path of the entry for a key."""
+        return os.path.join(self.path, key + self.suffix)
+
+    def load(self: Self, key: str) -> Optional[Any]:
+        """Loads an entry.
+
+        Args:
+            key: String representing the key of the entry.
+
+        Returns:
+            Stored object or `None` if there is no (valid) entry for the key.
+        """
+        path = self.entry(key)
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+
+            # mark entry as recently used
+            os.utime(path)
+        except OSError:
+            # missing (or concurrently evicted) entry
+            return None
+
+        try:
+            return pickle.loads(zlib.decompress(data))
+        except Exception:
+            # corrupt or incompatible entry
+            return None
+
+    def store(self: Self, key: str, obj: Any) -> None:
+        """Stores an entry and evicts the least recently used entries if necessary.
+
+        Args:
+            key: String representing the key of the entry.
+            obj: Picklable object to be stored.
+        """
+        data = zlib.compress(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=self.tmp_suffix)
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+
+            # atomically replace any previous entry
+            os.replace(tmp_path, self.entry(key))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self.evict()
+
+    def evict(self: Self) -> None:
+        """Evicts the least recently used entries until the maximum size is met.
+
+        Stale temporary files are removed, while the size of recent ones (possibly
+        still being written) counts towards the total size.
+        """
+        entries = []
+        size = 0
+        stale = time.time_ns() - int(self.grace_period * 1e9)
+
+        for name in os.listdir(self.path):
+            is_tmp = name.endswith(self.tmp_suffix)
+
+            if not is_tmp and not name.endswith(self.suffix):
+                continue
+
+            path = os.path.join(self.path, name)
+
+            try:
+                stat = os.stat(path)
+
+                if is_tmp and stat.st_mtime_ns < stale:
+                    os.remove(path)
+                    continue
+            except OSError:
+                # concurrently evicted (or moved into place)
+                continue
+
+            size += stat.st_size
+
+            if not is_tmp:
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        # oldest entries first
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                # concurrently evicted
+                pass
+
+            size -= entry_size
+
+    def clear(self: Self) -> None:
+        """Removes all entries (and temporary files)."""
+        for name in os.listdir(self.path):
+            if name.endswith((self.suffix, self.tmp_suffix)):
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
@@ -1,4 +1,4 @@
 from .component_graph import ComponentGraph  # noqa
 from .dependency_graph import DependencyGraph  # noqa
-from .scc import compute_SCCs  # noqa
+from .scc import compute_SCCs, map_SCCs  # noqa
 from .topological_sort import topological_sort  # noqa
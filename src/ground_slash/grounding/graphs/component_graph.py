@@ -1,3 +1,5 @@
+from collections import defaultdict
+from itertools import chain
 from typing import TYPE_CHECKING, List, Optional, Set, Tuple, Type
 
 try:
@@ -6,7 +8,7 @@ except ImportError:
     from typing_extensions import Self
 
 from .dependency_graph import DependencyGraph
-from .scc import compute_SCCs
+from .scc import compute_SCCs, map_SCCs
 from .topological_sort import topological_sort
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -37,12 +39,7 @@ class Component:
         ]
 
         # map rules to SCC (for sorting edges)
-        rule2scc = dict()
-
-        for node in self.nodes:
-            for scc in sccs:
-                if node in scc:
-                    rule2scc[node] = scc
+        rule2scc = map_SCCs(sccs)
 
         # inter-component edges
         pos_edges = set()
@@ -53,7 +50,7 @@ class Component:
             dst_component = rule2scc[dst]
 
             if src_component is not dst_component:
-                pos_edges.add((src, dst))
+                pos_edges.add((src_component, dst_component))
 
         """Returns the refined instantiation sequence for the component."""
         # seq = topological_sort(self.nodes, self.pos_edges)
@@ -83,12 +80,7 @@ class ComponentGraph(object):
         ]
 
         # map rules to SCC (for sorting edges)
-        rule2scc = dict()
-
-        for node in dep_graph.nodes:
-            for scc in sccs:
-                if node in scc:
-                    rule2scc[node] = scc
+        rule2scc = map_SCCs(sccs)
 
         # intra-component edges
         scc_edges = {scc: (set(), set()) for scc in sccs}
@@ -121,19 +113,18 @@ class ComponentGraph(object):
         # create component instances (i.e., nodes)
         # marking components as unstratified where possible
         # (i.e., if they negatively depend on themselves)
-        components = {
+        # NOTE: same order as SCCs (i.e., reverse topological order)
+        components = [
             Component(set(scc), *scc_edges[scc], stratified=not bool(scc_edges[scc][1]))
             for scc in sccs
-        }
+        ]
 
         # map rules to actual components
-        rule2component = dict()
-
-        for component in components:
-            for rule in component.nodes:
-                rule2component[rule] = component
+        rule2component = {
+            rule: component for component in components for rule in component.nodes
+        }
 
-        graph.nodes = components
+        graph.nodes = set(components)
         graph.pos_edges = {
             (rule2component[src], rule2component[dst]) for (src, dst) in pos_edges
         }
@@ -141,35 +132,19 @@ class ComponentGraph(object):
             (rule2component[src], rule2component[dst]) for (src, dst) in neg_edges
         }
 
-        # indicate whether or not component are stratified
-        converged = False
-        # group components
-        stratified_components = {
-            component for component in components if component.stratified
-        }
-        unstratified_components = set()
+        # map components to the components they depend on
+        dependencies = defaultdict(list)
+
+        for src_component, dst_component in chain(graph.pos_edges, graph.neg_edges):
+            dependencies[src_component].append(dst_component)
 
+        # single pass in reverse topological order (i.e., dependencies first):
+        # if a component depends on an unstratified component, mark it as unstratified
         for component in components:
-            (
-                stratified_components
-                if component.stratified
-                else unstratified_components
-            ).add(component)
-
-        while not converged:
-            converged = True
-
-            for component in stratified_components.copy():
-                for src_component, dst_component in graph.edges:
-                    # if component depends on an unstratified component,
-                    # mark it as unstratisfied
-                    if (
-                        src_component == component
-                        and dst_component not in stratified_components
-                    ):
-                        component.stratified = False
-                        stratified_components.remove(component)
-                        converged = False
+            if component.stratified and not all(
+                dst_component.stratified for dst_component in dependencies[component]
+            ):
+                component.stratified = False
 
         return graph
 
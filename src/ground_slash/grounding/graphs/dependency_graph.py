@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Set, Tuple
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
 
 try:
     from typing import Self
@@ -10,36 +11,52 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class DependencyGraph:
+    """Predicate dependency graph between statements.
+
+    A statement (depender) depends positively (negatively) on another statement
+    (dependee) if a predicate of the consequents of the dependee occurs positively
+    (negatively) in the antecedents of the depender.
+
+    Attributes:
+        nodes: Collection of `Statement` instances.
+        pos_edges: Set of pairs of `Statement` instances (depender, dependee)
+            representing positive dependencies.
+        neg_edges: Set of pairs of `Statement` instances (depender, dependee)
+            representing negative dependencies.
+    """
+
     def __init__(self: Self, rules: Tuple["Statement", ...]) -> None:
         self.nodes = rules
 
         self.pos_edges = set()
         self.neg_edges = set()
 
-        for dependee in rules:
-            head_predicates = set(literal.pred() for literal in dependee.consequents())
+        # map predicates to the rules defining them (i.e., in the consequents)
+        defining: Dict[Tuple[str, int], List["Statement"]] = defaultdict(list)
+        # map predicates to the rules using them positively/negatively
+        pos_using: Dict[Tuple[str, int], List["Statement"]] = defaultdict(list)
+        neg_using: Dict[Tuple[str, int], List["Statement"]] = defaultdict(list)
 
-            for depender in rules:
-                # skip self
-                if depender is dependee:
-                    continue
+        for rule in rules:
+            for pred in set(literal.pred() for literal in rule.consequents()):
+                defining[pred].append(rule)
 
-                body_predicates = depender.antecedents()
+            body_literals = rule.antecedents()
 
-                pos_body_predicates = set(
-                    [literal.pred() for literal in body_predicates.pos_occ()]
-                )
-                neg_body_predicates = set(
-                    [literal.pred() for literal in body_predicates.neg_occ()]
-                )
+            for pred in set(literal.pred() for literal in body_literals.pos_occ()):
+                pos_using[pred].append(rule)
+            for pred in set(literal.pred() for literal in body_literals.neg_occ()):
+                neg_using[pred].append(rule)
 
-                # positive dependency
-                if head_predicates.intersection(pos_body_predicates):
-                    self.pos_edges.add((depender, dependee))
+        for using, edges in ((pos_using, self.pos_edges), (neg_using, self.neg_edges)):
+            for pred, dependers in using.items():
+                dependees = defining.get(pred, ())
 
-                # negative dependency
-                if head_predicates.intersection(neg_body_predicates):
-                    self.neg_edges.add((depender, dependee))
+                for depender in dependers:
+                    for dependee in dependees:
+                        # skip self
+                        if depender is not dependee:
+                            edges.add((depender, dependee))
 
     @property
     def edges(self: Self) -> Set[Tuple["Statement", "Statement"]]:
@@ -1,98 +1,117 @@
-from dataclasses import dataclass
-from typing import Hashable, List, Set
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, Iterator, List, Set, Tuple
 
 
-def compute_SCCs(nodes: Set[Hashable], edges: Set[Hashable]) -> List[Set[Hashable]]:
+def compute_SCCs(
+    nodes: Iterable[Hashable], edges: Iterable[Tuple[Hashable, Hashable]]
+) -> List[Set[Hashable]]:
     """Implements Tarjan's algorithm for finding strongly connected components.
 
     See Tarjan (1972): "Depth-First Search and Linear Graph Algorithms" for details.
-    """
 
-    @dataclass
-    class SCCNode:
-        """Helper class that wraps original nodes with additional information."""
+    The depth-first search is performed iteratively (using an explicit stack) over
+    precomputed adjacency lists, i.e., in time O(V+E) and independent of the
+    recursion limit.
+
+    Args:
+        nodes: Iterable over hashable nodes.
+        edges: Iterable over pairs of nodes (source, target).
+
+    Returns:
+        List of sets of nodes representing the SCCs (in reverse topological order).
+    """
+    # map nodes to targets of outgoing edges
+    adjacency: Dict[Hashable, List[Hashable]] = defaultdict(list)
 
-        node: Hashable
-        # ID of exploration (-1: unexplored)
-        id: int = -1
-        # lowest ID of node on stack reachable from node
-        # (including itself; -1: unexplored)
-        low_id: int = -1
-        on_stack: bool = False
+    for src, dst in edges:
+        adjacency[src].append(dst)
 
-    # map original nodes to wrapped counterparts
-    node_map = {node: SCCNode(node) for node in nodes}
+    # ID of exploration for each explored node
+    ids: Dict[Hashable, int] = dict()
+    # lowest ID of node on stack reachable from node (including itself)
+    low_ids: Dict[Hashable, int] = dict()
 
-    # global counter for encountered nodes
-    counter = 0
-    # stack of explored node that have not been assigned to an SCC yet
-    stack = []
+    # stack of explored nodes that have not been assigned to an SCC yet
+    stack: List[Hashable] = []
+    on_stack: Set[Hashable] = set()
 
     # list of SCCs
     scc_list = []
 
-    def scc_dfs(node: SCCNode):
-        # just in case
-        nonlocal counter
-
-        # set node id to current global counter
-        node.id = counter
-        # set lowest reachable id to current global counter (i.e., node itself)
-        node.low_id = counter
+    # DFS path of nodes together with iterators over their remaining children
+    path: List[Tuple[Hashable, Iterator[Hashable]]] = []
 
-        # increase global counter
-        counter += 1
+    def explore(node: Hashable) -> None:
+        # set node id (and lowest reachable id) to current global counter
+        ids[node] = low_ids[node] = len(ids)
 
         # push node to stack (encountered but not yet assigned to an SCC)
         stack.append(node)
-        node.on_stack = True
-
-        for src, dst in edges:
-            # node is not the source of egde
-            if src != node.node:
-                continue
-
-            # get wrapped target node
-            dst = node_map[dst]
-
-            # if target node not visited yet
-            if dst.id == -1:
-                # perform DFS from this node
-                scc_dfs(dst)
-                # update lowest reachable id on stack
-                node.low_id = min(node.low_id, dst.low_id)
-            # target node visited, but not assigned to an SCC yet
-            # (i.e., part of current SCC being built)
-            elif dst.on_stack:
-                # update lowest reachable id on stack
-                node.low_id = min(node.low_id, dst.id)
-
-        # node is root of current SCC being built
-        if node.low_id == node.id:
-            # initialize new SCC
-            scc = set()
-
-            root = False
-
-            while not root:
-                # pop nodes from stack and add them to SCC until we reach root node
-                other = stack.pop()
-                other.on_stack = False
-                # append original node to SCC
-                scc.add(other.node)
-
-                if other == node:
-                    root = True
-
-            # store SCC
-            scc_list.append(scc)
+        on_stack.add(node)
+
+        # push node to DFS path (together with iterator over its children)
+        path.append((node, iter(adjacency.get(node, ()))))
 
     # iterate over nodes
-    for node in node_map.values():
+    for root in nodes:
         # if node has not been visited yet
-        if node.id == -1:
+        if root not in ids:
             # perform DFS from this node
-            scc_dfs(node)
+            explore(root)
+
+        while path:
+            src, children = path[-1]
+
+            for dst in children:
+                # if target node not visited yet
+                if dst not in ids:
+                    # continue DFS from this node (remaining children are resumed later)
+                    explore(dst)
+                    break
+                # target node visited, but not assigned to an SCC yet
+                # (i.e., part of current SCC being built)
+                elif dst in on_stack:
+                    # update lowest reachable id on stack
+                    low_ids[src] = min(low_ids[src], ids[dst])
+            else:
+                # all children processed
+                path.pop()
+
+                # node is root of current SCC being built
+                if low_ids[src] == ids[src]:
+                    # initialize new SCC
+                    scc = set()
+
+                    while True:
+                        # pop nodes from stack and add them to SCC until we reach root
+                        other = stack.pop()
+                        on_stack.discard(other)
+                        scc.add(other)
+
+                        if other == src:
+                            break
+
+                    # store SCC
+                    scc_list.append(scc)
+
+                if path:
+                    # update lowest reachable id on stack of parent node
+                    parent = path[-1][0]
+                    low_ids[parent] = min(low_ids[parent], low_ids[src])
 
     # return SCCs
     return scc_list
+
+
+def map_SCCs(
+    sccs: Iterable[Tuple[Hashable, ...]],
+) -> Dict[Hashable, Tuple[Hashable, ...]]:
+    """Maps nodes to their strongly connected components.
+
+    Args:
+        sccs: Iterable over (hashable) collections of nodes representing the SCCs.
+
+    Returns:
+        Dictionary mapping each node to its SCC.
+    """
+    return {node: scc for scc in sccs for node in scc}
@@ -1,7 +1,20 @@
 import warnings
 from collections import defaultdict
-from copy import deepcopy
-from typing import TYPE_CHECKING, Optional, Set, Type
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 try:
     from typing import Self
@@ -16,30 +29,274 @@ except ImportError:
 from ground_slash.program.literals import (
     AggrLiteral,
     BuiltinLiteral,
-    Equal,
+    LiteralCollection,
     Naf,
     PredLiteral,
 )
 from ground_slash.program.program import Program
-from ground_slash.program.statements import Constraint
+from ground_slash.program.statements import ChoiceRule, Constraint, NormalRule
 from ground_slash.program.substitution import Substitution
-from ground_slash.program.terms import ArithVariable
 
+from .atoms import AtomTable
+from .cache import GroundingCache
 from .graphs import ComponentGraph
+from .planning import JoinPlan, MatchStep, is_positive
 from .propagation import AggrPropagator, ChoicePropagator
+from .store import LiteralStore
+from .vectorized import VectorizedJoinPlan
 
 if TYPE_CHECKING:  # pragma: no cover
-    from ground_slash.program.literals import Literal, LiteralCollection
-    from ground_slash.program.statements import Statement
+    from ground_slash.program.literals import (
+        AggrPlaceholder,
+        ChoicePlaceholder,
+        Literal,
+    )
+    from ground_slash.program.statements import (
+        AggrBaseRule,
+        AggrElemRule,
+        ChoiceBaseRule,
+        ChoiceElemRule,
+        Statement,
+    )
+    from ground_slash.program.terms import Variable
+
+    from .graphs.component_graph import Component
+
+
+# available join backends (see 'Grounder')
+JOIN_BACKENDS: Dict[str, Type[JoinPlan]] = {
+    "python": JoinPlan,
+    "numpy": VectorizedJoinPlan,
+}
+
+
+# process pools shared by calls without a specified executor (by number of workers)
+_process_pools: Dict[int, ProcessPoolExecutor] = dict()
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """Returns the process pool shared by all calls with a given number of workers.
+
+    The pool is created on first use and shut down at interpreter exit.
+
+    Args:
+        workers: Positive integer representing the number of worker processes.
+
+    Returns:
+        `ProcessPoolExecutor` instance.
+    """
+    pool = _process_pools.get(workers)
+
+    if pool is None:
+        pool = _process_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+
+    return pool
+
+
+def _select_literals(
+    literals: Iterable["Literal"], preds: Set[Tuple[str, int]]
+) -> List["PredLiteral"]:
+    """Selects the predicate literals with given predicate signatures.
+
+    Args:
+        literals: Iterable over `Literal` instances (e.g., a `LiteralStore`).
+        preds: Set of predicate signatures.
+
+    Returns:
+        List of `PredLiteral` instances.
+    """
+    if isinstance(literals, LiteralStore):
+        return [literal for pred in preds for literal in literals.lookup(pred, ())]
+
+    return [
+        literal
+        for literal in literals
+        if isinstance(literal, PredLiteral) and literal.pred() in preds
+    ]
+
+
+def _ground_partition_task(
+    plan_type: Type[JoinPlan],
+    statement: "Statement",
+    order: Tuple["Literal", ...],
+    bound: FrozenSet["Variable"],
+    certain: List["PredLiteral"],
+    possible: List["PredLiteral"],
+    subst: Substitution,
+    driver: "Literal",
+    partition: List["PredLiteral"],
+) -> Set["Statement"]:
+    """Instantiates a statement for a partition of its driver literal in a worker.
+
+    See `Grounder.partition_statement` for details.
+
+    Args:
+        plan_type: `JoinPlan` subclass used to compile the statement.
+        statement: `Statement` instance to be instantiated.
+        order: Tuple of `Literal` instances representing the join order.
+        bound: Set of `Variable` instances bound by `subst`.
+        certain: List of certain `PredLiteral` instances relevant for the statement.
+        possible: List of possible `PredLiteral` instances relevant for the statement.
+        subst: `Substitution` instance.
+        driver: Positive body literal to be matched against `partition` only.
+        partition: List of `PredLiteral` instances.
+
+    Returns:
+        Set of ground `Statement` instances.
+    """
+    atoms = AtomTable()
+
+    return plan_type(statement, order, bound).run(
+        set(certain),
+        LiteralStore(possible, atoms=atoms),
+        subst,
+        {driver: (LiteralStore(partition, atoms=atoms), None)},
+    )
+
+
+def _ground_sequence_task(
+    backend: str,
+    sequence: List[Tuple["Statement", ...]],
+    certain_literals: List["PredLiteral"],
+    possible_literals: List["PredLiteral"],
+) -> Tuple[Set["Statement"], Set["Statement"]]:
+    """Instantiates the refined components of a component in a worker process.
+
+    See `Grounder.ground_sequence` for details.
+
+    Args:
+        backend: String representing the join backend.
+        sequence: List of tuples of `Statement` instances representing the refined
+            instantiation sequence of the component.
+        certain_literals: List of certain `PredLiteral` instances relevant for the
+            component.
+        possible_literals: List of possible `PredLiteral` instances relevant for the
+            component.
+
+    Returns:
+        Tuple of the sets of certain and possible ground `Statement` instances.
+    """
+    grounder = Grounder(Program(tuple(chain.from_iterable(sequence))), backend)
+    atoms = AtomTable()
+
+    return grounder.ground_sequence(
+        sequence,
+        LiteralStore(certain_literals, atoms=atoms),
+        LiteralStore(possible_literals, atoms=atoms),
+    )
+
+
+# grounder and instantiation sequence shared by the tasks of a worker process
+# (see 'Grounder.ground_many')
+_batch_grounder: Optional[Tuple["Grounder", List[List[Tuple["Statement", ...]]]]] = None
+
+
+def _init_batch_worker(rules: Program, backend: str) -> None:
+    """Analyzes the rules once per worker process.
+
+    See `Grounder.ground_many` for details.
+
+    Args:
+        rules: `Program` instance representing the shared rules.
+        backend: String representing the join backend.
+    """
+    global _batch_grounder
+
+    grounder = Grounder(rules, backend)
+    _batch_grounder = (grounder, grounder.sequences())
+
+
+def _ground_batch_task(
+    index: int, facts: Tuple[NormalRule, ...]
+) -> Tuple[int, Tuple["Statement", ...]]:
+    """Instantiates the shared rules for a set of facts in a worker process.
+
+    See `Grounder.ground_many` for details.
+
+    Args:
+        index: Integer representing the position of the fact set.
+        facts: Tuple of `NormalRule` instances representing facts.
+
+    Returns:
+        Tuple of the position of the fact set and the ground `Statement` instances.
+    """
+    grounder, sequences = _batch_grounder
+
+    return index, grounder.ground_facts(sequences, facts).statements
 
 
 class Grounder:
-    def __init__(self: Self, prog: Program) -> None:
+    """Grounder for (safe) programs.
+
+    Attributes:
+        min_parallel_size: Integer representing the minimum size of a component
+            (number of statements plus number of relevant input literals) to be
+            instantiated in a worker process. Smaller components are instantiated in
+            the main process, since they are cheaper than the inter-process
+            communication.
+        min_partition_size: Integer representing the minimum number of candidates
+            of a body literal to partition the instantiation of a statement by
+            (see `partition_statement`).
+    """
+
+    min_parallel_size: int = 1000
+    min_partition_size: int = 10000
+
+    def __init__(
+        self: Self,
+        prog: Program,
+        backend: str = "python",
+        workers: Optional[int] = None,
+        cache: Optional[Union[str, GroundingCache]] = None,
+    ) -> None:
+        """Initializes the grounder instance.
+
+        Args:
+            prog: Safe `Program` instance to be grounded.
+            backend: String representing the join backend used to instantiate
+                statements. Either "python" (tuple-at-a-time) or "numpy" (vectorized
+                joins, requires NumPy). Defaults to "python".
+            workers: Optional positive integer representing the number of worker
+                processes used to instantiate independent components in parallel.
+                Defaults to `None` (serial instantiation).
+            cache: Optional `GroundingCache` instance or string representing the path
+                of a cache directory, in which the results of `ground` are stored
+                persistently. Defaults to `None` (no caching).
+
+        Raises:
+            ValueError: Unsafe program, unknown backend or invalid number of workers.
+            ImportError: Backend dependencies are not installed.
+        """
         if not prog.safe:
             raise ValueError("Grounding requires program to be safe.")
+        if backend not in JOIN_BACKENDS:
+            raise ValueError(f"Unknown join backend for {type(self)}: {backend}")
+        if workers is not None and workers < 1:
+            raise ValueError(f"Invalid number of workers for {type(self)}: {workers}")
+        if not JOIN_BACKENDS[backend].available():
+            raise ImportError(
+                f"Join backend '{backend}' for {type(self)} is not available."
+            )
 
         self.prog = prog
         self.certain_literals = set()
+        # cache for join orders of statements
+        self.plans = dict()
+        # cache for aggregate and choice rewritings of components
+        self.rewritings = dict()
+        self.backend = backend
+        self.plan_type = JOIN_BACKENDS[backend]
+        self.workers = workers
+        # process pool shared by all parallel tasks of an instantiation (see 'ground')
+        self.executor = None
+        self.cache = GroundingCache(cache) if isinstance(cache, str) else cache
+        # instantiation sequence of the last full instantiation (see 'ground')
+        self.components = None
+        # certain and possible instances of the last instantiation (see 'ground')
+        self.certain_instances = None
+        self.possible_instances = None
+        # facts added since the last instantiation (see 'add_facts')
+        self.new_facts = []
 
     @classmethod
     def select(
@@ -77,6 +334,7 @@ class Grounder:
         certain: Optional[Set["Literal"]] = None,
         possible: Optional[Set["Literal"]] = None,
         subst: Optional["Substitution"] = None,
+        exclude: Optional[Set["Literal"]] = None,
     ) -> Set["Substitution"]:
         # initialize optional arguments
         if subst is None:
@@ -85,6 +343,8 @@ class Grounder:
             certain = set()
         if possible is None:
             possible = set()
+        if exclude is None:
+            exclude = set()
 
         # apply (partial) substitution
         literal = literal.substitute(subst)
@@ -95,12 +355,25 @@ class Grounder:
                 matches = set()
 
                 if literal.ground:
-                    if literal in possible:
+                    if literal in possible and literal not in exclude:
                         matches.add(subst)
                 else:
+                    # only consider literals that can possibly unify with the literal
+                    # (i.e., same predicate signature and bound arguments)
+                    candidates = (
+                        possible.candidates(literal)
+                        if isinstance(possible, LiteralStore)
+                        else possible
+                    )
+
                     # compute possible match substitutions
-                    for target in possible:
-                        match = literal.substitute(subst).match(target)
+                    for target in candidates:
+                        # skip excluded literals (e.g., new literals during semi-naive
+                        # evaluation)
+                        if target in exclude:
+                            continue
+
+                        match = literal.match(target)
 
                         if match is not None:
                             matches.add(subst.compose(match))
@@ -110,9 +383,7 @@ class Grounder:
             elif literal.ground:
                 # literal does not contradict set of certain (positive) literals
                 # (used as a check)
-                return (
-                    {subst} if Naf(deepcopy(literal), False) not in certain else set()
-                )
+                return {subst} if Naf(literal, False) not in certain else set()
         # ground built-in literal
         elif isinstance(literal, BuiltinLiteral) and literal.ground:
             # relation holds (used as a check)
@@ -131,15 +402,291 @@ class Grounder:
         prev_possible: Optional[Set["Literal"]] = None,
         subst: Optional["Substitution"] = None,
         duplicate: bool = False,
+        delta: Optional[Set["Literal"]] = None,
+        plans: Optional[Dict[Tuple, "JoinPlan"]] = None,
+        plan_type: Type[JoinPlan] = JoinPlan,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> Set["Statement"]:
-        """Algorithm 1 from TODO."""
+        """Algorithm 1 from TODO.
+
+        The statement is compiled into a `JoinPlan` (processing the body literals in a
+        cost-based order) once per call, or looked up in `plans` (if specified).
+
+        If `duplicate` is set, only instances with at least one positive body literal
+        that is not part of `prev_possible` are computed (semi-naive evaluation).
+        To this end, the statement is instantiated once for each positive body literal,
+        matching it against the new literals only (`delta`), while all preceding
+        positive body literals are restricted to the literals in `prev_possible`.
+        Every new instance is therefore computed exactly once.
+
+        Args:
+            statement: `Statement` instance to be instantiated.
+            literals: Optional `LiteralCollection` of body literals to be processed.
+                Defaults to the body of the statement.
+            certain: Optional set of certain `Literal` instances.
+            possible: Optional set of possible `Literal` instances.
+            prev_possible: Optional subset of `possible` (from the previous iteration).
+            subst: Optional (partial) `Substitution` instance.
+            duplicate: Boolean indicating whether or not to skip all instances
+                whose positive body literals are all part of `prev_possible`.
+            delta: Optional set of `Literal` instances representing the difference
+                between `possible` and `prev_possible`. Computed from `possible` and
+                `prev_possible` if not specified.
+            plans: Optional dictionary used to cache compiled join plans across calls.
+            plan_type: `JoinPlan` subclass used to compile statements (join backend).
+                Defaults to `JoinPlan`.
+            workers: Optional integer representing the number of worker processes
+                the instantiation may be partitioned across (see
+                `partition_statement`). Ignored if `duplicate` is set.
+                Defaults to `None` (serial instantiation).
+            executor: Optional `Executor` instance to submit partitions to (see
+                `partition_statement`).
+
+        Returns:
+            Set of ground `Statement` instances.
+        """
+        if workers is not None and workers > 1 and not duplicate:
+            instances = cls.partition_statement(
+                statement,
+                literals,
+                certain,
+                possible,
+                subst,
+                workers,
+                plans,
+                plan_type,
+                executor,
+            )
+
+            if instances is not None:
+                return instances
+
+        return set(
+            cls.iter_statement(
+                statement,
+                literals,
+                certain,
+                possible,
+                prev_possible,
+                subst,
+                duplicate,
+                delta,
+                plans,
+                plan_type,
+            )
+        )
+
+    @classmethod
+    def compile_plan(
+        cls: Type["Grounder"],
+        statement: "Statement",
+        literals: "LiteralCollection",
+        possible: Iterable["Literal"],
+        bound: FrozenSet["Variable"],
+        first: Optional["Literal"] = None,
+        plans: Optional[Dict[Tuple, "JoinPlan"]] = None,
+        plan_type: Type[JoinPlan] = JoinPlan,
+    ) -> JoinPlan:
+        """Compiles a join plan for a statement or looks it up in a cache.
+
+        Cached plans are re-compiled once the extension of any positive body literal
+        has grown or shrunk by about a factor of two (or became non-empty), since the
+        join order depends on the cardinalities at the time of compilation.
+
+        Args:
+            statement: `Statement` instance to be instantiated.
+            literals: `LiteralCollection` of body literals to be processed.
+            possible: Iterable over possible `Literal` instances.
+            bound: Set of `Variable` instances bound initially.
+            first: Optional positive literal to be processed first.
+            plans: Optional dictionary used to cache compiled join plans across calls.
+            plan_type: `JoinPlan` subclass used to compile statements (join backend).
+                Defaults to `JoinPlan`.
+
+        Returns:
+            `JoinPlan` instance.
+        """
+        if plans is None:
+            return plan_type.compile(statement, literals, possible, bound, first)
+
+        # order of magnitude of the extension of each positive literal
+        if isinstance(possible, LiteralStore):
+            sizes = tuple(
+                possible.count(literal.pred()).bit_length()
+                for literal in literals
+                if is_positive(literal)
+            )
+        else:
+            sizes = tuple()
+
+        key = (plan_type, statement, literals, bound, first, sizes)
+
+        if key not in plans:
+            plans[key] = plan_type.compile(statement, literals, possible, bound, first)
+
+        return plans[key]
+
+    @classmethod
+    def select_driver(
+        cls: Type["Grounder"], plan: JoinPlan, possible: Iterable["Literal"]
+    ) -> Optional[Tuple["Literal", List["PredLiteral"]]]:
+        """Selects the body literal to partition the instantiation of a statement by.
+
+        The driver is the first positive literal in join order with at least
+        `min_partition_size` candidates. Positive literals are ordered by increasing
+        selectivity, so the preceding ones (which are re-evaluated for every
+        partition) are cheap, while splitting the candidates of the driver splits the
+        remaining join into independent parts of similar size.
+
+        Args:
+            plan: `JoinPlan` instance.
+            possible: Iterable over possible `Literal` instances.
+
+        Returns:
+            Tuple of the driver literal and its candidate `PredLiteral` instances, or
+            `None` if no literal has enough candidates for partitioning to pay off.
+        """
+        for step in plan.steps:
+            if not isinstance(step, MatchStep):
+                continue
+
+            if isinstance(possible, LiteralStore):
+                candidates = list(possible.candidates(step.literal))
+            else:
+                candidates = _select_literals(possible, {step.pred})
+
+            if len(candidates) >= cls.min_partition_size:
+                return step.literal, candidates
+
+        return None
+
+    @classmethod
+    def partition_statement(
+        cls: Type["Grounder"],
+        statement: "Statement",
+        literals: Optional["LiteralCollection"] = None,
+        certain: Optional[Set["Literal"]] = None,
+        possible: Optional[Set["Literal"]] = None,
+        subst: Optional["Substitution"] = None,
+        workers: int = 2,
+        plans: Optional[Dict[Tuple, "JoinPlan"]] = None,
+        plan_type: Type[JoinPlan] = JoinPlan,
+        executor: Optional[Executor] = None,
+    ) -> Optional[Set["Statement"]]:
+        """Instantiates a statement in parallel by hash-partitioning a body literal.
+
+        The candidates of the driver literal (see `select_driver`) are split into
+        `workers` partitions by their hash values. Each partition is instantiated in
+        a separate worker process (matching the driver literal against the partition
+        only) and the partial sets of instances are combined afterwards. Every match
+        of the driver literal falls into exactly one partition, so the result equals
+        the one of `ground_statement`.
+
+        See `ground_statement` for a description of the remaining arguments.
+
+        Args:
+            executor: Optional `Executor` instance (e.g., a process pool) to submit
+                the partitions to. Defaults to `None` (a process pool with `workers`
+                processes shared across calls).
+
+        Returns:
+            Set of ground `Statement` instances, or `None` if the statement cannot be
+            partitioned or partitioning does not pay off.
+        """
+        if statement.contains_aggregates or not statement.safe:
+            return None
+
+        # initialize optional arguments
+        if subst is None:
+            subst = Substitution()
+        if certain is None:
+            certain = set()
+        if possible is None:
+            possible = set()
+        if literals is None:
+            literals = statement.body
+
+        bound = frozenset(var for var, target in subst.items() if target.ground)
+        plan = cls.compile_plan(
+            statement, literals, possible, bound, None, plans, plan_type
+        )
+        driver = cls.select_driver(plan, possible)
+
+        if driver is None:
+            return None
+
+        driver, candidates = driver
+
+        # hash partitions of the candidates of the driver literal
+        partitions = [[] for _ in range(workers)]
+
+        for literal in candidates:
+            partitions[hash(literal) % workers].append(literal)
+
+        # only ship literals of predicates that occur in the body
+        certain = _select_literals(
+            certain,
+            {occ.pred() for literal in literals for occ in literal.neg_occ()},
+        )
+        possible = _select_literals(
+            possible,
+            {occ.pred() for literal in literals for occ in literal.pos_occ()},
+        )
+
+        # use specified executor or shared process pool (without shutting it down)
+        if executor is None:
+            executor = _process_pool(workers)
+
+        futures = [
+            executor.submit(
+                _ground_partition_task,
+                plan_type,
+                statement,
+                plan.order,
+                bound,
+                certain,
+                possible,
+                subst,
+                driver,
+                partition,
+            )
+            for partition in partitions
+            if partition
+        ]
+
+        return set().union(*(future.result() for future in futures))
+
+    @classmethod
+    def iter_statement(
+        cls: Type["Grounder"],
+        statement: "Statement",
+        literals: Optional["LiteralCollection"] = None,
+        certain: Optional[Set["Literal"]] = None,
+        possible: Optional[Set["Literal"]] = None,
+        prev_possible: Optional[Set["Literal"]] = None,
+        subst: Optional["Substitution"] = None,
+        duplicate: bool = False,
+        delta: Optional[Set["Literal"]] = None,
+        plans: Optional[Dict[Tuple, "JoinPlan"]] = None,
+        plan_type: Type[JoinPlan] = JoinPlan,
+    ) -> Iterator["Statement"]:
+        """Lazily instantiates a statement.
+
+        Ground instances are produced one at a time (without materializing any
+        intermediate results) and may contain duplicates, which are to be removed by
+        the consumer. See `ground_statement` for a description of the arguments.
+
+        Returns:
+            Iterator over ground `Statement` instances.
+        """
         if statement.contains_aggregates:
             raise ValueError(
-                f"{cls.ground_statement} requires statement to be free of aggregates."
+                f"{cls.iter_statement} requires statement to be free of aggregates."
             )
         if not statement.safe:
             raise ValueError(
-                f"{cls.ground_statement} can only instantiate safe statements."
+                f"{cls.iter_statement} can only instantiate safe statements."
             )
 
         # initialize optional arguments
@@ -155,57 +702,206 @@ class Grounder:
             # get body literals
             literals = statement.body
 
-        # while literals to be processed
-        if literals:
-            # select positive predicate or ground literal
-            literal = cls.select(literals, subst)
-
-            # compute matches for selected literal and ground remaining literals
-            return set().union(
-                *tuple(
-                    cls.ground_statement(
-                        statement,
-                        literals.without(literal),
-                        certain,
-                        possible,
-                        prev_possible,
-                        match,
-                        duplicate,
-                    )
-                    for match in cls.matches(literal, certain, possible, subst)
-                )
+        # variables bound by the initial substitution
+        bound = frozenset(var for var, target in subst.items() if target.ground)
+
+        def get_plan(first: Optional["Literal"] = None) -> JoinPlan:
+            return cls.compile_plan(
+                statement, literals, possible, bound, first, plans, plan_type
             )
-        else:
-            # check replaced arithmetic terms
-            for var, target in subst.items():
-                if isinstance(var, ArithVariable):
-                    # if arithmetic term is not valid -> no valid instantiation
-                    if not Equal(target, var.orig_term.substitute(subst)).eval():
-                        return set()
 
-            # instantiate final (ground) statement
-            ground_statement = statement.substitute(subst)
+        if not duplicate:
+            return get_plan().instances(certain, possible, subst)
+
+        if delta is None:
+            delta = LiteralStore(
+                (literal for literal in possible if literal not in prev_possible),
+                atoms=getattr(possible, "atoms", None),
+            )
+
+        # nothing new to be derived
+        if not delta:
+            return iter(())
+
+        # positive body literals (at least one has to be matched with a new literal)
+        pos_literals = tuple(literal for literal in literals if literal.pos_occ())
+
+        def instances() -> Iterator["Statement"]:
+            for i, literal in enumerate(pos_literals):
+                # i-th positive literal is matched against new literals only,
+                # preceding ones against old literals only (avoids duplicate instances)
+                sources = {literal: (delta, None)}
+                sources.update({other: (possible, delta) for other in pos_literals[:i]})
+
+                # process new literal first (typically the most selective one)
+                yield from get_plan(literal).instances(
+                    certain, possible, subst, sources
+                )
+
+        return instances()
+
+    def _ground_new(
+        self: Self,
+        prog: Program,
+        certain: Set["Literal"],
+        possible: Set["Literal"],
+        duplicate: bool,
+        delta: Set["Literal"],
+        known: Set["Statement"],
+    ) -> Set["Statement"]:
+        """Instantiates all statements of a program and collects new instances.
+
+        Instances are streamed from `iter_statement` (or computed by
+        `partition_statement` if multiple workers are used) and deduplicated here
+        (once).
 
-            if not duplicate or not ground_statement.body.pos_occ() <= prev_possible:
-                return {ground_statement}
+        Args:
+            prog: `Program` instance.
+            certain: Set of certain `Literal` instances.
+            possible: Set of possible `Literal` instances.
+            duplicate: Boolean indicating whether or not to use semi-naive evaluation.
+            delta: Set of `Literal` instances newly added to `possible`.
+            known: Set of previously computed `Statement` instances to be skipped.
 
-        # duplicate instantiation
-        return set()
+        Returns:
+            Set of new ground `Statement` instances.
+        """
+        new = set()
+
+        for statement in prog.statements:
+            instances = None
+
+            if self.workers is not None and self.workers > 1 and not duplicate:
+                # large statements are partitioned across worker processes
+                instances = self.partition_statement(
+                    statement,
+                    statement.body,
+                    certain,
+                    possible,
+                    Substitution(),
+                    self.workers,
+                    self.plans,
+                    self.plan_type,
+                    self.executor,
+                )
+
+            if instances is None:
+                instances = self.iter_statement(
+                    statement,
+                    statement.body,
+                    certain,
+                    possible,
+                    None,
+                    Substitution(),
+                    duplicate,
+                    delta,
+                    self.plans,
+                    self.plan_type,
+                )
+
+            new.update(instance for instance in instances if instance not in known)
+
+        return new
+
+    def rewrite(self: Self, component: Program) -> Tuple[
+        Program,
+        Program,
+        Program,
+        Dict[int, Tuple["AggrPlaceholder", "AggrBaseRule", List["AggrElemRule"]]],
+        Program,
+        Program,
+        Dict[int, Tuple["ChoicePlaceholder", "ChoiceBaseRule", List["ChoiceElemRule"]]],
+    ]:
+        """Rewrites the aggregate and choice expressions of a component.
+
+        Rewritings are cached for the statements of each component, since the same
+        (refined) components are instantiated multiple times (e.g., for certain and
+        possible literals or different sets of facts). Aggregate and choice
+        expressions are numbered throughout a component and are therefore not
+        rewritten statement by statement.
+
+        Args:
+            component: `Program` instance representing the component.
+
+        Returns:
+            Tuple consisting of the rewritten program with aggregate and choice
+            expressions replaced by placeholder literals, the aggregate epsilon and eta
+            programs, the aggregate map, the choice epsilon and eta programs and the
+            choice map (see `Program.rewrite_aggregates` and `Program.rewrite_choices`).
+        """  # noqa
+        rewriting = self.rewritings.get(component.statements)
+
+        if rewriting is None:
+            (
+                prog_alpha,
+                prog_aggr_eps,
+                prog_aggr_eta,
+                aggr_map,
+            ) = component.rewrite_aggregates()
+            (
+                prog_alpha,
+                prog_choice_eps,
+                prog_choice_eta,
+                choice_map,
+            ) = prog_alpha.rewrite_choices()
+            # TODO: rewrite choice expressions!
+
+            rewriting = self.rewritings[component.statements] = (
+                prog_alpha,
+                prog_aggr_eps,
+                prog_aggr_eta,
+                aggr_map,
+                prog_choice_eps,
+                prog_choice_eta,
+                choice_map,
+            )
+
+        return rewriting
 
     def ground_component(
         self: Self,
         component: Program,
         literals_I: Optional[Set["Literal"]] = None,
         literals_J: Optional[Set["Literal"]] = None,
+        delta: Optional[Set["Literal"]] = None,
     ) -> Set["Statement"]:
+        """Instantiates a component until a fixpoint is reached.
+
+        Uses semi-naive evaluation: after the first iteration, statements are only
+        instantiated w.r.t. literals that were newly derived in the previous iteration.
+
+        Args:
+            component: `Program` instance representing the component.
+            literals_I: Optional set of `Literal` instances (`I` in the paper).
+            literals_J: Optional set of `Literal` instances (`J` in the paper).
+                Not modified (derived literals are kept in a separate layer).
+            delta: Optional subset of `literals_J` that was added since a previous
+                instantiation of the component. If specified, the first iteration is
+                semi-naive as well, i.e., only instances depending on these literals
+                are computed. Requires the component to be free of aggregates and
+                choice rules.
+
+        Returns:
+            Set of ground `Statement` instances.
+
+        Raises:
+            ValueError: Incremental instantiation of aggregates or choice rules.
+        """
         if not component.statements:
             return set()
 
         # initialize optional arguments
         if literals_I is None:
-            literals_I = set()
+            literals_I = LiteralStore()
+        elif not isinstance(literals_I, LiteralStore):
+            literals_I = LiteralStore(literals_I)
         if literals_J is None:
-            literals_J = set()
+            literals_J = LiteralStore()
+        elif not isinstance(literals_J, LiteralStore):
+            literals_J = LiteralStore(literals_J)
+
+        # derived literals are added on top of 'J' (without copying or modifying it)
+        literals_J = LiteralStore(bases=(literals_J,))
 
         # initialize sets of instances/literals
         alpha_instances = set()
@@ -216,13 +912,17 @@ class Grounder:
 
         # NOTE: as implemented by 'mu-gringo', different from original algorithm.
         # Use of J,J' during grounding of epsilon/eta rules yields incorrect groundings.
-        literals_K = literals_I.union(literals_J)
-        prev_literals_K = set()
+        # NOTE: 'K' and 'J_ext' reflect all changes to 'J'
+        literals_K = LiteralStore(bases=(literals_I, literals_J))
+        # possible literals for remaining rules (including placeholder literals)
+        literals_J_ext = LiteralStore(bases=(literals_J,))
+
+        # literals newly derived during the previous iteration
+        delta_K = LiteralStore(atoms=literals_K.atoms)
+        delta_J_ext = LiteralStore(atoms=literals_J_ext.atoms)
 
         literals_J_alpha = set()
-        prev_literals_J_alpha = set()
         literals_J_chi = set()
-        prev_literals_J = set()
 
         # initialize flag
         duplicate = False
@@ -232,121 +932,107 @@ class Grounder:
             prog_aggr_eps,
             prog_aggr_eta,
             aggr_map,
-        ) = component.rewrite_aggregates()
-        (
-            prog_alpha,
             prog_choice_eps,
             prog_choice_eta,
             choice_map,
-        ) = prog_alpha.rewrite_choices()
-        # TODO: rewrite choice expressions!
+        ) = self.rewrite(component)
 
         # initialize propagator
         aggr_propagator = AggrPropagator(aggr_map)
         choice_propagator = ChoicePropagator(choice_map)
 
+        if delta is not None:
+            # NOTE: instances of aggregates and choice rules depend on all literals
+            # (not only on the new ones) and would have to be replaced
+            if aggr_map or choice_map:
+                raise ValueError(
+                    "Incremental instantiation of aggregates or choice rules is not"
+                    " supported."
+                )
+
+            # continue semi-naive evaluation from the previous instantiation
+            duplicate = True
+            delta_K = LiteralStore(delta, atoms=literals_K.atoms)
+            delta_J_ext = LiteralStore(delta, atoms=literals_J_ext.atoms)
+
         converged = False
 
         while not converged:
             # ground aggregate epsilon rules
             # (encode the satisfiability of aggregates without any element instances)
-            aggr_eps_instances.update(
-                set().union(
-                    *tuple(
-                        self.ground_statement(
-                            rule,
-                            rule.body,
-                            literals_I,
-                            literals_K,
-                            prev_literals_K,
-                            Substitution(),
-                            duplicate,
-                        )
-                        for rule in prog_aggr_eps.statements
-                    )
-                )
+            new_aggr_eps_instances = self._ground_new(
+                prog_aggr_eps,
+                literals_I,
+                literals_K,
+                duplicate,
+                delta_K,
+                aggr_eps_instances,
             )
+
             # ground eta rules (encode the satisfiability of aggregate elements)
-            aggr_eta_instances.update(
-                set().union(
-                    *tuple(
-                        self.ground_statement(
-                            rule,
-                            rule.body,
-                            literals_I,
-                            literals_K,
-                            prev_literals_K,
-                            Substitution(),
-                            duplicate,
-                        )
-                        for rule in prog_aggr_eta.statements
-                    )
-                )
+            new_aggr_eta_instances = self._ground_new(
+                prog_aggr_eta,
+                literals_I,
+                literals_K,
+                duplicate,
+                delta_K,
+                aggr_eta_instances,
             )
 
-            # propagate aggregates
+            aggr_eps_instances.update(new_aggr_eps_instances)
+            aggr_eta_instances.update(new_aggr_eta_instances)
+
+            # propagate aggregates (only new instances need to be registered)
             literals_J_alpha = aggr_propagator.propagate(
-                aggr_eps_instances,
-                aggr_eta_instances,
+                new_aggr_eps_instances,
+                new_aggr_eta_instances,
                 literals_I,
                 literals_J,
                 literals_J_alpha,
             )
 
+            # register newly satisfiable aggregate placeholders
+            for literal in literals_J_alpha:
+                if literals_J_ext.add(literal):
+                    delta_J_ext.add(literal)
+
             # ground remaining rules (including non-aggregate rules)
-            alpha_instances.update(
-                set().union(
-                    *tuple(
-                        self.ground_statement(
-                            rule,
-                            rule.body,
-                            literals_I,
-                            literals_J.union(literals_J_alpha),
-                            prev_literals_J.union(prev_literals_J_alpha),
-                            Substitution(),
-                            duplicate,
-                        )
-                        for rule in prog_alpha.statements
-                    )
-                )
+            new_alpha_instances = self._ground_new(
+                prog_alpha,
+                literals_I,
+                literals_J_ext,
+                duplicate,
+                delta_J_ext,
+                alpha_instances,
             )
-            choice_eps_instances.update(
-                set().union(
-                    *tuple(
-                        self.ground_statement(
-                            rule,
-                            rule.body,
-                            literals_I,
-                            literals_J.union(literals_J_alpha),
-                            prev_literals_J.union(prev_literals_J_alpha),
-                            Substitution(),
-                            duplicate,
-                        )
-                        for rule in prog_choice_eps.statements
-                    )
-                )
+
+            # ground choice epsilon/eta rules
+            new_choice_eps_instances = self._ground_new(
+                prog_choice_eps,
+                literals_I,
+                literals_J_ext,
+                duplicate,
+                delta_J_ext,
+                choice_eps_instances,
             )
-            choice_eta_instances.update(
-                set().union(
-                    *tuple(
-                        self.ground_statement(
-                            rule,
-                            rule.body,
-                            literals_I,
-                            literals_J.union(literals_J_alpha),
-                            prev_literals_J.union(prev_literals_J_alpha),
-                            Substitution(),
-                            duplicate,
-                        )
-                        for rule in prog_choice_eta.statements
-                    )
-                )
+
+            new_choice_eta_instances = self._ground_new(
+                prog_choice_eta,
+                literals_I,
+                literals_J_ext,
+                duplicate,
+                delta_J_ext,
+                choice_eta_instances,
             )
 
-            # propagate choice expressions
+            alpha_instances.update(new_alpha_instances)
+            choice_eps_instances.update(new_choice_eps_instances)
+            choice_eta_instances.update(new_choice_eta_instances)
+
+            # propagate choice expressions (only new instances need to be registered)
             literals_J_chi = choice_propagator.propagate(
-                choice_eps_instances,
-                choice_eta_instances,
+                new_choice_eps_instances,
+                new_choice_eta_instances,
                 literals_I,
                 literals_J,
                 literals_J_chi,
@@ -354,21 +1040,22 @@ class Grounder:
 
             # update state
             duplicate = True
-            prev_literals_J_alpha = literals_J_alpha.copy()
-            prev_literals_J = literals_J.copy()
-            prev_literals_K = literals_K.copy()
+            delta_K = LiteralStore(atoms=literals_K.atoms)
+            delta_J_ext = LiteralStore(atoms=literals_J_ext.atoms)
 
-            # NOTE: 'pos_occ' applicable (all head literals are pos. predicate literals)
-            head_literals = set().union(
-                *tuple(rule.head.pos_occ() for rule in alpha_instances)
-            )
+            converged = True
 
-            literals_J.update(head_literals)
-            literals_K.update(head_literals)
+            # NOTE: 'pos_occ' applicable (all head literals are pos. predicate literals)
+            for rule in new_alpha_instances:
+                for literal in rule.head.pos_occ():
+                    # keep track of new literals for the next iteration
+                    if literals_J.add(literal):
+                        converged = False
 
-            # enough to check lengths instead of elements (much cheaper)
-            if len(literals_J) == len(prev_literals_J):
-                converged = True
+                        if literal not in literals_I:
+                            delta_K.add(literal)
+                        # aggregate placeholders (only in 'J_ext') never occur in heads
+                        delta_J_ext.add(literal)
 
         # assemble aggregates (if present)
         assembled_instances = aggr_propagator.assemble(alpha_instances)
@@ -379,82 +1066,293 @@ class Grounder:
         # return re-assembled rules
         return assembled_instances
 
-    def ground(self: Self) -> Program:
-        # compute component graph for rules/facts only
-        component_graph = ComponentGraph(self.prog.statements)  # rules/facts only???
+    @staticmethod
+    def _register(
+        store: LiteralStore,
+        delta: Optional[LiteralStore],
+        literals: Iterable["PredLiteral"],
+    ) -> None:
+        """Adds literals to a store and keeps track of the new ones (if specified).
 
-        # compute component instantiation sequence
-        inst_sequence = component_graph.sequence()
+        Args:
+            store: `LiteralStore` instance. Updated in-place.
+            delta: Optional `LiteralStore` instance the literals that were not yet part
+                of `store` are added to. Updated in-place.
+            literals: Iterable over `PredLiteral` instances.
+        """
+        if delta is None:
+            store.update(literals)
+            return
 
-        # initialize sets of certain and possible statement instantiations
+        for literal in literals:
+            if store.add(literal):
+                delta.add(literal)
+
+    def ground_sequence(
+        self: Self,
+        sequence: List[Tuple["Statement", ...]],
+        certain_literals: LiteralStore,
+        possible_literals: LiteralStore,
+        certain_delta: Optional[LiteralStore] = None,
+        possible_delta: Optional[LiteralStore] = None,
+    ) -> Tuple[Set["Statement"], Set["Statement"]]:
+        """Instantiates the refined components of a component in sequence.
+
+        Args:
+            sequence: List of tuples of `Statement` instances representing the refined
+                instantiation sequence of a component (see `Component.sequence`).
+            certain_literals: `LiteralStore` of certain literals. Updated in-place.
+            possible_literals: `LiteralStore` of possible literals. Updated in-place.
+            certain_delta: Optional `LiteralStore` of the certain literals added since
+                a previous instantiation of the component. If specified, only new
+                instances are computed (see `ground_component`). Updated in-place.
+            possible_delta: Optional `LiteralStore` of the possible literals added
+                since a previous instantiation of the component (see
+                `certain_delta`). Updated in-place.
+
+        Returns:
+            Tuple of the sets of certain and possible ground `Statement` instances.
+        """
         certain_inst = set()
         possible_inst = set()
 
-        # initialize sets of certain and possible literal instantiations
-        # (follow from head literals of statement instantiations)
-        certain_literals = set()
-        possible_literals = set()
+        # predicate signatures of the consequents of each statement
+        head_preds = {
+            statement: tuple(literal.pred() for literal in statement.consequents())
+            for ref_component in sequence
+            for statement in ref_component
+        }
 
-        for component in inst_sequence:
-            # compute counter of occurring head predicates
-            # (used to indicate which predicates have been fully processed)
-            pred_counter = defaultdict(int)
+        # compute counter of occurring head predicates
+        # (used to indicate which predicates have been fully processed)
+        pred_counter = defaultdict(int)
 
-            for statement in component.nodes:
-                for literal in statement.consequents():
-                    # increment counter for literal predicate signature
-                    pred_counter[literal.pred()] += 1
+        for preds in head_preds.values():
+            for pred in preds:
+                # increment counter for literal predicate signature
+                pred_counter[pred] += 1
 
-            ref_component_seq = component.sequence()
+        # predicates which are still open (have not been fully processed yet)
+        open_preds = {pred for (pred, count) in pred_counter.items() if count > 0}
 
-            for ref_component in ref_component_seq:
-                # wrap refined component in 'Program' object
-                ref_component_prog = Program(tuple(ref_component))
+        for ref_component in sequence:
+            # wrap refined component in 'Program' object
+            ref_component_prog = Program(tuple(ref_component))
 
-                # predicates which are still open (have not been fully processed yet)
-                open_preds = {var for (var, count) in pred_counter.items() if count > 0}
+            instances = self.ground_component(
+                ref_component_prog.reduct(open_preds),
+                possible_literals,
+                certain_literals,
+                certain_delta,
+            )
 
-                # can be pre-computed (used for both set updates)
-                # TODO: make more efficient by updating incrementally?
-                possible_literals = set().union(
-                    *tuple(inst.consequents() for inst in possible_inst)
+            # check if any constraint was derived
+            # (resulting in an unsatisfiable program)
+            if any(isinstance(inst, Constraint) for inst in instances):
+                warnings.warn(
+                    "Derived certain constraint instance. Program is unsatisfiable"
                 )
 
-                instances = self.ground_component(
-                    ref_component_prog.reduct(open_preds),
-                    possible_literals,
-                    certain_literals,
+            # update certain instances & literals (only for new instances)
+            instances.difference_update(certain_inst)
+            certain_inst.update(instances)
+            self._register(
+                certain_literals,
+                certain_delta,
+                chain.from_iterable(
+                    inst.consequents() for inst in instances if inst.deterministic
+                ),
+            )
+
+            instances = self.ground_component(
+                ref_component_prog, certain_literals, possible_literals, possible_delta
+            )
+
+            # update possible instances & literals (only for new instances)
+            instances.difference_update(possible_inst)
+            possible_inst.update(instances)
+            self._register(
+                possible_literals,
+                possible_delta,
+                chain.from_iterable(inst.consequents() for inst in instances),
+            )
+
+            for statement in ref_component:
+                for pred in head_preds[statement]:
+                    # decrement counter for literal predicate signature
+                    pred_counter[pred] -= 1
+
+                    # predicate has been fully processed
+                    if not pred_counter[pred]:
+                        open_preds.discard(pred)
+
+        return certain_inst, possible_inst
+
+    def _ground_parallel(
+        self: Self,
+        component_graph: ComponentGraph,
+        certain_literals: LiteralStore,
+        possible_literals: LiteralStore,
+    ) -> Iterator[Tuple[Set["Statement"], Set["Statement"]]]:
+        """Instantiates the components of a component graph on the process pool.
+
+        Requires the process pool of the grounder (`executor`) to be set (see `ground`).
+
+        Components are instantiated in rounds: each round consists of all components
+        whose dependencies have been instantiated in previous rounds. Independent
+        components never depend on the literals derived by each other, so they can be
+        instantiated at the same time. Results are merged in the order of
+        `ComponentGraph.sequence` (i.e., deterministically).
+
+        Args:
+            component_graph: `ComponentGraph` instance.
+            certain_literals: `LiteralStore` of certain literals. Updated in-place.
+            possible_literals: `LiteralStore` of possible literals. Updated in-place.
+
+        Returns:
+            Iterator over tuples of the sets of certain and possible ground `Statement`
+            instances for each component.
+        """
+        # position of each component in the (serial) instantiation sequence
+        order = {component: i for i, component in enumerate(component_graph.sequence())}
+
+        # number of components each component depends on & dependent components
+        n_dependencies = {component: 0 for component in order}
+        dependents = defaultdict(list)
+
+        for src, dst in component_graph.edges:
+            n_dependencies[src] += 1
+            dependents[dst].append(src)
+
+        ready = [component for component in order if not n_dependencies[component]]
+
+        def inputs(component: "Component") -> Set[Tuple[str, int]]:
+            # predicates the component depends on
+            return {
+                literal.pred()
+                for statement in component.nodes
+                for literal in chain(
+                    statement.antecedents().pos_occ(),
+                    statement.antecedents().neg_occ(),
                 )
+            }
 
-                # check if any constraint was derived
-                # (resulting in an unsatisfiable program)
-                if any(isinstance(inst, Constraint) for inst in instances):
-                    warnings.warn(
-                        "Derived certain constraint instance. Program is unsatisfiable"
-                    )
-                # update certain instances
-                certain_inst.update(instances)
-
-                # compute & update possible instances
-                # TODO: make more efficient by updating incrementally?
-                certain_literals = set().union(
-                    *tuple(
-                        inst.consequents()
-                        for inst in certain_inst
-                        if inst.deterministic
+        executor = self.executor
+
+        while ready:
+            ready.sort(key=order.get)
+            futures = dict()
+
+            # only worthwhile for large components if there are others to run
+            for component in ready if len(ready) > 1 else ():
+                preds = inputs(component)
+
+                # NOTE: literal counts are upper bounds for layered stores
+                if (
+                    len(component.nodes)
+                    + sum(
+                        certain_literals.count(pred) + possible_literals.count(pred)
+                        for pred in preds
                     )
+                    < self.min_parallel_size
+                ):
+                    continue
+
+                # ship the relevant literals only (for components sent to the pool)
+                futures[component] = executor.submit(
+                    _ground_sequence_task,
+                    self.backend,
+                    component.sequence(),
+                    _select_literals(certain_literals, preds),
+                    _select_literals(possible_literals, preds),
                 )
 
-                possible_inst.update(
-                    self.ground_component(
-                        ref_component_prog, certain_literals, possible_literals
+            # instantiate small components in the main process meanwhile
+            results = {
+                component: self.ground_sequence(
+                    component.sequence(), certain_literals, possible_literals
+                )
+                for component in ready
+                if component not in futures
+            }
+
+            next_ready = []
+
+            for component in ready:
+                if component in futures:
+                    certain, possible = futures[component].result()
+
+                    # register derived literals
+                    certain_literals.update(
+                        chain.from_iterable(
+                            inst.consequents() for inst in certain if inst.deterministic
+                        )
+                    )
+                    possible_literals.update(
+                        chain.from_iterable(inst.consequents() for inst in possible)
                     )
+                else:
+                    certain, possible = results[component]
+
+                yield certain, possible
+
+                for dependent in dependents[component]:
+                    n_dependencies[dependent] -= 1
+
+                    if not n_dependencies[dependent]:
+                        next_ready.append(dependent)
+
+            ready = next_ready
+
+    def ground(self: Self) -> Program:
+        self.new_facts = []
+
+        if self.cache is not None:
+            key = self.cache.key(self.prog)
+            entry = self.cache.load(key)
+
+            if entry is not None:
+                # component graph is only computed when needed (see 'ground_delta')
+                self.components = None
+                return self._restore(*entry)
+
+        # compute component graph for rules/facts only
+        component_graph = ComponentGraph(self.prog.statements)  # rules/facts only???
+
+        self.components = component_graph.sequence()
+
+        # initialize sets of certain and possible statement instantiations
+        certain_inst = set()
+        possible_inst = set()
+
+        # initialize sets of certain and possible literal instantiations
+        # (follow from head literals of statement instantiations)
+        atoms = AtomTable()
+        certain_literals = LiteralStore(atoms=atoms)
+        possible_literals = LiteralStore(atoms=atoms)
+
+        if self.workers is None or self.workers == 1:
+            # compute component instantiation sequence
+            for component in self.components:
+                certain, possible = self.ground_sequence(
+                    component.sequence(), certain_literals, possible_literals
                 )
+                certain_inst.update(certain)
+                possible_inst.update(possible)
+        else:
+            # single process pool for independent components and partitioned
+            # statements (components instantiated in the main process included)
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                self.executor = executor
 
-                for statement in ref_component:
-                    for literal in statement.consequents():
-                        # increment counter for literal predicate signature
-                        pred_counter[literal.pred()] -= 1
+                try:
+                    for certain, possible in self._ground_parallel(
+                        component_graph, certain_literals, possible_literals
+                    ):
+                        certain_inst.update(certain)
+                        possible_inst.update(possible)
+                finally:
+                    self.executor = None
 
         # keep track of possible and certain atoms & rules
         self.certain_literals = certain_literals
@@ -462,5 +1360,303 @@ class Grounder:
         self.certain_instances = certain_inst
         self.possible_instances = possible_inst
 
+        if self.cache is not None:
+            self.cache.store(key, (tuple(certain_inst), tuple(possible_inst)))
+
         # return possible instances (includes certain instances)
         return Program(tuple(possible_inst))
+
+    def _restore(
+        self: Self,
+        certain_inst: Tuple["Statement", ...],
+        possible_inst: Tuple["Statement", ...],
+    ) -> Program:
+        """Restores the state of a previous instantiation (e.g., from a cache).
+
+        Args:
+            certain_inst: Tuple of certain ground `Statement` instances.
+            possible_inst: Tuple of possible ground `Statement` instances.
+
+        Returns:
+            `Program` instance representing the ground program.
+        """
+        # certain and possible literals follow from the head literals of the instances
+        atoms = AtomTable()
+        self.certain_literals = LiteralStore(
+            chain.from_iterable(
+                inst.consequents() for inst in certain_inst if inst.deterministic
+            ),
+            atoms=atoms,
+        )
+        self.possible_literals = LiteralStore(
+            chain.from_iterable(inst.consequents() for inst in possible_inst),
+            atoms=atoms,
+        )
+        self.certain_instances = set(certain_inst)
+        self.possible_instances = set(possible_inst)
+
+        return Program(possible_inst)
+
+    @classmethod
+    def as_facts(
+        cls: Type["Grounder"], facts: Iterable[Union["PredLiteral", NormalRule]]
+    ) -> Tuple[NormalRule, ...]:
+        """Converts ground predicate literals to facts.
+
+        Args:
+            facts: Iterable over ground `PredLiteral` or `NormalRule` instances
+                representing facts.
+
+        Returns:
+            Tuple of `NormalRule` instances.
+
+        Raises:
+            ValueError: Invalid fact.
+        """
+        statements = []
+
+        for fact in facts:
+            if isinstance(fact, PredLiteral) and not fact.naf:
+                fact = NormalRule(fact)
+            if not (isinstance(fact, NormalRule) and fact.is_fact and fact.ground):
+                raise ValueError(f"Invalid fact for {cls}: {str(fact)}")
+
+            statements.append(fact)
+
+        return tuple(statements)
+
+    def sequences(self: Self) -> List[List[Tuple["Statement", ...]]]:
+        """Computes the instantiation sequence of the program.
+
+        Returns:
+            List of refined instantiation sequences (see `Component.sequence`), one for
+            each component in the order of `ComponentGraph.sequence`.
+        """
+        return [
+            component.sequence()
+            for component in ComponentGraph(self.prog.statements).sequence()
+        ]
+
+    def ground_facts(
+        self: Self,
+        sequences: List[List[Tuple["Statement", ...]]],
+        facts: Tuple[NormalRule, ...],
+    ) -> Program:
+        """Instantiates the program together with additional facts.
+
+        Facts do not depend on any other statements and are instantiated before all
+        other components. Instead of re-computing the instantiation sequence of the
+        program for each set of facts, they are registered as certain (and possible)
+        literals up front.
+
+        Args:
+            sequences: Instantiation sequence of the program (see `sequences`).
+            facts: Tuple of ground `NormalRule` instances representing facts (see
+                `as_facts`).
+
+        Returns:
+            `Program` instance representing the ground program (including the facts).
+        """
+        # facts are certain (and instantiated already)
+        certain_inst = set(facts)
+        possible_inst = set(facts)
+
+        atoms = AtomTable()
+        certain_literals = LiteralStore((fact.atom for fact in facts), atoms=atoms)
+        possible_literals = LiteralStore((fact.atom for fact in facts), atoms=atoms)
+
+        for sequence in sequences:
+            certain, possible = self.ground_sequence(
+                sequence, certain_literals, possible_literals
+            )
+            certain_inst.update(certain)
+            possible_inst.update(possible)
+
+        return Program(tuple(possible_inst))
+
+    @classmethod
+    def ground_many(
+        cls: Type["Grounder"],
+        rules: Program,
+        fact_sets: Iterable[Iterable[Union["PredLiteral", NormalRule]]],
+        backend: str = "python",
+        workers: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Program]]:
+        """Instantiates the same rules for many sets of facts.
+
+        The rules are analyzed once (component graph and instantiation sequence) and
+        share a single cache of join plans (see `compile_plan`) for all sets of facts.
+        If multiple workers are specified, the sets of facts are instantiated on a
+        process pool, where each worker process analyzes the rules once as well.
+
+        Args:
+            rules: Safe `Program` instance shared by all sets of facts.
+            fact_sets: Iterable over iterables of ground `PredLiteral` or `NormalRule`
+                instances representing the facts of each program.
+            backend: String representing the join backend (see `__init__`).
+                Defaults to "python".
+            workers: Optional positive integer representing the number of worker
+                processes. Defaults to `None` (serial instantiation).
+
+        Returns:
+            Iterator over pairs of the position of a set of facts in `fact_sets` and
+            the `Program` instance representing the corresponding ground program.
+            Serial instantiation yields the results in order, parallel instantiation
+            as soon as they are completed.
+
+        Raises:
+            ValueError: Unsafe program, unknown backend, invalid number of workers or
+                invalid fact.
+            ImportError: Backend dependencies are not installed.
+        """
+        grounder = cls(rules, backend, workers)
+
+        if workers is None or workers == 1:
+            sequences = grounder.sequences()
+
+            for i, facts in enumerate(fact_sets):
+                yield i, grounder.ground_facts(sequences, cls.as_facts(facts))
+
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(rules, backend),
+        ) as executor:
+            futures = [
+                executor.submit(_ground_batch_task, i, cls.as_facts(facts))
+                for i, facts in enumerate(fact_sets)
+            ]
+
+            for future in as_completed(futures):
+                i, statements = future.result()
+
+                yield i, Program(statements)
+
+    def add_facts(self: Self, *facts: Union["PredLiteral", NormalRule]) -> None:
+        """Adds ground facts to the program.
+
+        The facts are instantiated incrementally by the next call to `ground_delta`
+        (or from scratch by `ground`).
+
+        Args:
+            *facts: Sequence of ground `PredLiteral` or `NormalRule` instances
+                representing facts.
+
+        Raises:
+            ValueError: Invalid fact.
+        """
+        statements = self.as_facts(facts)
+
+        self.prog = Program(self.prog.statements + statements, self.prog.query)
+        self.new_facts.extend(statements)
+
+    def ground_delta(self: Self) -> Program:
+        """Instantiates the facts added since the last instantiation.
+
+        Continues the semi-naive evaluation of the previous instantiation with the new
+        facts: components are only re-visited if they depend on new literals, and only
+        instances with at least one new positive body literal are computed. Previous
+        instances are kept as they are (certain literals only prune instances that
+        cannot be applied anyway).
+
+        Falls back to `ground` if the program has not been instantiated yet.
+
+        Returns:
+            `Program` instance consisting of the new ground statements only.
+
+        Raises:
+            ValueError: New facts affect aggregates, choice rules or default-negated
+                literals, whose previous instances (or simplifications) would become
+                invalid. The program needs to be instantiated from scratch using
+                `ground` instead.
+        """
+        if self.possible_instances is None:
+            return self.ground()
+        if self.components is None:
+            # instantiation was restored from the cache (see 'ground')
+            self.components = ComponentGraph(self.prog.statements).sequence()
+
+        facts = [fact for fact in self.new_facts if fact not in self.possible_instances]
+
+        # predicate signatures possibly affected by the new facts
+        affected = {fact.atom.pred() for fact in facts}
+
+        for component in self.components:
+            pos_preds = {
+                literal.pred()
+                for statement in component.nodes
+                for literal in statement.antecedents().pos_occ()
+            }
+            neg_preds = {
+                literal.pred()
+                for statement in component.nodes
+                for literal in statement.antecedents().neg_occ()
+            }
+
+            if affected.isdisjoint(pos_preds) and affected.isdisjoint(neg_preds):
+                continue
+
+            affected.update(
+                literal.pred()
+                for statement in component.nodes
+                for literal in statement.consequents()
+            )
+
+            # NOTE: previous instances of aggregates and choice rules as well as
+            # previously certain literals (used to simplify default negation) may no
+            # longer be valid
+            if not affected.isdisjoint(neg_preds) or any(
+                statement.contains_aggregates or isinstance(statement, ChoiceRule)
+                for statement in component.nodes
+            ):
+                raise ValueError(
+                    f"{type(self)} cannot incrementally instantiate aggregates,"
+                    " choice rules or default negation depending on new facts."
+                )
+
+        self.new_facts = []
+
+        # facts are certain (and instantiated already)
+        new_instances = set(facts)
+        self.certain_instances.update(facts)
+        self.possible_instances.update(facts)
+
+        certain_delta = LiteralStore(atoms=self.certain_literals.atoms)
+        possible_delta = LiteralStore(atoms=self.possible_literals.atoms)
+
+        self._register(
+            self.certain_literals, certain_delta, (fact.atom for fact in facts)
+        )
+        self._register(
+            self.possible_literals, possible_delta, (fact.atom for fact in facts)
+        )
+
+        for component in self.components:
+            # skip components not depending on any new literals
+            if not any(
+                certain_delta.count(literal.pred())
+                or possible_delta.count(literal.pred())
+                for statement in component.nodes
+                for literal in chain(
+                    statement.antecedents().pos_occ(),
+                    statement.antecedents().neg_occ(),
+                )
+            ):
+                continue
+
+            certain, possible = self.ground_sequence(
+                component.sequence(),
+                self.certain_literals,
+                self.possible_literals,
+                certain_delta,
+                possible_delta,
+            )
+
+            self.certain_instances.update(certain)
+            possible.difference_update(self.possible_instances)
+            self.possible_instances.update(possible)
+            new_instances.update(possible)
+
+        return Program(tuple(new_instances))
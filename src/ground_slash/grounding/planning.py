@@ -0,0 +1,662 @@
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+from ground_slash.program.literals import (
+    AggrLiteral,
+    BuiltinLiteral,
+    Equal,
+    Naf,
+    PredLiteral,
+)
+from ground_slash.program.substitution import Substitution
+from ground_slash.program.terms import ArithTerm, ArithVariable, Functional, Variable
+
+from .store import LiteralStore, indexable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ground_slash.program.literals import Literal
+    from ground_slash.program.statements import Statement
+    from ground_slash.program.terms import Term
+
+
+def arith_vars(term: "Term") -> Set["Variable"]:
+    """Returns the variables occurring inside arithmetic terms.
+
+    Args:
+        term: `Term` instance.
+
+    Returns:
+        (Possibly empty) set of `Variable` instances.
+    """
+    if isinstance(term, ArithTerm):
+        return term.vars()
+    if isinstance(term, Functional):
+        return set().union(*tuple(arith_vars(arg) for arg in term.terms))
+
+    return set()
+
+
+def is_positive(literal: "Literal") -> bool:
+    """Checks whether or not a literal is a positive predicate literal.
+
+    Args:
+        literal: `Literal` instance.
+
+    Returns:
+        Boolean indicating whether or not the literal can be matched against literals.
+    """
+    return isinstance(literal, PredLiteral) and not literal.naf
+
+
+def required_vars(literal: "Literal") -> Set["Variable"]:
+    """Returns the variables that need to be bound before processing a literal.
+
+    Positive predicate literals can bind their variables by matching, except for the
+    variables inside arithmetic terms (which cannot be matched directly). All other
+    literals are used as checks and need to be ground.
+
+    Args:
+        literal: `Literal` instance.
+
+    Returns:
+        Set of `Variable` instances.
+    """
+    if is_positive(literal):
+        return set().union(*tuple(arith_vars(term) for term in literal.terms))
+
+    return literal.vars()
+
+
+def estimate(
+    literal: "PredLiteral", possible: Iterable["Literal"], bound: Set["Variable"]
+) -> float:
+    """Estimates the number of matches of a positive predicate literal.
+
+    Uses the cardinality of the predicate and assumes independence between the bound
+    argument positions. Bound ground terms use the exact number of literals with the
+    term at the position, bound variables the number of distinct terms at the position.
+
+    Args:
+        literal: Positive `PredLiteral` instance.
+        possible: Iterable over `Literal` instances to be matched against. Statistics
+            are only available for `LiteralStore` instances.
+        bound: Set of `Variable` instances that are bound at this point.
+
+    Returns:
+        Non-negative float.
+    """
+    if not isinstance(possible, LiteralStore):
+        # no statistics available
+        return 1.0
+
+    pred = literal.pred()
+    n = possible.count(pred)
+
+    if not n:
+        return 0.0
+
+    estimate = float(n)
+
+    for pos, term in enumerate(literal.terms):
+        if indexable(term):
+            estimate *= possible.count(pred, pos, term) / n
+        elif term.vars() and term.vars() <= bound:
+            estimate /= max(possible.distinct(pred, pos), 1)
+
+    return estimate
+
+
+def join_order(
+    literals: Iterable["Literal"],
+    possible: Optional[Iterable["Literal"]] = None,
+    bound: Optional[Set["Variable"]] = None,
+    first: Optional["Literal"] = None,
+) -> Tuple["Literal", ...]:
+    """Computes the order in which to process body literals during instantiation.
+
+    Checks (i.e., built-in literals, negative literals and fully bound positive
+    literals) are scheduled as soon as all of their variables are bound. Among the
+    remaining positive predicate literals, the one with the smallest estimated number
+    of matches is selected greedily (ties are broken by the original order).
+
+    Args:
+        literals: Iterable over `Literal` instances.
+        possible: Optional iterable over `Literal` instances to be matched against
+            (used for cardinality statistics).
+        bound: Optional set of `Variable` instances that are bound initially.
+        first: Optional positive literal to be processed first (if possible).
+
+    Returns:
+        Tuple of `Literal` instances.
+
+    Raises:
+        ValueError: Literals cannot be ordered (e.g., aggregate literals or unbound
+            variables in checks).
+    """
+    if possible is None:
+        possible = set()
+
+    remaining = list(literals)
+    bound = set() if bound is None else set(bound)
+    order = []
+
+    if any(isinstance(literal, AggrLiteral) for literal in remaining):
+        raise ValueError(
+            "Aggregate literals should be replaced before computing a join order."
+        )
+
+    if first is not None and required_vars(first) <= bound:
+        order.append(first)
+        remaining.remove(first)
+        bound.update(first.vars())
+
+    while remaining:
+        # schedule checks as early as possible
+        checks = [literal for literal in remaining if literal.vars() <= bound]
+
+        if checks:
+            order += checks
+            remaining = [literal for literal in remaining if literal not in checks]
+            continue
+
+        # positive literals that can be matched
+        candidates = [
+            literal
+            for literal in remaining
+            if is_positive(literal) and required_vars(literal) <= bound
+        ]
+
+        if not candidates:
+            raise ValueError(
+                f"Literals {tuple(str(literal) for literal in remaining)} cannot be ordered for instantiation."  # noqa
+            )
+
+        # select cheapest literal ('min' returns first literal on ties)
+        literal = min(
+            candidates, key=lambda literal: estimate(literal, possible, bound)
+        )
+
+        order.append(literal)
+        remaining.remove(literal)
+        bound.update(literal.vars())
+
+    return tuple(order)
+
+
+class MatchStep:
+    """Step of a join plan matching a positive predicate literal.
+
+    Variable bindings are stored in a binding frame, i.e., a list holding the term
+    bound to each variable of the plan at a fixed slot index (see `JoinPlan`).
+
+    For literals whose terms are all (indexable) ground terms or variables, matching
+    is compiled into positional comparisons: ground terms and variables bound by
+    previous steps are used as index keys and compared directly, while unbound
+    variables are assigned the terms of the target literal. Other literals (e.g.,
+    containing functional terms with variables) are substituted and matched
+    generically.
+
+    Attributes:
+        literal: `PredLiteral` instance to be matched.
+        pred: Tuple of a string and an integer representing the predicate signature.
+        simple: Boolean indicating whether or not the compiled matching is used.
+        consts: Tuple of pairs of argument positions and ground terms.
+        lookups: Tuple of pairs of argument positions and slots of bound variables.
+        binds: Tuple of pairs of argument positions and slots of variables bound by
+            the step.
+        equals: Tuple of pairs of argument positions that need to hold equal terms
+            (repeated occurrences of variables bound by the step).
+        bound_slots: Tuple of pairs of variables of the literal bound before the step
+            and their slots.
+        new_slots: Tuple of pairs of variables of the literal bound by the step and
+            their slots.
+    """
+
+    def __init__(
+        self: Self,
+        literal: "PredLiteral",
+        bound: Set["Variable"],
+        slots: Dict["Variable", int],
+    ) -> None:
+        """Initializes the match step instance.
+
+        Args:
+            literal: Positive `PredLiteral` instance.
+            bound: Set of `Variable` instances bound before the step.
+            slots: Dictionary mapping `Variable` instances to their slots.
+        """
+        self.literal = literal
+        self.pred = literal.pred()
+        self.simple = True
+
+        consts = []
+        lookups = []
+        binds = dict()
+        equals = []
+
+        for pos, term in enumerate(literal.terms):
+            if indexable(term):
+                consts.append((pos, term))
+            elif isinstance(term, Variable):
+                if term in bound:
+                    lookups.append((pos, slots[term]))
+                elif term in binds:
+                    equals.append((binds[term], pos))
+                else:
+                    binds[term] = pos
+            else:
+                self.simple = False
+
+        self.consts = tuple(consts)
+        self.lookups = tuple(lookups)
+        self.binds = tuple((pos, slots[var]) for var, pos in binds.items())
+        self.equals = tuple(equals)
+
+        self.bound_slots = tuple(
+            (var, slots[var]) for var in literal.vars() if var in bound
+        )
+        self.new_slots = tuple(
+            (var, slots[var]) for var in literal.vars() if var not in bound
+        )
+
+    def subst(self: Self, frame: List[Optional["Term"]]) -> Substitution:
+        """Returns the bindings of the literal variables bound before the step.
+
+        Args:
+            frame: List of `Term` instances representing the binding frame.
+
+        Returns:
+            `Substitution` instance.
+        """
+        return Substitution({var: frame[slot] for var, slot in self.bound_slots})
+
+    def bind(
+        self: Self,
+        frame: List[Optional["Term"]],
+        possible: Iterable["Literal"],
+        exclude: Optional[Set["Literal"]] = None,
+    ) -> Iterator[bool]:
+        """Matches the literal against a set of literals.
+
+        For each match, the variables bound by the step are written to the binding
+        frame (overwriting the bindings for the previous match).
+
+        Args:
+            frame: List of `Term` instances representing the binding frame.
+            possible: Iterable over `Literal` instances to be matched against.
+            exclude: Optional set of `Literal` instances to be skipped.
+
+        Returns:
+            Iterator yielding `True` for each match.
+        """
+        if not self.simple:
+            yield from self._bind(frame, possible, exclude)
+            return
+
+        keys = list(self.consts)
+
+        for pos, slot in self.lookups:
+            target = frame[slot]
+
+            # cannot be used as a key (e.g., arithmetic term)
+            if not indexable(target):
+                yield from self._bind(frame, possible, exclude)
+                return
+
+            keys.append((pos, target))
+
+        literal = self.literal
+
+        # ground literal
+        if not self.binds:
+            ground_literal = literal.substitute(self.subst(frame))
+
+            if ground_literal in possible and (
+                exclude is None or ground_literal not in exclude
+            ):
+                yield True
+            return
+
+        if isinstance(possible, LiteralStore):
+            candidates = possible.lookup(self.pred, keys)
+        else:
+            candidates = possible
+
+        literal_type = type(literal)
+
+        for target in candidates:
+            if exclude is not None and target in exclude:
+                continue
+            if not (
+                isinstance(target, literal_type)
+                and target.pred() == self.pred
+                and target.neg == literal.neg
+            ):
+                continue
+
+            terms = target.terms.terms
+
+            if any(terms[pos] != term for pos, term in keys):
+                continue
+            if any(terms[pos_1] != terms[pos_2] for pos_1, pos_2 in self.equals):
+                continue
+
+            for pos, slot in self.binds:
+                frame[slot] = terms[pos]
+
+            yield True
+
+    def _bind(
+        self: Self,
+        frame: List[Optional["Term"]],
+        possible: Iterable["Literal"],
+        exclude: Optional[Set["Literal"]] = None,
+    ) -> Iterator[bool]:
+        """Matches the substituted literal generically (see `Grounder.matches`)."""
+        literal = self.literal.substitute(self.subst(frame))
+
+        if literal.ground:
+            if literal in possible and (exclude is None or literal not in exclude):
+                yield True
+            return
+
+        if isinstance(possible, LiteralStore):
+            candidates = possible.candidates(literal)
+        else:
+            candidates = possible
+
+        for target in candidates:
+            if exclude is not None and target in exclude:
+                continue
+
+            match = literal.match(target)
+
+            if match is not None:
+                for var, slot in self.new_slots:
+                    frame[slot] = match[var]
+
+                yield True
+
+
+class CheckStep:
+    """Step of a join plan checking a ground built-in or default-negated literal.
+
+    Attributes:
+        literal: `BuiltinLiteral` or default-negated `PredLiteral` instance.
+        var_slots: Tuple of pairs of variables of the literal and their slots.
+    """
+
+    def __init__(self: Self, literal: "Literal", slots: Dict["Variable", int]) -> None:
+        """Initializes the check step instance.
+
+        Args:
+            literal: `BuiltinLiteral` or default-negated `PredLiteral` instance.
+            slots: Dictionary mapping `Variable` instances to their slots.
+        """
+        self.literal = literal
+        self.var_slots = tuple((var, slots[var]) for var in literal.vars())
+
+    def check(
+        self: Self, frame: List[Optional["Term"]], certain: Set["Literal"]
+    ) -> bool:
+        """Checks the literal under the current bindings.
+
+        Args:
+            frame: List of `Term` instances representing the binding frame.
+                Needs to bind all variables of the literal.
+            certain: Set of certain `Literal` instances.
+
+        Returns:
+            Boolean indicating whether or not the check holds.
+        """
+        literal = self.literal.substitute(
+            Substitution({var: frame[slot] for var, slot in self.var_slots})
+        )
+
+        if not literal.ground:
+            raise ValueError(f"Check {str(literal)} requires a ground literal.")
+
+        # built-in literal (relation holds)
+        if isinstance(literal, BuiltinLiteral):
+            return literal.eval()
+
+        # negative literal (does not contradict set of certain literals)
+        return Naf(literal, False) not in certain
+
+
+class JoinPlan:
+    """Compiled instantiation procedure for a statement.
+
+    Holds a fixed order of the body literals (see `join_order`) and specialized match
+    and check steps for each of them, which can be run repeatedly against different
+    sets of literals.
+
+    Each variable is assigned a fixed slot in a binding frame (a list of terms).
+    Steps bind variables by writing to their slots, which are only read by subsequent
+    steps. Backtracking therefore requires no undoing of bindings and no intermediate
+    substitutions are created. Bindings are converted to `Substitution` instances for
+    complete matches only.
+
+    Attributes:
+        statement: `Statement` instance to be instantiated.
+        order: Tuple of `Literal` instances in order of processing.
+        steps: Tuple of `MatchStep` and `CheckStep` instances.
+        variables: Tuple of `Variable` instances (one for each slot).
+        slots: Dictionary mapping `Variable` instances to their slots.
+        arith_vars: Tuple of `ArithVariable` instances bound by the plan.
+    """
+
+    def __init__(
+        self: Self,
+        statement: "Statement",
+        order: Tuple["Literal", ...],
+        bound: Optional[Set["Variable"]] = None,
+    ) -> None:
+        """Initializes the join plan instance.
+
+        Args:
+            statement: `Statement` instance to be instantiated.
+            order: Tuple of `Literal` instances in order of processing.
+            bound: Optional set of `Variable` instances that are bound initially.
+        """
+        self.statement = statement
+        self.order = order
+
+        bound = set() if bound is None else set(bound)
+
+        # assign slots to variables (in order of binding)
+        self.slots = dict()
+
+        for var in chain(bound, *(literal.vars() for literal in order)):
+            self.slots.setdefault(var, len(self.slots))
+
+        self.variables = tuple(self.slots)
+
+        steps = []
+
+        for literal in order:
+            if is_positive(literal):
+                steps.append(MatchStep(literal, bound, self.slots))
+            else:
+                steps.append(CheckStep(literal, self.slots))
+
+            bound.update(literal.vars())
+
+        self.steps = tuple(steps)
+        self.arith_vars = tuple(var for var in bound if isinstance(var, ArithVariable))
+
+    @classmethod
+    def available(cls: "type[Self]") -> bool:
+        """Checks whether or not the plan type can be used (e.g., dependencies).
+
+        Returns:
+            Boolean indicating whether or not plans of this type can be compiled.
+        """
+        return True
+
+    @classmethod
+    def compile(
+        cls: Type["JoinPlan"],
+        statement: "Statement",
+        literals: Optional[Iterable["Literal"]] = None,
+        possible: Optional[Iterable["Literal"]] = None,
+        bound: Optional[Set["Variable"]] = None,
+        first: Optional["Literal"] = None,
+    ) -> "JoinPlan":
+        """Compiles a join plan for a statement.
+
+        Args:
+            statement: `Statement` instance to be instantiated.
+            literals: Optional iterable over `Literal` instances to be processed.
+                Defaults to the body of the statement.
+            possible: Optional iterable over `Literal` instances to be matched against
+                (used for cardinality statistics).
+            bound: Optional set of `Variable` instances that are bound initially.
+            first: Optional positive literal to be processed first (if possible).
+
+        Returns:
+            `JoinPlan` instance.
+        """
+        if literals is None:
+            literals = statement.body
+
+        return cls(statement, join_order(literals, possible, bound, first), bound)
+
+    def solve(
+        self: Self,
+        certain: Set["Literal"],
+        possible: Iterable["Literal"],
+        subst: Optional[Substitution] = None,
+        sources: Optional[
+            Dict["Literal", Tuple[Iterable["Literal"], Optional[Set["Literal"]]]]
+        ] = None,
+    ) -> Iterator[Substitution]:
+        """Computes all substitutions satisfying the body literals of the plan.
+
+        Args:
+            certain: Set of certain `Literal` instances.
+            possible: Iterable over possible `Literal` instances.
+            subst: Optional initial `Substitution` instance.
+            sources: Optional dictionary mapping body literals to pairs of iterables
+                over literals to be matched against and literals to be excluded.
+                Body literals not in the dictionary are matched against `possible`.
+
+        Returns:
+            Iterator over `Substitution` instances.
+        """
+        if subst is None:
+            subst = Substitution()
+        if sources is None:
+            sources = dict()
+
+        # resolve sources once for all steps
+        targets = tuple(
+            (
+                sources.get(step.literal, (possible, None))
+                if isinstance(step, MatchStep)
+                else (certain, None)
+            )
+            for step in self.steps
+        )
+        steps = self.steps
+        n_steps = len(steps)
+
+        # initialize binding frame
+        frame = [None] * len(self.variables)
+
+        for var, target in subst.items():
+            if var in self.slots:
+                frame[self.slots[var]] = target
+
+        # stack of iterators advancing the bindings for the first 'i' steps
+        # (iterative depth-first search; no intermediate results are materialized)
+        stack = [iter((True,))]
+
+        while stack:
+            if not next(stack[-1], False):
+                # backtrack
+                stack.pop()
+                continue
+
+            i = len(stack) - 1
+
+            if i < n_steps:
+                step = steps[i]
+
+                if isinstance(step, CheckStep):
+                    stack.append(iter((step.check(frame, certain),)))
+                else:
+                    stack.append(step.bind(frame, *targets[i]))
+                continue
+
+            # convert bindings into substitution
+            match = Substitution(subst)
+            match.update(zip(self.variables, frame))
+
+            if self.check_arith(match):
+                yield match
+
+    def check_arith(self: Self, subst: Substitution) -> bool:
+        """Checks the values of the arithmetic variables of the plan.
+
+        Args:
+            subst: `Substitution` instance binding all variables of the plan.
+
+        Returns:
+            Boolean indicating whether or not each arithmetic variable is bound to the
+            value of the arithmetic term it replaces.
+        """
+        return all(
+            Equal(subst[var], var.orig_term.substitute(subst)).eval()
+            for var in self.arith_vars
+        )
+
+    def instances(
+        self: Self,
+        certain: Set["Literal"],
+        possible: Iterable["Literal"],
+        subst: Optional[Substitution] = None,
+        sources: Optional[
+            Dict["Literal", Tuple[Iterable["Literal"], Optional[Set["Literal"]]]]
+        ] = None,
+    ) -> Iterator["Statement"]:
+        """Lazily instantiates the statement (see `solve` for a description of arguments).
+
+        Note: the same instance may be produced multiple times.
+
+        Returns:
+            Iterator over ground `Statement` instances.
+        """  # noqa
+        for subst in self.solve(certain, possible, subst, sources):
+            yield self.statement.substitute(subst)
+
+    def run(
+        self: Self,
+        certain: Set["Literal"],
+        possible: Iterable["Literal"],
+        subst: Optional[Substitution] = None,
+        sources: Optional[
+            Dict["Literal", Tuple[Iterable["Literal"], Optional[Set["Literal"]]]]
+        ] = None,
+    ) -> Set["Statement"]:
+        """Instantiates the statement (see `solve` for a description of arguments).
+
+        Returns:
+            Set of ground `Statement` instances.
+        """
+        return set(self.instances(certain, possible, subst, sources))
@@ -81,8 +81,10 @@ class ChoicePropagator:
                 possible_chi_literals.add(ground_chi_literal)
                 continue
 
+            # get corresponding choice expression
+            choice, *_ = self.choice_map[ground_chi_literal.ref_id]
+
             # propagate choice to check satisfiability
-            # TODO: choice.propagate
             satisfiable = choice.propagate(
                 ground_guards, ground_elements, literals_I, literals_J
             )
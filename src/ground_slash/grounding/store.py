@@ -0,0 +1,392 @@
+from array import array
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+from ground_slash.program.literals import PredLiteral
+from ground_slash.program.terms import ArithTerm, Functional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ground_slash.program.terms import Term
+
+    from .atoms import AtomTable
+
+
+def indexable(term: "Term") -> bool:
+    """Checks whether or not a term can be used as a key for argument lookups.
+
+    Ground arithmetic terms are matched by value (i.e., after simplification) and can
+    therefore not be looked up by equality.
+
+    Args:
+        term: `Term` instance.
+
+    Returns:
+        Boolean indicating whether or not the term is ground and free of arithmetic terms.
+    """  # noqa
+    if isinstance(term, ArithTerm):
+        return False
+    if isinstance(term, Functional):
+        return all(indexable(arg) for arg in term.terms)
+
+    return term.ground
+
+
+class LiteralStore:
+    """Indexed set of ground predicate literals.
+
+    Literals are indexed by their predicate signature as well as by the ground terms
+    at each argument position, i.e., `(name, arity, position, term)`. This allows
+    retrieving only those literals that can possibly unify with a (partially ground)
+    literal, instead of scanning the whole set.
+
+    A store may be layered on top of other stores (`bases`), which are then treated as
+    part of the store without being copied or modified. New literals are only added
+    to the top layer. Changes to the base stores are reflected in the store.
+
+    If an atom table is specified (see `AtomTable`), literals are additionally
+    registered in the table and their rows in the predicate extensions are kept per
+    predicate id. Stores sharing a table thus share the integer encoding of their
+    literals (see `encoded`).
+
+    Attributes:
+        literals: Set of all `PredLiteral` instances in the top layer of the store.
+        pred_index: Dictionary mapping predicate signatures to sets of literals.
+        arg_index: Dictionary mapping tuples of predicate name, arity, argument
+            position and term to sets of literals.
+        arg_counts: Dictionary mapping tuples of predicate name, arity and argument
+            position to the number of distinct terms at that position.
+        bases: Tuple of underlying `LiteralStore` instances.
+        atoms: Optional `AtomTable` instance the literals are registered in.
+        rows: Dictionary mapping predicate ids of `atoms` to `array('q')` instances
+            holding the rows of the literals in the top layer of the store.
+        unencoded: Set of predicate signatures with literals in the top layer that
+            cannot be registered in `atoms` (e.g., special literals).
+    """
+
+    def __init__(
+        self: Self,
+        literals: Optional[Iterable["PredLiteral"]] = None,
+        bases: Optional[Iterable["LiteralStore"]] = None,
+        atoms: Optional["AtomTable"] = None,
+    ) -> None:
+        """Initializes the literal store instance.
+
+        Args:
+            literals: Optional iterable over ground `PredLiteral` instances.
+                Defaults to `None`.
+            bases: Optional iterable over `LiteralStore` instances to be layered
+                under the store. Defaults to `None`.
+            atoms: Optional `AtomTable` instance to register the literals in.
+                Defaults to the table of the first base store that has one.
+        """
+        self.literals = set()
+        self.pred_index = defaultdict(set)
+        self.arg_index = defaultdict(set)
+        self.arg_counts = defaultdict(int)
+        self.bases = tuple(bases) if bases is not None else tuple()
+
+        if atoms is None:
+            atoms = next(
+                (base.atoms for base in self.bases if base.atoms is not None), None
+            )
+
+        self.atoms = atoms
+        self.rows = dict()
+        self.unencoded = set()
+
+        if literals is not None:
+            self.update(literals)
+
+    def __len__(self: Self) -> int:
+        if not self.bases:
+            return len(self.literals)
+
+        # layers may overlap
+        return sum(1 for _ in self)
+
+    def __iter__(self: Self) -> Iterator["PredLiteral"]:
+        if not self.bases:
+            return iter(self.literals)
+
+        return self._chain(self.literals, self.bases)
+
+    def __contains__(self: Self, literal: "PredLiteral") -> bool:
+        return literal in self.literals or any(literal in base for base in self.bases)
+
+    def __le__(self: Self, other: Set["PredLiteral"]) -> bool:
+        return set(self) <= other
+
+    def __ge__(self: Self, other: Set["PredLiteral"]) -> bool:
+        return set(self) >= other
+
+    def _chain(
+        self: Self,
+        literals: Iterable["PredLiteral"],
+        base_literals: Iterable[Iterable["PredLiteral"]],
+    ) -> Iterator["PredLiteral"]:
+        """Iterates over literals of the top layer and all base stores.
+
+        Literals also contained in a previous layer are skipped.
+
+        Args:
+            literals: Iterable over `PredLiteral` instances of the top layer.
+            base_literals: Iterable over iterables over `PredLiteral` instances of the
+                base stores (in order).
+
+        Returns:
+            Iterator over `PredLiteral` instances.
+        """
+        yield from literals
+
+        for i, literals in enumerate(base_literals):
+            for literal in literals:
+                if literal in self.literals or any(
+                    literal in base for base in self.bases[:i]
+                ):
+                    continue
+
+                yield literal
+
+    def add(self: Self, literal: "PredLiteral") -> bool:
+        """Adds a literal to the store (if not already contained).
+
+        Args:
+            literal: Ground `PredLiteral` instance.
+
+        Returns:
+            Boolean indicating whether or not the literal was newly added.
+        """
+        if literal in self:
+            return False
+
+        self.literals.add(literal)
+
+        name, arity = literal.pred()
+        self.pred_index[(name, arity)].add(literal)
+
+        for pos, term in enumerate(literal.terms):
+            bucket = self.arg_index[(name, arity, pos, term)]
+
+            # first literal with this term at this position
+            if not bucket:
+                self.arg_counts[(name, arity, pos)] += 1
+
+            bucket.add(literal)
+
+        if self.atoms is not None:
+            if type(literal) is PredLiteral:
+                try:
+                    atom_id = self.atoms.add(literal)
+                except ValueError:
+                    # non-encodable terms (e.g., arithmetic terms)
+                    self.unencoded.add((name, arity))
+                    return True
+
+                pred_id = self.atoms.atom_preds[atom_id]
+                rows = self.rows.get(pred_id)
+
+                if rows is None:
+                    rows = self.rows[pred_id] = array("q")
+
+                rows.append(self.atoms.atom_rows[atom_id])
+            else:
+                self.unencoded.add((name, arity))
+
+        return True
+
+    def update(self: Self, *literals: Iterable["PredLiteral"]) -> None:
+        """Adds all literals from the specified iterables to the store.
+
+        Args:
+            *literals: Iterables over ground `PredLiteral` instances.
+        """
+        for iterable in literals:
+            for literal in iterable:
+                self.add(literal)
+
+    def copy(self: Self) -> "LiteralStore":
+        """Returns a shallow copy of the store.
+
+        Returns:
+            `LiteralStore` instance.
+        """
+        store = LiteralStore(bases=self.bases, atoms=self.atoms)
+        store.literals = self.literals.copy()
+        store.pred_index = defaultdict(
+            set, {key: bucket.copy() for key, bucket in self.pred_index.items()}
+        )
+        store.arg_index = defaultdict(
+            set, {key: bucket.copy() for key, bucket in self.arg_index.items()}
+        )
+        store.arg_counts = self.arg_counts.copy()
+        store.rows = {pred_id: rows[:] for pred_id, rows in self.rows.items()}
+        store.unencoded = self.unencoded.copy()
+
+        return store
+
+    def union(self: Self, *others: Iterable["PredLiteral"]) -> "LiteralStore":
+        """Returns a new store containing the literals of this and all other iterables.
+
+        Args:
+            *others: Iterables over ground `PredLiteral` instances.
+
+        Returns:
+            `LiteralStore` instance.
+        """
+        store = self.copy()
+        store.update(*others)
+
+        return store
+
+    def count(
+        self: Self,
+        pred: Tuple[str, int],
+        pos: Optional[int] = None,
+        term: Optional["Term"] = None,
+    ) -> int:
+        """Returns the number of literals for a predicate signature.
+
+        Args:
+            pred: Tuple of a string and an integer representing a predicate signature.
+            pos: Optional integer representing an argument position.
+            term: Optional ground `Term` instance. If specified (together with `pos`),
+                only literals with the term at the specified position are counted.
+
+        Returns:
+            Non-negative integer.
+        """
+        if pos is None:
+            bucket = self.pred_index.get(pred)
+        else:
+            bucket = self.arg_index.get((*pred, pos, term))
+
+        count = len(bucket) if bucket is not None else 0
+
+        # NOTE: upper bound if layers overlap
+        return count + sum(base.count(pred, pos, term) for base in self.bases)
+
+    def distinct(self: Self, pred: Tuple[str, int], pos: int) -> int:
+        """Returns the number of distinct terms at an argument position of a predicate.
+
+        Args:
+            pred: Tuple of a string and an integer representing a predicate signature.
+            pos: Integer representing the argument position.
+
+        Returns:
+            Non-negative integer.
+        """
+        distinct = self.arg_counts.get((*pred, pos), 0)
+
+        # NOTE: lower bound if there are multiple layers
+        for base in self.bases:
+            distinct = max(distinct, base.distinct(pred, pos))
+
+        return distinct
+
+    def encoded(self: Self, atoms: "AtomTable", pred_id: int) -> Optional[List[array]]:
+        """Returns the rows of a predicate extension of an atom table in the store.
+
+        Args:
+            atoms: `AtomTable` instance.
+            pred_id: Integer representing the predicate id in `atoms`.
+
+        Returns:
+            List of `array('q')` instances holding the rows in the predicate extension
+            (one per non-empty layer; layers may overlap), or `None` if not all
+            literals of the predicate in the store are registered in `atoms`.
+        """
+        name, arity, _ = atoms.preds[pred_id]
+
+        if self.atoms is atoms and (name, arity) not in self.unencoded:
+            rows = self.rows.get(pred_id)
+            layers = [rows] if rows else []
+        elif self.pred_index.get((name, arity)):
+            return None
+        else:
+            layers = []
+
+        for base in self.bases:
+            base_layers = base.encoded(atoms, pred_id)
+
+            if base_layers is None:
+                return None
+
+            layers.extend(base_layers)
+
+        return layers
+
+    def candidates(self: Self, literal: "PredLiteral") -> Iterable["PredLiteral"]:
+        """Returns the stored literals that may possibly match a given literal.
+
+        Uses the smallest index bucket among all argument positions bound to an
+        (indexable) ground term. Falls back to all literals with the same predicate
+        signature if no argument is bound.
+
+        Note: the returned set must not be modified.
+
+        Args:
+            literal: (Possibly non-ground) `PredLiteral` instance.
+
+        Returns:
+            Iterable over `PredLiteral` instances (superset of all matching literals).
+        """
+        return self.lookup(
+            literal.pred(),
+            tuple(
+                (pos, term) for pos, term in enumerate(literal.terms) if indexable(term)
+            ),
+        )
+
+    def lookup(
+        self: Self, pred: Tuple[str, int], keys: Iterable[Tuple[int, "Term"]]
+    ) -> Iterable["PredLiteral"]:
+        """Returns the stored literals with the specified terms at given positions.
+
+        Note: only the smallest index bucket is returned, which may also contain
+        literals with different terms at the other specified positions.
+        The returned set must not be modified. For layered stores, the buckets of all
+        layers are chained instead.
+
+        Args:
+            pred: Tuple of a string and an integer representing a predicate signature.
+            keys: Iterable over pairs of argument positions and indexable ground terms.
+
+        Returns:
+            Iterable over `PredLiteral` instances (superset of all matching literals).
+        """
+        if self.bases:
+            keys = tuple(keys)
+
+            return self._chain(
+                self._lookup(pred, keys),
+                (base.lookup(pred, keys) for base in self.bases),
+            )
+
+        return self._lookup(pred, keys)
+
+    def _lookup(
+        self: Self, pred: Tuple[str, int], keys: Iterable[Tuple[int, "Term"]]
+    ) -> Set["PredLiteral"]:
+        """Returns the smallest index bucket of the top layer (see `lookup`)."""
+        name, arity = pred
+
+        candidates = self.pred_index.get(pred)
+
+        if candidates is None:
+            return set()
+
+        for pos, term in keys:
+            bucket = self.arg_index.get((name, arity, pos, term))
+
+            # no literal has the required term at this position
+            if bucket is None:
+                return set()
+            if len(bucket) < len(candidates):
+                candidates = bucket
+
+        return candidates
@@ -0,0 +1,372 @@
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+from ground_slash.program.literals import (
+    AggrLiteral,
+    AggrMax,
+    AggrMin,
+    Greater,
+    GreaterEqual,
+    Less,
+    LessEqual,
+    PredLiteral,
+)
+from ground_slash.program.program import Program
+from ground_slash.program.statements import ChoiceRule, NormalRule
+from ground_slash.program.substitution import Renaming, Substitution
+from ground_slash.program.terms import Functional, SymbolicConstant, Variable
+
+from .grounder import Grounder
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ground_slash.program.literals import Literal
+    from ground_slash.program.statements import Statement
+    from ground_slash.program.terms import Term
+
+# built-in relations depending on the total order of terms
+ORDER_RELATIONS = (Less, Greater, LessEqual, GreaterEqual)
+# aggregate functions depending on the total order of terms
+ORDER_FUNCS = (AggrMin, AggrMax)
+
+
+class _ConstantCollector(Renaming):
+    """Renaming keeping track of all symbolic constants it is applied to.
+
+    Attributes:
+        constants: Set of `SymbolicConstant` instances encountered so far.
+    """
+
+    def __init__(self: Self, subst_dict: Optional[Dict["Term", "Term"]] = None) -> None:
+        super().__init__(subst_dict)
+        self.constants: Set[SymbolicConstant] = set()
+
+    def __getitem__(self: Self, term: "Term") -> "Term":
+        if isinstance(term, SymbolicConstant):
+            self.constants.add(term)
+
+        return super().__getitem__(term)
+
+
+def _depends_on_order(literals: Iterable["Literal"]) -> bool:
+    """Checks whether or not literals compare or aggregate terms by their order.
+
+    Args:
+        literals: Iterable over `Literal` instances.
+
+    Returns:
+        Boolean indicating whether or not any of the literals (or the literals of any
+        aggregate elements) depends on the total order of terms.
+    """
+    for literal in literals:
+        if isinstance(literal, ORDER_RELATIONS):
+            return True
+        if isinstance(literal, AggrLiteral) and (
+            isinstance(literal.func, ORDER_FUNCS)
+            or any(_depends_on_order(element.literals) for element in literal.elements)
+        ):
+            return True
+
+    return False
+
+
+def _statement_literals(statement: "Statement") -> Iterator["Literal"]:
+    """Returns the body literals and the literals of choice elements of a statement."""
+    yield from statement.body
+
+    if isinstance(statement, ChoiceRule):
+        for element in statement.head.elements:
+            yield from element.literals
+
+
+class Template:
+    """Ground program instantiated once and re-used for isomorphic sets of facts.
+
+    Programs that are grounded for many samples, which only differ in the constants
+    of their facts (e.g., image identifiers), are grounded once for the facts of a
+    template sample. The symbolic constants of the template facts that do not occur in
+    the program itself act as placeholders. The ground program of another sample is
+    obtained by renaming the placeholders to the constants of the sample, instead of
+    grounding it from scratch.
+
+    Renaming is only valid if it is a bijection between the template facts and the
+    sample facts that does not clash with any other constant (and preserves the
+    order of constants if the program compares or aggregates terms by their order).
+    Otherwise, the sample is grounded regularly (see `Grounder`).
+
+    Attributes:
+        prog: `Program` instance (without sample facts).
+        facts: Tuple of `NormalRule` instances representing the template facts.
+        backend: String representing the join backend (see `Grounder`).
+        placeholders: Dictionary mapping `SymbolicConstant` instances acting as
+            placeholders to the `Variable` instances replacing them.
+        constants: Set of `SymbolicConstant` instances occurring in the program or
+            in the ground program other than placeholders.
+        order: Optional tuple of the `SymbolicConstant` instances in `constants` and
+            of the placeholders in ascending order. `None` if the program does not
+            depend on the order of terms.
+        shared: Tuple of ground `Statement` instances without placeholders.
+        lifted: Tuple of `Statement` instances with placeholders replaced by
+            variables.
+    """
+
+    def __init__(
+        self: Self,
+        prog: Program,
+        facts: Iterable[Union[PredLiteral, NormalRule]],
+        backend: str = "python",
+    ) -> None:
+        """Initializes the template by grounding the program for the template facts.
+
+        Args:
+            prog: `Program` instance without the sample facts.
+            facts: Iterable over ground `PredLiteral` or `NormalRule` instances
+                representing the facts of the template sample.
+            backend: String representing the join backend (see `Grounder`).
+                Defaults to "python".
+
+        Raises:
+            ValueError: Invalid fact (or program, see `Grounder`).
+        """
+        self.prog = prog
+        self.facts = Grounder.as_facts(facts)
+        self.backend = backend
+
+        # symbolic constants used by the program itself
+        collector = _ConstantCollector()
+
+        for statement in prog.statements:
+            statement.substitute(collector)
+
+        reserved = set(collector.constants)
+
+        self.placeholders: Dict[SymbolicConstant, Variable] = dict()
+
+        for fact in self.facts:
+            fact_collector = _ConstantCollector()
+            fact.atom.substitute(fact_collector)
+
+            for const in sorted(fact_collector.constants, key=lambda c: c.val):
+                if const not in reserved and const not in self.placeholders:
+                    self.placeholders[const] = Variable(f"P{len(self.placeholders)}")
+
+        ground_prog = Grounder(Program(prog.statements + self.facts), backend).ground()
+
+        # replaces placeholders by variables (collecting all other constants)
+        collector = _ConstantCollector(self.placeholders)
+
+        shared = []
+        lifted = []
+
+        for statement in ground_prog.statements:
+            lifted_statement = statement.substitute(collector)
+
+            if lifted_statement.ground:
+                shared.append(statement)
+            else:
+                lifted.append(lifted_statement)
+
+        self.shared = tuple(shared)
+        self.lifted = tuple(lifted)
+
+        # constants placeholders may be compared to
+        self.constants = reserved.union(collector.constants).difference(
+            self.placeholders
+        )
+
+        # NOTE: symbolic constants are ordered lexicographically by their identifiers
+        if any(
+            _depends_on_order(_statement_literals(statement))
+            for statement in prog.statements
+        ):
+            self.order = tuple(
+                sorted(self.constants.union(self.placeholders), key=lambda c: c.val)
+            )
+        else:
+            self.order = None
+
+    def match(
+        self: Self, facts: Iterable[Union[PredLiteral, NormalRule]]
+    ) -> Optional[Dict[SymbolicConstant, SymbolicConstant]]:
+        """Computes a renaming of the placeholders mapping the template facts to facts.
+
+        Args:
+            facts: Iterable over ground `PredLiteral` or `NormalRule` instances
+                representing the facts of a sample.
+
+        Returns:
+            Dictionary mapping each placeholder to a `SymbolicConstant` instance, or
+            `None` if the facts are not isomorphic to the template facts (or no
+            valid renaming exists).
+
+        Raises:
+            ValueError: Invalid fact.
+        """
+        # NOTE: candidates are tried in the order of the sample facts
+        sample = list(dict.fromkeys(fact.atom for fact in Grounder.as_facts(facts)))
+        template = list(dict.fromkeys(fact.atom for fact in self.facts))
+
+        if len(sample) != len(template):
+            return None
+
+        # sample facts grouped by predicate
+        groups: Dict[Tuple[str, bool, int], List[PredLiteral]] = dict()
+
+        for atom in sample:
+            groups.setdefault((atom.name, atom.neg, atom.arity), []).append(atom)
+
+        mapping: Dict[SymbolicConstant, SymbolicConstant] = dict()
+        inverse: Dict[SymbolicConstant, SymbolicConstant] = dict()
+
+        # position of each constant and placeholder in the order of terms
+        rank = (
+            {const: i for i, const in enumerate(self.order)}
+            if self.order is not None
+            else None
+        )
+
+        def admissible(term: SymbolicConstant, target: SymbolicConstant) -> bool:
+            # renaming needs to be injective w.r.t. all other constants
+            if target in self.constants:
+                return False
+
+            # renaming needs to preserve the order of constants (if relevant)
+            if rank is not None:
+                i = rank[term]
+
+                return all(
+                    (rank[other] < i) == (other_target.val < target.val)
+                    for other, other_target in chain(
+                        ((const, const) for const in self.constants), mapping.items()
+                    )
+                )
+
+            return True
+
+        def match_term(
+            term: "Term", target: "Term", bound: List[SymbolicConstant]
+        ) -> bool:
+            if term in self.placeholders:
+                if not isinstance(target, SymbolicConstant):
+                    return False
+                if term in mapping or target in inverse:
+                    return mapping.get(term) == target and inverse.get(target) == term
+                if not admissible(term, target):
+                    return False
+
+                mapping[term] = target
+                inverse[target] = term
+                bound.append(term)
+
+                return True
+            if isinstance(term, Functional):
+                return (
+                    isinstance(target, Functional)
+                    and term.symbol == target.symbol
+                    and term.arity == target.arity
+                    and all(
+                        match_term(arg, target_arg, bound)
+                        for arg, target_arg in zip(term.terms, target.terms)
+                    )
+                )
+
+            return term == target
+
+        def unbind(bound: List[SymbolicConstant]) -> None:
+            for term in bound:
+                del inverse[mapping.pop(term)]
+
+        def candidates(atom: PredLiteral) -> Iterator[PredLiteral]:
+            return iter(groups.get((atom.name, atom.neg, atom.arity), ()))
+
+        used: Set[PredLiteral] = set()
+        # matched sample fact and newly bound placeholders for each template fact
+        matched: List[Tuple[PredLiteral, List[SymbolicConstant]]] = []
+        # depth-first search for a valid bijection (explicit stack of candidate
+        # iterators); invalid bindings of placeholders are rejected immediately
+        stack = [candidates(template[0])] if template else []
+
+        while stack and len(matched) < len(template):
+            atom = template[len(stack) - 1]
+
+            for target in stack[-1]:
+                if target in used:
+                    continue
+
+                bound = []
+
+                if all(
+                    match_term(term, target_term, bound)
+                    for term, target_term in zip(atom.terms, target.terms)
+                ):
+                    used.add(target)
+                    matched.append((target, bound))
+                    break
+
+                unbind(bound)
+            else:
+                # no (further) match for the template fact: backtrack
+                stack.pop()
+
+                if matched:
+                    target, bound = matched.pop()
+                    used.discard(target)
+                    unbind(bound)
+                continue
+
+            if len(matched) < len(template):
+                stack.append(candidates(template[len(matched)]))
+
+        if len(matched) != len(template):
+            return None
+
+        return mapping
+
+    def instantiate(
+        self: Self, facts: Iterable[Union[PredLiteral, NormalRule]]
+    ) -> Program:
+        """Returns the ground program for a sample.
+
+        Renames the placeholders of the template if the facts are isomorphic to the
+        template facts (see `match`) and grounds the program regularly otherwise.
+
+        Args:
+            facts: Iterable over ground `PredLiteral` or `NormalRule` instances
+                representing the facts of a sample.
+
+        Returns:
+            `Program` instance representing the ground program.
+
+        Raises:
+            ValueError: Invalid fact.
+        """
+        facts = Grounder.as_facts(facts)
+        mapping = self.match(facts)
+
+        if mapping is None:
+            return Grounder(
+                Program(self.prog.statements + facts), self.backend
+            ).ground()
+
+        subst = Substitution(
+            {var: mapping[const] for const, var in self.placeholders.items()}
+        )
+
+        return Program(
+            self.shared
+            + tuple(statement.substitute(subst) for statement in self.lifted)
+        )
@@ -0,0 +1,677 @@
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from ground_slash.program.literals import (
+    BuiltinLiteral,
+    Equal,
+    Greater,
+    GreaterEqual,
+    Less,
+    LessEqual,
+    PredLiteral,
+    Unequal,
+)
+from ground_slash.program.substitution import Substitution
+from ground_slash.program.terms import (
+    Add,
+    ArithTerm,
+    Div,
+    Minus,
+    Mult,
+    Number,
+    Sub,
+    Variable,
+)
+
+from .atoms import AtomTable
+from .planning import CheckStep, JoinPlan, MatchStep
+from .store import LiteralStore, indexable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ground_slash.program.literals import Literal
+    from ground_slash.program.statements import Statement
+    from ground_slash.program.terms import Term
+
+# operands larger than this are evaluated one by one (avoids integer overflows)
+MAX_OPERAND = 2**31
+
+# batch-wise evaluation of relational operators
+COMPARISONS = {
+    Equal: lambda left, right: left == right,
+    Unequal: lambda left, right: left != right,
+    Less: lambda left, right: left < right,
+    Greater: lambda left, right: left > right,
+    LessEqual: lambda left, right: left <= right,
+    GreaterEqual: lambda left, right: left >= right,
+}
+
+
+class TermValues:
+    """Integer values of the terms of an atom table.
+
+    Values are only computed for terms added to the table since the last update and
+    kept in arrays with spare capacity (amortized constant time per term).
+
+    Attributes:
+        values: Integer array of the values of the terms (zero for non-numbers).
+        numeric: Boolean array indicating whether or not the terms are (sufficiently
+            small) numbers.
+        size: Integer representing the number of terms covered by the arrays.
+    """
+
+    def __init__(self: Self) -> None:
+        """Initializes the term values instance."""
+        self.values = np.zeros(0, dtype=np.int64)
+        self.numeric = np.zeros(0, dtype=bool)
+        self.size = 0
+
+    def update(self: Self, terms: List["Term"]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Extends the values by the terms added since the last update.
+
+        Args:
+            terms: List of `Term` instances (indexed by term id, see `AtomTable`).
+
+        Returns:
+            Tuple of an integer array of values and a boolean array indicating whether
+            or not the term is a `Number` instance (both indexed by term id).
+        """
+        n = len(terms)
+
+        if n > len(self.values):
+            capacity = max(n, 2 * len(self.values))
+            values = np.zeros(capacity, dtype=np.int64)
+            numeric = np.zeros(capacity, dtype=bool)
+            values[: self.size] = self.values[: self.size]
+            numeric[: self.size] = self.numeric[: self.size]
+            self.values, self.numeric = values, numeric
+
+        for term_id in range(self.size, n):
+            term = terms[term_id]
+
+            if isinstance(term, Number) and abs(term.val) < MAX_OPERAND:
+                self.values[term_id] = term.val
+                self.numeric[term_id] = True
+
+        self.size = n
+
+        return self.values[:n], self.numeric[:n]
+
+
+# values of the terms of each atom table (shared by all plans using the table)
+term_values: "WeakKeyDictionary[AtomTable, TermValues]" = WeakKeyDictionary()
+
+
+def as_array(values: array) -> "np.ndarray":
+    """Returns a (read-only) NumPy view of an integer array.
+
+    Note: arrays cannot be resized while a view exists. Views must therefore not
+    outlive the computation they are used in (e.g., across yields).
+
+    Args:
+        values: `array('q')` instance.
+
+    Returns:
+        One-dimensional integer array sharing the memory of `values`.
+    """
+    return np.frombuffer(values, dtype=np.int64)
+
+
+def join_indices(
+    left_keys: List["np.ndarray"], right_keys: List["np.ndarray"], n: int, m: int
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Computes an equi-join of two relations (sort-merge join).
+
+    Args:
+        left_keys: List of integer arrays of length `n` representing the key columns
+            of the left relation.
+        right_keys: List of integer arrays of length `m` representing the key columns
+            of the right relation (in the same order as `left_keys`).
+        n: Integer representing the number of rows of the left relation.
+        m: Integer representing the number of rows of the right relation.
+
+    Returns:
+        Tuple of integer arrays representing the row indices of all pairs of joined
+        left and right rows.
+    """
+    # cross product
+    if not left_keys:
+        return np.repeat(np.arange(n), m), np.tile(np.arange(m), n)
+
+    # map (composite) keys to single integers
+    if len(left_keys) == 1:
+        left_key, right_key = left_keys[0], right_keys[0]
+    else:
+        keys = np.concatenate(
+            (np.stack(left_keys, axis=1), np.stack(right_keys, axis=1))
+        )
+        _, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        left_key, right_key = inverse[:n], inverse[n:]
+
+    # range of matching (sorted) right rows for each left row
+    order = np.argsort(right_key, kind="stable")
+    sorted_key = right_key[order]
+    start = np.searchsorted(sorted_key, left_key, side="left")
+    counts = np.searchsorted(sorted_key, left_key, side="right") - start
+
+    left = np.repeat(np.arange(n), counts)
+    offsets = np.repeat(start - np.cumsum(counts) + counts, counts)
+
+    return left, order[offsets + np.arange(len(left))]
+
+
+class VectorizedJoinPlan(JoinPlan):
+    """Join plan evaluating the positive body literals with NumPy.
+
+    Candidate literals for each positive body literal are represented as rows of term
+    ids (see `AtomTable`) and joined set-at-a-time via vectorized sort-merge joins on
+    shared variables. Only the surviving bindings are decoded and checked against the
+    remaining (built-in and default-negated) literals.
+
+    If the literals are kept in literal stores sharing an atom table (see
+    `LiteralStore`), the rows are gathered directly from the columnar predicate
+    extensions of the table. Otherwise, candidate literals are encoded one by one.
+
+    Plans with literals that cannot be matched positionally (e.g., containing
+    functional terms with variables) or with non-encodable bindings fall back to the
+    tuple-at-a-time evaluation of `JoinPlan`. Results are identical in either case.
+
+    Built-in literals and arithmetic variables are evaluated for whole batches of
+    bindings at once where possible, i.e., on term ids for (in)equalities between
+    variables and ground terms, and on integer columns for arithmetic terms. Anything
+    else (e.g., comparisons of symbolic constants) is checked binding by binding.
+
+    Attributes:
+        table: `AtomTable` instance used to encode terms, i.e., the table of the
+            literal store matched against (if any) or a table of the plan.
+        encoded: Dictionary mapping candidate literals to tuples of term ids (for
+            candidates not taken from `table`).
+        vectorized: Boolean indicating whether or not the plan can be vectorized.
+    """
+
+    def __init__(
+        self: Self,
+        statement: "Statement",
+        order: Tuple["Literal", ...],
+        bound: Optional[Set["Variable"]] = None,
+    ) -> None:
+        """Initializes the join plan instance (see `JoinPlan`).
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+        if not self.available():
+            raise ImportError(f"{type(self)} requires NumPy to be installed.")
+
+        super().__init__(statement, order, bound)
+
+        self.table = AtomTable()
+        self.encoded: Dict["Literal", Tuple[int, ...]] = dict()
+        self.vectorized = all(
+            step.simple for step in self.steps if isinstance(step, MatchStep)
+        )
+
+    @classmethod
+    def available(cls: "type[Self]") -> bool:
+        """Checks whether or not NumPy is installed.
+
+        Returns:
+            Boolean indicating whether or not plans of this type can be compiled.
+        """
+        return np is not None
+
+    def use_table(self: Self, possible: Iterable["Literal"]) -> None:
+        """Encodes terms using the atom table of a literal store (if any).
+
+        Args:
+            possible: Iterable over possible `Literal` instances.
+        """
+        atoms = possible.atoms if isinstance(possible, LiteralStore) else None
+
+        if atoms is not None and atoms is not self.table:
+            # term ids of different tables are incompatible
+            self.table = atoms
+            self.encoded = dict()
+
+    def encoded_extension(
+        self: Self,
+        step: MatchStep,
+        target: Iterable["Literal"],
+        exclude: Optional[Set["Literal"]] = None,
+    ) -> Optional["np.ndarray"]:
+        """Gathers the candidate rows for a match step from the atom table.
+
+        Args:
+            step: `MatchStep` instance.
+            target: Iterable over `Literal` instances to be matched against.
+            exclude: Optional set of `Literal` instances to be skipped.
+
+        Returns:
+            Two-dimensional integer array with one row of term ids per candidate, or
+            `None` if the candidates are not all registered in `table`.
+        """
+        if type(step.literal) is not PredLiteral or not isinstance(
+            target, LiteralStore
+        ):
+            return None
+
+        pred_id = self.table.pred_ids.get((*step.pred, step.literal.neg))
+
+        if pred_id is None:
+            return None
+
+        layers = target.encoded(self.table, pred_id)
+
+        if layers is None:
+            return None
+
+        if not layers:
+            rows = np.empty(0, dtype=np.int64)
+        elif len(layers) == 1:
+            rows = as_array(layers[0])
+        else:
+            # layers may overlap
+            rows = np.unique(np.concatenate([as_array(layer) for layer in layers]))
+
+        if exclude is not None:
+            if not isinstance(exclude, LiteralStore):
+                return None
+
+            excluded = exclude.encoded(self.table, pred_id)
+
+            if excluded is None:
+                return None
+            if excluded:
+                rows = rows[
+                    ~np.isin(
+                        rows, np.concatenate([as_array(layer) for layer in excluded])
+                    )
+                ]
+
+        columns = self.table.columns[pred_id]
+
+        if not columns:
+            return np.empty((len(rows), 0), dtype=np.int64)
+
+        return np.stack([as_array(column)[rows] for column in columns], axis=1)
+
+    def extension(
+        self: Self,
+        step: MatchStep,
+        target: Iterable["Literal"],
+        exclude: Optional[Set["Literal"]] = None,
+    ) -> "np.ndarray":
+        """Encodes the candidate literals for a match step.
+
+        Candidates are gathered from the atom table if possible (see
+        `encoded_extension`) and encoded one by one otherwise.
+
+        Args:
+            step: `MatchStep` instance.
+            target: Iterable over `Literal` instances to be matched against.
+            exclude: Optional set of `Literal` instances to be skipped.
+
+        Returns:
+            Two-dimensional integer array with one row of term ids per candidate.
+
+        Raises:
+            ValueError: Candidate literal contains non-encodable terms.
+        """
+        rows = self.encoded_extension(step, target, exclude)
+
+        if rows is not None:
+            return rows
+
+        literal = step.literal
+        literal_type = type(literal)
+
+        if isinstance(target, LiteralStore):
+            candidates = target.lookup(step.pred, step.consts)
+        else:
+            candidates = target
+
+        encoded = self.encoded
+        term_id = self.table.term_id
+        data = []
+        n_rows = 0
+
+        for candidate in candidates:
+            if exclude is not None and candidate in exclude:
+                continue
+            if not (
+                isinstance(candidate, literal_type)
+                and candidate.pred() == step.pred
+                and candidate.neg == literal.neg
+            ):
+                continue
+
+            ids = encoded.get(candidate)
+
+            if ids is None:
+                ids = tuple(term_id(term) for term in candidate.terms)
+                encoded[candidate] = ids
+
+            data.extend(ids)
+            n_rows += 1
+
+        return np.array(data, dtype=np.int64).reshape(n_rows, step.pred[1])
+
+    def join(
+        self: Self,
+        possible: Iterable["Literal"],
+        subst: Substitution,
+        sources: Dict["Literal", Tuple[Iterable["Literal"], Optional[Set["Literal"]]]],
+    ) -> Optional[Tuple[Dict[int, "np.ndarray"], int]]:
+        """Joins the positive body literals.
+
+        Args:
+            possible: Iterable over possible `Literal` instances.
+            subst: Initial `Substitution` instance.
+            sources: Dictionary mapping body literals to pairs of iterables over
+                literals to be matched against and literals to be excluded.
+
+        Returns:
+            Tuple of a dictionary mapping slots to integer arrays of term ids and the
+            number of joined rows, or `None` if the join cannot be vectorized.
+        """
+        self.use_table(possible)
+
+        term_id = self.table.term_id
+        columns = dict()
+        n = 1
+
+        for var, target in subst.items():
+            slot = self.slots.get(var)
+
+            if slot is None:
+                continue
+            if not indexable(target):
+                return None
+
+            columns[slot] = np.full(1, term_id(target), dtype=np.int64)
+
+        for step in self.steps:
+            if not isinstance(step, MatchStep):
+                continue
+
+            try:
+                rows = self.extension(
+                    step, *sources.get(step.literal, (possible, None))
+                )
+            except ValueError:
+                return None
+
+            # filter by ground terms and repeated variables
+            mask = np.ones(len(rows), dtype=bool)
+
+            for pos, term in step.consts:
+                mask &= rows[:, pos] == term_id(term)
+            for pos_1, pos_2 in step.equals:
+                mask &= rows[:, pos_1] == rows[:, pos_2]
+
+            rows = rows[mask]
+
+            # join with bindings on previously bound variables
+            left, right = join_indices(
+                [columns[slot] for _, slot in step.lookups],
+                [rows[:, pos] for pos, _ in step.lookups],
+                n,
+                len(rows),
+            )
+
+            columns = {slot: column[left] for slot, column in columns.items()}
+            columns.update({slot: rows[right, pos] for pos, slot in step.binds})
+            n = len(left)
+
+            if not n:
+                break
+
+        return columns, n
+
+    def solve(
+        self: Self,
+        certain: Set["Literal"],
+        possible: Iterable["Literal"],
+        subst: Optional[Substitution] = None,
+        sources: Optional[
+            Dict["Literal", Tuple[Iterable["Literal"], Optional[Set["Literal"]]]]
+        ] = None,
+    ) -> Iterator[Substitution]:
+        """Computes all substitutions satisfying the body literals of the plan.
+
+        See `JoinPlan.solve` for a description of the arguments.
+
+        Returns:
+            Iterator over `Substitution` instances.
+        """
+        if subst is None:
+            subst = Substitution()
+        if sources is None:
+            sources = dict()
+
+        result = self.join(possible, subst, sources) if self.vectorized else None
+
+        if result is None:
+            yield from super().solve(certain, possible, subst, sources)
+            return
+
+        columns, n = result
+
+        if not n:
+            return
+
+        # filter bindings by built-in literals and arithmetic variables (batch-wise)
+        numbers = self.numbers()
+        mask = np.ones(n, dtype=bool)
+        checks = []
+        arith_vars = []
+
+        for step in self.steps:
+            if not isinstance(step, CheckStep):
+                continue
+
+            step_mask = None
+
+            if isinstance(step.literal, BuiltinLiteral):
+                step_mask = self.eval_builtin(step.literal, columns, n, numbers)
+
+            if step_mask is None:
+                checks.append(step)
+            else:
+                mask &= step_mask
+
+        for var in self.arith_vars:
+            var_ids = columns[self.slots[var]]
+            values = self.eval_arith(var.orig_term, columns, n, numbers)
+
+            if values is None or not numbers[1][var_ids].all():
+                arith_vars.append(var)
+            else:
+                mask &= numbers[0][var_ids] == values
+
+        if not mask.all():
+            columns = {slot: column[mask] for slot, column in columns.items()}
+            n = int(mask.sum())
+
+        # decode surviving bindings (in order of slots)
+        terms = self.table.terms
+        values = [
+            [terms[term_id] for term_id in columns[slot].tolist()]
+            for slot in range(len(self.variables))
+        ]
+
+        # NOTE: 'zip' yields no frames if the plan has no variables
+        frames = zip(*values) if values else [()] * n
+
+        for frame in frames:
+            if not all(step.check(frame, certain) for step in checks):
+                continue
+
+            match = Substitution(subst)
+            match.update(zip(self.variables, frame))
+
+            # check remaining arithmetic variables
+            if all(
+                Equal(match[var], var.orig_term.substitute(match)).eval()
+                for var in arith_vars
+            ):
+                yield match
+
+    def numbers(self: Self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Returns the integer values of all encoded terms.
+
+        Values are cached per atom table and only computed for new terms (see
+        `TermValues`).
+
+        Returns:
+            Tuple of an integer array of values and a boolean array indicating whether
+            or not the term is a `Number` instance (both indexed by term id).
+        """
+        values = term_values.get(self.table)
+
+        if values is None:
+            values = term_values[self.table] = TermValues()
+
+        return values.update(self.table.terms)
+
+    def eval_arith(
+        self: Self,
+        term: "Term",
+        columns: Dict[int, "np.ndarray"],
+        n: int,
+        numbers: Tuple["np.ndarray", "np.ndarray"],
+    ) -> Optional["np.ndarray"]:
+        """Evaluates an arithmetic term for a batch of bindings.
+
+        Args:
+            term: `Term` instance.
+            columns: Dictionary mapping slots to integer arrays of term ids.
+            n: Integer representing the number of bindings.
+            numbers: Tuple of integer values and numeric flags (see `numbers`).
+
+        Returns:
+            Integer array of values or `None` if the term cannot be evaluated for all
+            bindings (e.g., non-numeric terms, division by zero or large operands).
+        """
+        if isinstance(term, Number):
+            return np.full(n, term.val, dtype=np.int64)
+
+        if isinstance(term, Variable):
+            slot = self.slots.get(term)
+
+            if slot is None:
+                return None
+
+            ids = columns[slot]
+
+            return numbers[0][ids] if numbers[1][ids].all() else None
+
+        if isinstance(term, Minus):
+            operand = self.eval_arith(term.operand, columns, n, numbers)
+
+            return None if operand is None else -operand
+
+        if not isinstance(term, (Add, Sub, Mult, Div)):
+            return None
+
+        loperand = self.eval_arith(term.loperand, columns, n, numbers)
+        roperand = self.eval_arith(term.roperand, columns, n, numbers)
+
+        # avoid integer overflows
+        if (
+            loperand is None
+            or roperand is None
+            or (n and np.abs(loperand).max() >= MAX_OPERAND)
+            or (n and np.abs(roperand).max() >= MAX_OPERAND)
+        ):
+            return None
+
+        if isinstance(term, Add):
+            return loperand + roperand
+        if isinstance(term, Sub):
+            return loperand - roperand
+        if isinstance(term, Mult):
+            return loperand * roperand
+
+        # NOTE: ASP-Core-2 requires integer division
+        if (roperand == 0).any():
+            return None
+
+        return np.floor_divide(loperand, roperand)
+
+    def eval_builtin(
+        self: Self,
+        literal: "BuiltinLiteral",
+        columns: Dict[int, "np.ndarray"],
+        n: int,
+        numbers: Tuple["np.ndarray", "np.ndarray"],
+    ) -> Optional["np.ndarray"]:
+        """Evaluates a built-in literal for a batch of bindings.
+
+        (In)equalities between variables and ground terms are evaluated on term ids.
+        All other comparisons require the operands to evaluate to integers.
+
+        Args:
+            literal: `BuiltinLiteral` instance.
+            columns: Dictionary mapping slots to integer arrays of term ids.
+            n: Integer representing the number of bindings.
+            numbers: Tuple of integer values and numeric flags (see `numbers`).
+
+        Returns:
+            Boolean array indicating for each binding whether or not the relation holds,
+            or `None` if the literal cannot be evaluated batch-wise.
+        """
+        compare = COMPARISONS.get(type(literal))
+
+        if compare is None:
+            return None
+
+        # compare term ids
+        if isinstance(literal, (Equal, Unequal)):
+            ids = [self.term_ids(operand, columns, n) for operand in literal.operands]
+
+            if ids[0] is not None and ids[1] is not None:
+                return compare(*ids)
+
+        operands = [
+            self.eval_arith(operand, columns, n, numbers)
+            for operand in literal.operands
+        ]
+
+        if operands[0] is None or operands[1] is None:
+            return None
+
+        return compare(*operands)
+
+    def term_ids(
+        self: Self, term: "Term", columns: Dict[int, "np.ndarray"], n: int
+    ) -> Optional["np.ndarray"]:
+        """Returns the term ids of a variable or ground term for a batch of bindings.
+
+        Args:
+            term: `Term` instance.
+            columns: Dictionary mapping slots to integer arrays of term ids.
+            n: Integer representing the number of bindings.
+
+        Returns:
+            Integer array of term ids or `None` for other terms.
+        """
+        if isinstance(term, Variable):
+            slot = self.slots.get(term)
+
+            return None if slot is None else columns[slot]
+        if isinstance(term, ArithTerm) or not indexable(term):
+            return None
+
+        return np.full(n, self.table.term_id(term), dtype=np.int64)
@@ -5,5 +5,5 @@ from .operators import AggrOp, ArithOp, RelOp  # noqa
 from .program import Program  # noqa
 from .query import Query  # noqa
 from .statements import *  # noqa
-from .substitution import Substitution  # noqa
+from .substitution import Renaming, Substitution  # noqa
 from .terms import *  # noqa
@@ -1,5 +1,17 @@
+import copyreg
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, Optional, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 try:
     from typing import Self
@@ -12,6 +24,94 @@ if TYPE_CHECKING:  # pragma: no cover
     from .statements import Statement
     from .terms import Term, Variable
 
+T = TypeVar("T")
+
+
+class cached_slot(Generic[T]):
+    """Cached property for classes using `__slots__` (see `functools.cached_property`).
+
+    The value is computed once on first access and stored in the attribute named after
+    the property with a leading underscore (e.g., `_ground` for `ground`), which has to
+    be declared in the `__slots__` of the class (or be stored in its `__dict__`).
+    """
+
+    def __init__(self: Self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.attr = f"_{func.__name__}"
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self: Self, owner: type, name: str) -> None:
+        self.attr = f"_{name}"
+
+    def __get__(self: Self, instance: Any, owner: Optional[type] = None) -> T:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.attr)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.attr, value)
+
+            return value
+
+
+# names of all (mangled) slots of a class including those of its bases
+_slot_names: Dict[type, Tuple[str, ...]] = dict()
+
+
+def reduce_slots(obj: Any) -> Tuple[Any, ...]:
+    """Reduces an object using `__slots__` for pickling and copying.
+
+    Equivalent to the default reduction, except that cached hash values (`_hash`) are
+    not retained, since hash values of strings and types differ between interpreter
+    processes. They are recomputed on first use instead.
+
+    Args:
+        obj: Object to be reduced.
+
+    Returns:
+        Tuple of a callable, its arguments and the state of the object
+        (see `object.__reduce__`).
+    """
+    cls = type(obj)
+    names = _slot_names.get(cls)
+
+    if names is None:
+        names = []
+
+        for base in cls.__mro__:
+            slots = base.__dict__.get("__slots__", ())
+
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                if name.startswith("__"):
+                    name = f"_{base.__name__.lstrip('_')}{name}"
+
+                names.append(name)
+
+        _slot_names[cls] = names = tuple(names)
+
+    slot_state = dict()
+
+    for name in names:
+        try:
+            slot_state[name] = getattr(obj, name)
+        except AttributeError:
+            # unset slot
+            pass
+
+    if "_hash" in slot_state:
+        slot_state["_hash"] = None
+
+    dict_state = getattr(obj, "__dict__", None)
+
+    if dict_state and "_hash" in dict_state:
+        dict_state = {key: val for key, val in dict_state.items() if key != "_hash"}
+
+    return (copyreg.__newobj__, (cls,), (dict_state or None, slot_state))
+
 
 class Expr(ABC):
     """Abstract base class for all expressions.
@@ -20,7 +120,10 @@ class Expr(ABC):
     All expressions should inherit from this class or a subclass thereof.
     """
 
-    __slots__ = "ground"
+    __slots__ = ()
+
+    def __reduce__(self: Self) -> Tuple[Any, ...]:
+        return reduce_slots(self)
 
     @abstractmethod  # pragma: no cover
     def vars(self: Self) -> Set["Variable"]:  # type: ignore
@@ -1193,7 +1193,7 @@ class AggrLiteral(Literal):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.func, self.elements, self.guards))
+        return hash((type(self), self.func, frozenset(self.elements), self.guards))
 
     @cached_property
     def ground(self: Self) -> bool:
@@ -1,6 +1,4 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional, Set, Tuple, Union
 
 try:
@@ -8,9 +6,10 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+from ground_slash.program.expression import cached_slot
 from ground_slash.program.operators import RelOp
 from ground_slash.program.safety_characterization import SafetyRule, SafetyTriplet
-from ground_slash.program.substitution import Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.terms import ArithTerm, Number, TermTuple
 
 from .literal import Literal, LiteralCollection
@@ -36,6 +35,8 @@ class BuiltinLiteral(Literal, ABC):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ("naf", "loperand", "roperand", "_hash", "_ground")
+
     def __init__(self: Self, loperand: "Term", roperand: "Term") -> None:
         """Initializes built-in literal instance.
 
@@ -48,8 +49,9 @@ class BuiltinLiteral(Literal, ABC):
 
         self.loperand = loperand
         self.roperand = roperand
+        self._hash = None
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.loperand.ground and self.roperand.ground
 
@@ -132,8 +134,8 @@ class BuiltinLiteral(Literal, ABC):
         Returns:
             `BuiltinLiteral` instance with (possibly substituted) operands.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute operands recursively
         operands = (operand.substitute(subst) for operand in self.operands)
@@ -151,6 +153,8 @@ class Equal(BuiltinLiteral):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ()
+
     def __str__(self: Self) -> str:
         """Returns the string representation for the built-in literal.
 
@@ -178,7 +182,10 @@ class Equal(BuiltinLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def safety(
         self: Self, statement: Optional[Union["Statement", "Query"]] = None
@@ -267,6 +274,8 @@ class Unequal(BuiltinLiteral):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ()
+
     def __str__(self: Self) -> str:
         """Returns the string representation for the built-in literal.
 
@@ -294,7 +303,10 @@ class Unequal(BuiltinLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def eval(self: Self) -> bool:
         """Evaluates the built-in literal w.r.t. the total ordering for terms.
@@ -352,6 +364,8 @@ class Less(BuiltinLiteral):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ()
+
     def __str__(self: Self) -> str:
         """Returns the string representation for the built-in literal.
 
@@ -379,7 +393,10 @@ class Less(BuiltinLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def eval(self: Self) -> bool:
         """Evaluates the built-in literal w.r.t. the total ordering for terms.
@@ -437,6 +454,8 @@ class Greater(BuiltinLiteral):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ()
+
     def __str__(self: Self) -> str:
         """Returns the string representation for the built-in literal.
 
@@ -464,7 +483,10 @@ class Greater(BuiltinLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def eval(self: Self) -> bool:
         """Evaluates the built-in literal w.r.t. the total ordering for terms.
@@ -522,6 +544,8 @@ class LessEqual(BuiltinLiteral):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ()
+
     def __str__(self: Self) -> str:
         """Returns the string representation for the built-in literal.
 
@@ -549,7 +573,10 @@ class LessEqual(BuiltinLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def eval(self: Self) -> bool:
         """Evaluates the built-in literal w.r.t. the total ordering for terms.
@@ -607,6 +634,8 @@ class GreaterEqual(BuiltinLiteral):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ()
+
     def __str__(self: Self) -> str:
         """Returns the string representation for the built-in literal.
 
@@ -634,7 +663,10 @@ class GreaterEqual(BuiltinLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def eval(self: Self) -> bool:
         """Evaluates the built-in literal w.r.t. the total ordering for terms.
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Set, Union
 
 try:
@@ -79,7 +78,7 @@ class Guard(NamedTuple):
         """
         if self.right:
             return Guard(-self.op, self.bound, False)
-        return deepcopy(self)
+        return self
 
     def to_right(self: Self) -> "Guard":
         """Moves guard to the right-hand side.
@@ -89,7 +88,7 @@ class Guard(NamedTuple):
         """
         if not self.right:
             return Guard(-self.op, self.bound, True)
-        return deepcopy(self)
+        return self
 
     def vars(self: Self) -> Set["Variable"]:
         """Returns the variables associated with the guard.
@@ -1,18 +1,21 @@
 import itertools
 from abc import ABC, abstractmethod
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, Iterator, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Optional, Set, Tuple, Union
 
 try:
     from typing import Self
 except ImportError:
     from typing_extensions import Self
 
-from ground_slash.program.expression import Expr
+from ground_slash.program.expression import Expr, cached_slot
 from ground_slash.program.safety_characterization import SafetyTriplet
-from ground_slash.program.substitution import AssignmentError, Substitution
+from ground_slash.program.substitution import (
+    AssignmentError,
+    Renaming,
+    Substitution,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from ground_slash.program.query import Query
@@ -33,8 +36,13 @@ class Literal(Expr, ABC):
         ground: Boolean indicating whether or not the literal is ground.
     """
 
+    __slots__ = ()
+
     naf: bool = False
 
+    # hash value (computed once on first use; reset when negation changes)
+    _hash: ClassVar[Optional[int]] = None
+
     @abstractmethod  # pragma: no cover
     def pos_occ(self: Self) -> "LiteralCollection":
         """Positive literal occurrences.
@@ -112,10 +120,12 @@ class Literal(Expr, ABC):
     def __abs__(self: Self) -> "Literal":
         """TODO"""
         if self.naf:
-            copy = deepcopy(self)
-            copy.naf = False
+            # shallow copy (remaining attributes are immutable)
+            literal = copy(self)
+            literal.naf = False
+            literal._hash = None
 
-            return copy
+            return literal
 
         return self
 
@@ -128,6 +138,8 @@ class LiteralCollection:
         ground: Boolean indicating whether or not all literals are ground.
     """
 
+    __slots__ = ("literals", "_hash", "_ground")
+
     def __init__(self: Self, *literals: Literal) -> None:
         """Initializes literal collection instance.
 
@@ -137,6 +149,12 @@ class LiteralCollection:
 
         # initialize while removing duplicates and preserving order
         self.literals = tuple(dict.fromkeys(literals))
+        # hash value (computed once on first use)
+        self._hash: Optional[int] = None
+
+    def __reduce__(self: Self) -> Tuple[Any, ...]:
+        # re-initialize on unpickling (drops cached hash value)
+        return (type(self), self.literals)
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the literal collection.
@@ -162,14 +180,18 @@ class LiteralCollection:
         Returns:
             Boolean indicating whether or not the literal collection is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, type(self))
+            and hash(self) == hash(other)
             and len(self) == len(other)
             and frozenset(self.literals) == frozenset(other.literals)
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), frozenset(self.literals)))
+        if self._hash is None:
+            self._hash = hash((type(self), frozenset(self.literals)))
+
+        return self._hash
 
     def __iter__(self: Self) -> Iterator[Literal]:
         return iter(self.literals)
@@ -212,7 +234,7 @@ class LiteralCollection:
 
         return False
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return all(literal.ground for literal in self.literals)
 
@@ -298,8 +320,8 @@ class LiteralCollection:
         Returns:
             `LiteralCollection` instance with (possibly substituted) literals.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute literals recursively
         literals = (literal.substitute(subst) for literal in self)
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 
 from .literal import Literal
 
@@ -17,7 +17,8 @@ def Naf(literal: Literal, value: bool = True) -> Literal:
     Raises:
         ValueError: Literal of wrong type.
     """  # noqa
-    naf_literal = deepcopy(literal)
+    # shallow copy (remaining attributes are immutable)
+    naf_literal = copy(literal)
     naf_literal.set_naf(value)
 
     return naf_literal
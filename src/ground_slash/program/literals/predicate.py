@@ -1,5 +1,3 @@
-from copy import deepcopy
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional, Set, Tuple, Union
 
 try:
@@ -9,7 +7,7 @@ except ImportError:
 
 import ground_slash
 from ground_slash.program.safety_characterization import SafetyTriplet
-from ground_slash.program.substitution import Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.symbols import SYM_CONST_RE
 from ground_slash.program.terms import Functional, TermTuple
 
@@ -35,6 +33,8 @@ class PredLiteral(Literal):
         arity: Integer representing the arity of the functional term (equal to the number of terms).
     """  # noqa
 
+    __slots__ = ("naf", "name", "neg", "terms", "_hash")
+
     def __init__(
         self: Self,
         name: str,
@@ -65,6 +65,7 @@ class PredLiteral(Literal):
         self.name = name
         self.neg = neg
         self.terms = TermTuple(*terms)
+        self._hash = None
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the literal to a given object.
@@ -78,8 +79,9 @@ class PredLiteral(Literal):
         Returns:
             Boolean indicating whether or not the literal is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, type(self))
+            and hash(self) == hash(other)
             and self.name == other.name
             and self.terms == other.terms
             and self.neg == other.neg
@@ -87,7 +89,10 @@ class PredLiteral(Literal):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.naf, self.neg, self.name, *self.terms))
+        if self._hash is None:
+            self._hash = hash((type(self), self.naf, self.neg, self.name, self.terms))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the predicate literal.
@@ -109,9 +114,9 @@ class PredLiteral(Literal):
     def arity(self: Self) -> int:
         return len(self.terms)
 
-    @cached_property
+    @property
     def ground(self: Self) -> bool:
-        return all(term.ground for term in self.terms)
+        return self.terms.ground
 
     def set_neg(self: Self, value: bool = True) -> None:
         """Setter for the `neg` attribute.
@@ -120,6 +125,7 @@ class PredLiteral(Literal):
             value: Boolean value for the `neg` attribute. Defaults to `True`.
         """
         self.neg = value
+        self._hash = None
 
     def set_naf(self: Self, value: bool = True) -> None:
         """Setter for the `naf` attribute.
@@ -128,6 +134,7 @@ class PredLiteral(Literal):
             value: Boolean value for the `naf` attribute. Defaults to `True`.
         """
         self.naf = value
+        self._hash = None
 
     def pred(self: Self) -> Tuple[str, int]:
         """Predicate signature of the predicate literal.
@@ -215,7 +222,10 @@ class PredLiteral(Literal):
             and self.arity == other.arity
             and self.neg == other.neg
         ):
-            return self.terms.match(other.terms)
+            subst = Substitution()
+
+            if self.terms.match_into(other.terms, subst):
+                return subst
 
         return None
 
@@ -230,8 +240,8 @@ class PredLiteral(Literal):
         Returns:
             `PredicateLiteral` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         return PredLiteral(
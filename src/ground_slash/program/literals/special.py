@@ -1,5 +1,4 @@
 from abc import ABC
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
 try:
@@ -8,7 +7,7 @@ except ImportError:
     from typing_extensions import Self
 
 from ground_slash.program.literals import LiteralCollection, PredLiteral
-from ground_slash.program.substitution import Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.symbols import SpecialChar
 from ground_slash.program.terms import TermTuple
 
@@ -99,14 +98,17 @@ class PropPlaceholder(AuxLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash(
-            (
-                type(self),
-                self.prefix,
-                self.ref_id,
-                frozenset((v, t) for v, t in zip(self.glob_vars, self.terms)),
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    type(self),
+                    self.prefix,
+                    self.ref_id,
+                    frozenset((v, t) for v, t in zip(self.glob_vars, self.terms)),
+                )
             )
-        )
+
+        return self._hash
 
     def set_neg(self: Self, value: bool = True) -> None:
         """Setter for the `neg` attribute.
@@ -170,8 +172,8 @@ class PropPlaceholder(AuxLiteral):
         Returns:
             `PropPlaceholder` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         return type(self)(
@@ -282,14 +284,17 @@ class PropBaseLiteral(AuxLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash(
-            (
-                type(self),
-                self.prefix,
-                self.ref_id,
-                frozenset((v, t) for v, t in zip(self.glob_vars, self.terms)),
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    type(self),
+                    self.prefix,
+                    self.ref_id,
+                    frozenset((v, t) for v, t in zip(self.glob_vars, self.terms)),
+                )
             )
-        )
+
+        return self._hash
 
     def set_naf(self: Self, value: bool = True) -> None:
         """Setter for the `neg` attribute.
@@ -349,8 +354,8 @@ class PropBaseLiteral(AuxLiteral):
         Returns:
             `PropBaseLiteral` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         return type(self)(
@@ -472,22 +477,29 @@ class PropElemLiteral(AuxLiteral):
         )
 
     def __hash__(self: Self) -> int:
-        return hash(
-            (
-                type(self),
-                self.prefix,
-                self.ref_id,
-                self.element_id,
-                frozenset(
-                    (v, t)
-                    for v, t in zip(self.local_vars, self.terms[: len(self.local_vars)])
-                ),
-                frozenset(
-                    (v, t)
-                    for v, t in zip(self.glob_vars, self.terms[len(self.local_vars) :])
-                ),
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    type(self),
+                    self.prefix,
+                    self.ref_id,
+                    self.element_id,
+                    frozenset(
+                        (v, t)
+                        for v, t in zip(
+                            self.local_vars, self.terms[: len(self.local_vars)]
+                        )
+                    ),
+                    frozenset(
+                        (v, t)
+                        for v, t in zip(
+                            self.glob_vars, self.terms[len(self.local_vars) :]
+                        )
+                    ),
+                )
             )
-        )
+
+        return self._hash
 
     def set_naf(self: Self, value: bool = True) -> None:
         """Setter for the `neg` attribute.
@@ -549,8 +561,8 @@ class PropElemLiteral(AuxLiteral):
         Returns:
             `PropElemLiteral` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         return type(self)(
@@ -1,5 +1,4 @@
 import itertools
-from copy import deepcopy
 from functools import cached_property
 from itertools import chain, combinations
 from typing import (
@@ -31,6 +30,7 @@ from ground_slash.program.literals import (
 from ground_slash.program.literals.builtin import GreaterEqual, op2rel
 from ground_slash.program.operators import RelOp
 from ground_slash.program.safety_characterization import SafetyTriplet
+from ground_slash.program.substitution import Renaming
 from ground_slash.program.terms import Infimum, Number
 
 from .normal import NormalRule
@@ -311,7 +311,7 @@ class Choice(Expr):
                     )
                 self.lguard = guard
 
-        self.elements = elements
+        self.elements = tuple(elements)
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the choice expression to a given object.
@@ -623,11 +623,11 @@ class Choice(Expr):
         Returns:
             `Choice` instance with (possibly substituted) guards and elements.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute elements recursively
-        elements = (element.substitute(subst) for element in self.elements)
+        elements = tuple(element.substitute(subst) for element in self.elements)
 
         # substitute guard terms recursively
         guards = tuple(
@@ -786,14 +786,18 @@ class ChoiceRule(Statement):
         Returns:
             Boolean indicating whether or not the statement is considered equal to the given object.
         """  # noqa
-        return (
+        # NOTE: no comparison of hashes (equal guards may have different hashes)
+        return self is other or (
             isinstance(other, type(self))
             and self.head == other.head
             and self.literals == other.literals
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.head, self.literals))
+        if self._hash is None:
+            self._hash = hash((type(self), self.head, self.literals))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the statement.
@@ -861,8 +865,8 @@ class ChoiceRule(Statement):
         Returns:
             `ChoiceRule` instance with (possibly substituted) choice and literals.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         return ChoiceRule(self.head.substitute(subst), self.body.substitute(subst))
 
@@ -1,5 +1,3 @@
-from copy import deepcopy
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, Set, Tuple
 
 try:
@@ -7,8 +5,10 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+from ground_slash.program.expression import cached_slot
 from ground_slash.program.literals import AggrLiteral, LiteralCollection
 from ground_slash.program.safety_characterization import SafetyTriplet
+from ground_slash.program.substitution import Renaming
 from ground_slash.program.terms import TermTuple
 
 from .statement import Statement
@@ -44,6 +44,8 @@ class Constraint(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("literals", "_safe", "_ground")
+
     deterministic: bool = True
 
     def __init__(self: Self, *literals: "Literal", **kwargs) -> None:
@@ -67,12 +69,17 @@ class Constraint(Statement):
         Returns:
             Boolean indicating whether or not the statement is considered equal to the given object.
         """  # noqa
-        return isinstance(other, type(self)) and set(self.literals) == set(
-            other.literals
+        return self is other or (
+            isinstance(other, type(self))
+            and hash(self) == hash(other)
+            and set(self.literals) == set(other.literals)
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), frozenset(self.literals)))
+        if self._hash is None:
+            self._hash = hash((type(self), frozenset(self.literals)))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the statement.
@@ -90,18 +97,18 @@ class Constraint(Statement):
     def body(self: Self) -> LiteralCollection:
         return self.literals
 
-    @cached_property
+    @cached_slot
     def safe(self: Self) -> bool:
         global_vars = self.global_vars()
         body_safety = self.body.safety(self)
 
         return body_safety == SafetyTriplet(global_vars)
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return all(literal.ground for literal in self.literals)
 
-    @cached_property
+    @cached_slot
     def contains_aggregates(self: Self) -> bool:
         return any(isinstance(literal, AggrLiteral) for literal in self.literals)
 
@@ -116,8 +123,8 @@ class Constraint(Statement):
         Returns:
             `Constraint` instance with (possibly substituted) literals.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         return Constraint(*self.literals.substitute(subst))
 
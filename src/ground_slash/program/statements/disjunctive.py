@@ -1,5 +1,3 @@
-from copy import deepcopy
-from functools import cached_property
 from itertools import combinations
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
@@ -9,6 +7,7 @@ except ImportError:
     from typing_extensions import Self
 
 import ground_slash
+from ground_slash.program.expression import cached_slot
 from ground_slash.program.literals import (
     AggrLiteral,
     AggrPlaceholder,
@@ -16,6 +15,7 @@ from ground_slash.program.literals import (
     PredLiteral,
 )
 from ground_slash.program.safety_characterization import SafetyTriplet
+from ground_slash.program.substitution import Renaming
 
 from .normal import NormalRule
 from .statement import Statement
@@ -56,6 +56,8 @@ class DisjunctiveRule(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("atoms", "literals", "_safe", "_ground")
+
     deterministic: bool = False
 
     def __init__(
@@ -113,14 +115,18 @@ class DisjunctiveRule(Statement):
         Returns:
             Boolean indicating whether or not the statement is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, type(self))
+            and hash(self) == hash(other)
             and set(self.atoms) == set(other.atoms)
             and set(self.literals) == set(other.literals)
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.atoms, self.literals))
+        if self._hash is None:
+            self._hash = hash((type(self), self.atoms, self.literals))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the statement.
@@ -138,11 +144,11 @@ class DisjunctiveRule(Statement):
     def body(self: Self) -> LiteralCollection:
         return self.literals
 
-    @cached_property
+    @cached_slot
     def safe(self: Self) -> bool:
         return self.body.safety(self) == SafetyTriplet(self.global_vars())
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.head.ground and self.body.ground
 
@@ -161,8 +167,8 @@ class DisjunctiveRule(Statement):
             atoms and literals. `NormalRule` is returned if the substitution results
             in a single unique head atom.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         subst_head = self.head.substitute(subst)
 
@@ -236,7 +242,7 @@ class DisjunctiveRule(Statement):
 
         # replace original rule with modified one
         alpha_rule = DisjunctiveRule(
-            deepcopy(self.atoms),
+            self.atoms,
             tuple(
                 alpha_map[literal] if isinstance(literal, AggrLiteral) else literal
                 for literal in self.body
@@ -258,7 +264,7 @@ class DisjunctiveRule(Statement):
             `DisjunctiveRule` instance representing the reassembled original statement.
         """
         return DisjunctiveRule(
-            deepcopy(self.atoms),
+            self.atoms,
             tuple(
                 literal if literal not in assembling_map else assembling_map[literal]
                 for literal in self.body
@@ -281,7 +287,7 @@ class DisjunctiveRule(Statement):
             self.body.replace_arith(self.var_table),
         )
 
-    @cached_property
+    @property
     def is_fact(self: Self) -> bool:
         return not bool(len(self.body))
 
@@ -1,5 +1,3 @@
-from copy import deepcopy
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Tuple, Union
 
 try:
@@ -7,6 +5,7 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+from ground_slash.program.expression import cached_slot
 from ground_slash.program.literals import (
     AggrLiteral,
     AggrPlaceholder,
@@ -14,6 +13,7 @@ from ground_slash.program.literals import (
     PredLiteral,
 )
 from ground_slash.program.safety_characterization import SafetyTriplet
+from ground_slash.program.substitution import Renaming
 
 from .constraint import Constraint
 from .statement import Statement
@@ -55,6 +55,8 @@ class NormalRule(Statement):
             aggregate expressions.
     """  # noqa
 
+    __slots__ = ("atom", "literals", "_safe", "_ground")
+
     deterministic: bool = True
 
     def __init__(
@@ -94,14 +96,18 @@ class NormalRule(Statement):
         Returns:
             Boolean indicating whether or not the statement is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, type(self))
+            and hash(self) == hash(other)
             and self.atom == other.atom
             and self.literals == other.literals
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.atom, self.literals))
+        if self._hash is None:
+            self._hash = hash((type(self), self.atom, self.literals))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the statement.
@@ -119,11 +125,11 @@ class NormalRule(Statement):
     def body(self: Self) -> LiteralCollection:
         return self.literals
 
-    @cached_property
+    @cached_slot
     def safe(self: Self) -> bool:
         return self.body.safety(self) == SafetyTriplet(self.global_vars())
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.atom.ground and self.literals.ground
 
@@ -138,8 +144,8 @@ class NormalRule(Statement):
         Returns:
             `NormalRule` instance with (possibly substituted) atom and literals.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         return NormalRule(self.atom.substitute(subst), self.literals.substitute(subst))
 
@@ -282,8 +288,8 @@ class NormalRule(Statement):
                 return Constraint(*self.body)
 
         # non-choice rule (nothing to be done here)
-        return deepcopy(self)
+        return self
 
-    @cached_property
+    @property
     def is_fact(self: Self) -> bool:
         return not bool(len(self.body))
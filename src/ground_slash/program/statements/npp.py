@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
@@ -16,7 +15,7 @@ from ground_slash.program.literals import (
 )
 from ground_slash.program.operators import RelOp
 from ground_slash.program.safety_characterization import SafetyTriplet
-from ground_slash.program.substitution import Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.terms import Number, Term, TermTuple
 
 from .choice import Choice, ChoiceElement
@@ -302,7 +301,10 @@ class NPPRule(Statement):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.head, self.literals))
+        if self._hash is None:
+            self._hash = hash((type(self), self.head, self.literals))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the statement.
@@ -366,8 +368,8 @@ class NPPRule(Statement):
         Returns:
             `NPPRule` instance with (possibly substituted) NPP expression and literals.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         return NPPRule(self.head.substitute(subst), self.body.substitute(subst))
 
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Optional, Type, Union
 
 try:
@@ -17,7 +16,7 @@ from ground_slash.program.literals import (
     PropElemLiteral,
 )
 from ground_slash.program.literals.builtin import op2rel
-from ground_slash.program.substitution import Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.terms import Number, TermTuple
 
 from .normal import NormalRule
@@ -75,7 +74,7 @@ class PropBaseRule(NormalRule):
                 )
 
         # create head atom/literal
-        atom = atom_type(ref_id, glob_vars, deepcopy(glob_vars))
+        atom = atom_type(ref_id, glob_vars, glob_vars)
         # compute guard literals and combine them with non-aggregate literals
         lguard_literal = (
             op2rel[lguard.op](lguard.bound, base_value) if lguard is not None else None
@@ -94,8 +93,8 @@ class PropBaseRule(NormalRule):
         return cls(atom, lguard, rguard, guard_literals + literals)
 
     def substitute(self: Self, subst: "Substitution") -> "PropBaseRule":
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         return type(self)(
@@ -145,7 +144,12 @@ class PropElemRule(NormalRule):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), type(self), self.atom, self.literals, self.element))
+        if self._hash is None:
+            self._hash = hash(
+                (type(self), type(self), self.atom, self.literals, self.element)
+            )
+
+        return self._hash
 
     @property
     def ref_id(self: Self) -> int:
@@ -188,8 +192,8 @@ class PropElemRule(NormalRule):
         return cls(atom, element, literals)
 
     def substitute(self: Self, subst: "Substitution") -> "PropElemRule":
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         return type(self)(
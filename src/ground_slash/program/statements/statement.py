@@ -1,6 +1,4 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
 
 try:
@@ -8,7 +6,7 @@ try:
 except ImportError:
     from typing_extensions import Self
 
-from ground_slash.program.expression import Expr
+from ground_slash.program.expression import Expr, cached_slot
 from ground_slash.program.literals import AggrLiteral
 from ground_slash.program.variable_table import VariableTable
 
@@ -43,7 +41,7 @@ class Statement(Expr, ABC):
             aggregate expressions.
     """
 
-    __slots__ = "deterministic"
+    __slots__ = ("__var_table", "_hash", "_contains_aggregates")
 
     def __init__(
         self: Self, var_table: Optional["VariableTable"] = None, *args, **kwargs
@@ -57,6 +55,8 @@ class Statement(Expr, ABC):
                 Defaults to None.
         """
         self.__var_table = var_table
+        # hash value (computed once on first use)
+        self._hash: Optional[int] = None
 
     @abstractmethod  # pragma: no cover
     def __str__(self: Self) -> str:
@@ -89,7 +89,7 @@ class Statement(Expr, ABC):
     def ground(self: Self) -> bool:
         pass
 
-    @cached_property
+    @cached_slot
     def contains_aggregates(self: Self) -> bool:
         return any(isinstance(literal, AggrLiteral) for literal in self.body)
 
@@ -230,7 +230,7 @@ class Statement(Expr, ABC):
             `Statement` instance representing the rewritten original statement without
             any choice expressions.
         """
-        return deepcopy(self)
+        return self
 
     def assemble_choices(
         self: Self,
@@ -245,7 +245,7 @@ class Statement(Expr, ABC):
         Returns:
             `Statement` instance representing the reassembled original statement.
         """
-        return deepcopy(self)
+        return self
 
     def consequents(self: Self) -> "LiteralCollection":
         """Returns the consequents of the statement.
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
@@ -56,10 +55,10 @@ class Substitution(dict):
 
         Returns:
             `Term` instance representing the target of the substitution.
-            Note: a copy is returned instead of the original object.
+            Note: terms are immutable and therefore returned without copying.
         """
         # map variables to themselves if no substitution specified
-        return deepcopy(dict.__getitem__(self, var)) if var in self else deepcopy(var)
+        return dict.get(self, var, var)
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the substitution.
@@ -162,3 +161,20 @@ class Substitution(dict):
             Boolean indicating whether or not the substitution is an identity substitution.
         """  # noqa
         return all(var == target for (var, target) in self.items())
+
+
+class Renaming(Substitution):
+    """Substitution additionally replacing symbolic constants.
+
+    Unlike regular substitutions, renamings are also applied to ground expressions,
+    which are otherwise returned as they are.
+    """
+
+    def __init__(self: Self, subst_dict: Optional[Dict["Term", "Term"]] = None) -> None:
+        """Initializes the renaming instance.
+
+        Args:
+            subst_dict: Optional dictionary mapping `Variable` or `SymbolicConstant`
+                instances to `Term` instances. Defaults to `None`.
+        """
+        super().__init__(subst_dict)
@@ -10,7 +10,7 @@ class SpecialChar(Enum):
     CHI = "\u03C7"  # χ
 
 
-VARIABLE_RE = re.compile(r"^[A-Z][a-zA-Z0-1_]*")
+VARIABLE_RE = re.compile(r"^[A-Z][a-zA-Z0-9_]*")
 SYM_CONST_RE = re.compile(
     (
         rf"[a-z{SpecialChar.ALPHA.value}{SpecialChar.CHI.value}"
@@ -18,6 +18,6 @@ SYM_CONST_RE = re.compile(
         rf" | {SpecialChar.ETA.value + SpecialChar.ALPHA.value}"
         rf" | {SpecialChar.EPS.value + SpecialChar.CHI.value}"
         rf" | {SpecialChar.EPS.value + SpecialChar.CHI.value}"
-        rf"][a-zA-Z0-1_]*"
+        rf"][a-zA-Z0-9_]*"
     )
 )
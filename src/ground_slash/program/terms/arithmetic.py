@@ -1,6 +1,4 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional, Set, Tuple, Union
 
 try:
@@ -8,9 +6,10 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+from ground_slash.program.expression import cached_slot
 from ground_slash.program.operators import ArithOp
 from ground_slash.program.safety_characterization import SafetyTriplet
-from ground_slash.program.substitution import Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.symbols import SpecialChar
 
 from .special import ArithVariable
@@ -33,6 +32,8 @@ class ArithTerm(Term, ABC):
         operands: Tuple consisting of the left and right operands.
     """  # noqa
 
+    __slots__ = ()
+
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
 
@@ -162,8 +163,8 @@ class ArithTerm(Term, ABC):
         Returns:
             `TermTuple` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute operands recursively
         operands = (operand.substitute(subst) for operand in self.operands)
@@ -180,6 +181,8 @@ class Minus(ArithTerm):
         operands: Tuple consisting of the (single) operand.
     """
 
+    __slots__ = ("operand", "_hash", "_ground")
+
     def __init__(self: Self, operand: Union[ArithTerm, Number, "Variable"]) -> None:
         """Initializes the arithmetic term.
 
@@ -187,6 +190,7 @@ class Minus(ArithTerm):
             operand: `ArithTerm`, `Number`, or `Variable` instance.
         """  # noqa
         self.operand = operand
+        self._hash = None
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the term to a given object.
@@ -202,7 +206,10 @@ class Minus(ArithTerm):
         return isinstance(other, type(self)) and self.operand == other.operand
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.operand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.operand))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the arithmetic term.
@@ -219,7 +226,7 @@ class Minus(ArithTerm):
 
         return f"-{operand_str}"
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.operand.ground
 
@@ -277,6 +284,8 @@ class Add(ArithTerm):
         operands: Tuple consisting of the left and right operands.
     """
 
+    __slots__ = ("loperand", "roperand", "_hash", "_ground")
+
     def __init__(
         self: Self,
         loperand: Union[ArithTerm, Number, "Variable"],
@@ -290,6 +299,7 @@ class Add(ArithTerm):
         """  # noqa
         self.loperand = loperand
         self.roperand = roperand
+        self._hash = None
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the term to a given object.
@@ -309,7 +319,10 @@ class Add(ArithTerm):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the arithmetic term.
@@ -331,7 +344,7 @@ class Add(ArithTerm):
 
         return f"{loperand_str}+{roperand_str}"
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.loperand.ground and self.roperand.ground
 
@@ -395,6 +408,8 @@ class Sub(ArithTerm):
         operands: Tuple consisting of the left and right operands.
     """
 
+    __slots__ = ("loperand", "roperand", "_hash", "_ground")
+
     def __init__(
         self: Self,
         loperand: Union[ArithTerm, Number, "Variable"],
@@ -408,6 +423,7 @@ class Sub(ArithTerm):
         """  # noqa
         self.loperand = loperand
         self.roperand = roperand
+        self._hash = None
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the term to a given object.
@@ -427,7 +443,10 @@ class Sub(ArithTerm):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the arithmetic term.
@@ -449,7 +468,7 @@ class Sub(ArithTerm):
 
         return f"{loperand_str}-{roperand_str}"
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.loperand.ground and self.roperand.ground
 
@@ -514,6 +533,8 @@ class Mult(ArithTerm):
         operands: Tuple consisting of the left and right operands.
     """
 
+    __slots__ = ("loperand", "roperand", "_hash", "_ground")
+
     def __init__(
         self: Self,
         loperand: Union[ArithTerm, Number, "Variable"],
@@ -527,6 +548,7 @@ class Mult(ArithTerm):
         """  # noqa
         self.loperand = loperand
         self.roperand = roperand
+        self._hash = None
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the term to a given object.
@@ -546,7 +568,10 @@ class Mult(ArithTerm):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the arithmetic term.
@@ -568,7 +593,7 @@ class Mult(ArithTerm):
 
         return f"{loperand_str}*{roperand_str}"
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.loperand.ground and self.roperand.ground
 
@@ -651,6 +676,8 @@ class Div(ArithTerm):
         operands: Tuple consisting of the left and right operands.
     """
 
+    __slots__ = ("loperand", "roperand", "_hash", "_ground")
+
     def __init__(
         self: Self,
         loperand: Union[ArithTerm, Number, "Variable"],
@@ -664,6 +691,7 @@ class Div(ArithTerm):
         """  # noqa
         self.loperand = loperand
         self.roperand = roperand
+        self._hash = None
 
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the term to a given object.
@@ -683,7 +711,10 @@ class Div(ArithTerm):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.loperand, self.roperand))
+        if self._hash is None:
+            self._hash = hash((type(self), self.loperand, self.roperand))
+
+        return self._hash
 
     def __str__(self: Self) -> str:
         """Returns the string representation for the arithmetic term.
@@ -705,7 +736,7 @@ class Div(ArithTerm):
 
         return f"{loperand_str}/{roperand_str}"
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return self.loperand.ground and self.roperand.ground
 
@@ -1,6 +1,4 @@
-from copy import deepcopy
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Union
 
 try:
     from typing import Self
@@ -9,10 +7,18 @@ except ImportError:
 
 import ground_slash
 from ground_slash.program.safety_characterization import SafetyTriplet
-from ground_slash.program.substitution import Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.symbols import SYM_CONST_RE
 
-from .term import Infimum, Number, String, SymbolicConstant, Term, TermTuple
+from .term import (
+    Infimum,
+    InternedTerm,
+    Number,
+    String,
+    SymbolicConstant,
+    Term,
+    TermTuple,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from ground_slash.program.expression import Expr
@@ -22,9 +28,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from ground_slash.program.variable_table import VariableTable
 
 
-class Functional(Term):
+class Functional(InternedTerm):
     """Represents a functional term.
 
+    Ground functional terms are interned (see `InternedTerm`).
+
     Attributes:
         symbol: String representing the identifier for the functional term.
         terms: `TermTuple` instance containing the terms of the functional term.
@@ -32,6 +40,14 @@ class Functional(Term):
         arity: Integer representing the arity of the functional term (equal to the number of terms).
     """  # noqa
 
+    __slots__ = ("symbol", "terms", "_hash")
+
+    def __new__(cls: "type[Self]", symbol: str, *terms: Term) -> Self:
+        if all(term.ground for term in terms):
+            return super().__new__(cls, symbol, *terms)
+
+        return object.__new__(cls)
+
     def __init__(self: Self, symbol: str, *terms: Term) -> None:
         """Initializes the functional term instance.
 
@@ -45,12 +61,20 @@ class Functional(Term):
         Raises:
             ValueError: Invalid value specified for the symbolic constant. Only checked if `ground_slash.debug()` returns `True`.
         """  # noqa
+        # interned instance (already initialized)
+        if hasattr(self, "symbol"):
+            return
+
         # check if functor name is valid
         if ground_slash.debug() and not SYM_CONST_RE.fullmatch(symbol):
             raise ValueError(f"Invalid value for {type(self)}: {symbol}")
 
         self.symbol = symbol
         self.terms = TermTuple(*terms)
+        self._hash = hash((type(self), self.symbol, self.terms))
+
+    def __getnewargs__(self: Self) -> Tuple[Any, ...]:
+        return (self.symbol, *self.terms)
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a functional term.
@@ -75,20 +99,20 @@ class Functional(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, type(self))
             and other.symbol == self.symbol
             and other.terms == self.terms
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.symbol, self.terms))
+        return self._hash
 
     @property
     def arity(self: Self) -> int:
         return len(self.terms)
 
-    @cached_property
+    @property
     def ground(self: Self) -> bool:
         return self.terms.ground
 
@@ -167,6 +191,17 @@ class Functional(Term):
 
         return self.terms.match(other.terms)
 
+    def match_into(self: Self, other: "Expr", subst: Dict["Variable", Term]) -> bool:
+        if self.ground:
+            return self == other
+
+        return (
+            isinstance(other, type(self))
+            and self.symbol == other.symbol
+            and self.arity == other.arity
+            and self.terms.match_into(other.terms, subst)
+        )
+
     def substitute(self: Self, subst: Substitution) -> "Functional":
         """Applies a substitution to the functional term.
 
@@ -178,8 +213,8 @@ class Functional(Term):
         Returns:
             `Functional` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         terms = (term.substitute(subst) for term in self.terms)
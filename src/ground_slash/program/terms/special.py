@@ -22,12 +22,14 @@ class ArithVariable(Variable):
         ground: Boolean indicating whether or not the term is ground (always `False`).
     """
 
+    __slots__ = ("id", "orig_term")
+
     ground: bool = False
 
     def __init__(self: Self, id: int, orig_term: "ArithTerm") -> None:
         """Initializes the arithmetic variable instance.
 
-        The variable identifier is initialized as `"\u03C4{id}"`.
+        The variable identifier is initialized as `"\u03c4{id}"`.
 
         Args:
             id: Non-negative integer representing the id for the arithmetic variable.
@@ -44,6 +46,7 @@ class ArithVariable(Variable):
         self.val = f"{SpecialChar.TAU.value}{id}"
         self.id = id
         self.orig_term = orig_term
+        self._hash = None
 
     def __str__(self: Self) -> str:
         """Returns the string representation for an arithmetic variable.
@@ -72,7 +75,10 @@ class ArithVariable(Variable):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.val, self.orig_term))
+        if self._hash is None:
+            self._hash = hash((type(self), self.val, self.orig_term))
+
+        return self._hash
 
     def precedes(self: Self, other: "Term") -> bool:
         """Checks precendence w.r.t. a given term.
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Set, Tuple, Union
+from inspect import Signature, signature
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Set, Tuple, Union
+from weakref import WeakValueDictionary
 
 try:
     from typing import Self
@@ -9,9 +9,9 @@ except ImportError:
     from typing_extensions import Self
 
 import ground_slash
-from ground_slash.program.expression import Expr
+from ground_slash.program.expression import Expr, cached_slot
 from ground_slash.program.safety_characterization import SafetyTriplet
-from ground_slash.program.substitution import AssignmentError, Substitution
+from ground_slash.program.substitution import Renaming, Substitution
 from ground_slash.program.symbols import SYM_CONST_RE, VARIABLE_RE
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -27,6 +27,11 @@ class Term(Expr, ABC):
     All terms should inherit from this class or a subclass thereof.
     """
 
+    __slots__ = ()
+
+    # hash value (computed once on first use)
+    _hash: Optional[int] = None
+
     @abstractmethod  # pragma: no cover
     def __eq__(self: Self, other: "Any") -> bool:
         """Compares the term to a given object.
@@ -102,7 +107,7 @@ class Term(Expr, ABC):
         Returns:
             `Term` instance.
         """
-        return deepcopy(self)
+        return self
 
     def substitute(self: Self, subst: Substitution) -> "Term":
         """Applies a substitution to the term.
@@ -115,7 +120,7 @@ class Term(Expr, ABC):
         Returns:
             (Possibly substituted) `Term` instance.
         """
-        return deepcopy(self)
+        return self
 
     def match(self: Self, other: "Expr") -> Optional[Substitution]:
         """Tries to match the expression with another one.
@@ -130,6 +135,85 @@ class Term(Expr, ABC):
         # empty substitution
         return Substitution() if self == other else None
 
+    def match_into(self: Self, other: "Expr", subst: Dict["Variable", "Term"]) -> bool:
+        """Matches the term with another expression, extending a given substitution.
+
+        Used for matching term tuples in a single pass without combining intermediate
+        substitutions. Assignments are only added to `subst` (and may be partially
+        added if matching fails).
+
+        Args:
+            other: `Expr` instance to be matched to.
+            subst: Dictionary mapping `Variable` instances to `Term` instances.
+
+        Returns:
+            Boolean indicating whether or not the term could be matched without any assignment conflicts.
+        """  # noqa
+        match = self.match(other)
+
+        if match is None:
+            return False
+
+        for var, target in match.items():
+            assigned = dict.get(subst, var)
+
+            if assigned is None:
+                subst[var] = target
+            elif not assigned == target:
+                return False
+
+        return True
+
+
+class InternedTerm(Term):
+    """Abstract base class for hash-consed (interned) ground terms.
+
+    Each distinct term exists exactly once: initializing a term equal to an existing
+    one returns the existing instance. Interned terms are immutable and are therefore
+    shared instead of copied. Subclasses need to implement `__getnewargs__`.
+    """
+
+    # weak references are required by the table of interned terms
+    __slots__ = ("__weakref__",)
+
+    # all interned terms (removed once no longer referenced)
+    _table: "WeakValueDictionary[Tuple[Any, ...], InternedTerm]" = WeakValueDictionary()
+
+    def __new__(cls: "type[Self]", *args: Any, **kwargs: Any) -> Self:
+        if kwargs:
+            # normalize keyword arguments (same instance as for positional arguments)
+            args = cls._signature().bind(None, *args, **kwargs).args[1:]
+
+        key = (cls, *args)
+        term = InternedTerm._table.get(key)
+
+        if term is None:
+            term = super().__new__(cls)
+            InternedTerm._table[key] = term
+
+        return term
+
+    @classmethod
+    def _signature(cls: "type[Self]") -> Signature:
+        # signature of the initializer (cached per class)
+        sig = cls.__dict__.get("_init_signature")
+
+        if sig is None:
+            sig = signature(cls.__init__)
+            setattr(cls, "_init_signature", sig)
+
+        return sig
+
+    def __reduce__(self: Self) -> Tuple[Any, ...]:
+        # re-intern on unpickling
+        return (type(self), self.__getnewargs__())
+
+    def __copy__(self: Self) -> Self:
+        return self
+
+    def __deepcopy__(self: Self, memo: Dict[int, Any]) -> Self:
+        return self
+
 
 class Infimum(Term):
     """Least element in the total ordering for terms.
@@ -138,6 +222,8 @@ class Infimum(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ()
+
     ground: bool = True
 
     def __str__(self: Self) -> str:
@@ -186,6 +272,8 @@ class Supremum(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ()
+
     ground: bool = True
 
     def __str__(self: Self) -> str:
@@ -235,6 +323,8 @@ class Variable(Term):
         ground: Boolean indicating whether or not the term is ground (always `False`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = False
 
     def __init__(self: Self, val: str) -> None:
@@ -254,6 +344,7 @@ class Variable(Term):
             raise ValueError(f"Invalid value for {type(self)}: {val}")
 
         self.val = val
+        self._hash = None
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a variable.
@@ -277,7 +368,10 @@ class Variable(Term):
         return isinstance(other, type(self)) and other.val == self.val
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.val))
+        if self._hash is None:
+            self._hash = hash((type(self), self.val))
+
+        return self._hash
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence w.r.t. a given term.
@@ -339,6 +433,18 @@ class Variable(Term):
         """  # noqa
         return Substitution({self: other}) if not self == other else Substitution()
 
+    def match_into(self: Self, other: "Expr", subst: Dict["Variable", "Term"]) -> bool:
+        if self == other:
+            return True
+
+        assigned = dict.get(subst, self)
+
+        if assigned is None:
+            subst[self] = other
+            return True
+
+        return assigned == other
+
     def substitute(self: Self, subst: Substitution) -> Term:
         """Applies a substitution to the term.
 
@@ -362,6 +468,8 @@ class AnonVariable(Variable):
         ground: Boolean indicating whether or not the term is ground (always `False`).
     """
 
+    __slots__ = ("id",)
+
     def __init__(self: Self, id: int) -> None:
         """Initializes the anonymous variable instance.
 
@@ -380,6 +488,7 @@ class AnonVariable(Variable):
 
         self.val = f"_{id}"
         self.id = id
+        self._hash = None
 
     def __eq__(self: Self, other: "Any") -> str:
         """Compares the term to a given object.
@@ -399,7 +508,10 @@ class AnonVariable(Variable):
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.val))
+        if self._hash is None:
+            self._hash = hash((type(self), self.val))
+
+        return self._hash
 
     def simplify(self: Self) -> "AnonVariable":
         """Simplifies the variable as part of an arithmetic term.
@@ -412,7 +524,7 @@ class AnonVariable(Variable):
         return AnonVariable(self.id)
 
 
-class Number(Term):
+class Number(InternedTerm):
     """Represents a number.
 
     Attributes:
@@ -420,6 +532,8 @@ class Number(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = True
 
     def __init__(self: Self, val: int) -> None:
@@ -428,7 +542,15 @@ class Number(Term):
         Args:
             val: Integer representing the value of the number.
         """
+        # interned instance (already initialized)
+        if hasattr(self, "val"):
+            return
+
         self.val = val
+        self._hash = hash((type(self), val))
+
+    def __getnewargs__(self: Self) -> Tuple[int]:
+        return (self.val,)
 
     def __add__(self: Self, other: "Number") -> "Number":
         """Returns a number representing the sum of this and a given number.
@@ -509,10 +631,12 @@ class Number(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, type(self)) and other.val == self.val
+        return self is other or (
+            isinstance(other, type(self)) and other.val == self.val
+        )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.val))
+        return self._hash
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -563,7 +687,7 @@ class Number(Term):
         return self.val
 
 
-class SymbolicConstant(Term):
+class SymbolicConstant(InternedTerm):
     """Represents a symbolic constant.
 
     Attributes:
@@ -571,6 +695,8 @@ class SymbolicConstant(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = True
 
     def __init__(self: Self, val: str) -> None:
@@ -579,12 +705,16 @@ class SymbolicConstant(Term):
         Args:
             val: String representing the identifier for the symbolic constant.
                 Valid identifiers start with a lower-case latin letter, followed by zero or more alphanumerics and underscores.
-                Instead of a single lower-case latin letter, identifiers may also start with '\u03b1', '\u03C7', '\u03b5\u03b1',
-                '\u03b5\u03C7', '\u03b7\u03b1', or '\u03b7\u03C7', but are reserved for internal use.
+                Instead of a single lower-case latin letter, identifiers may also start with '\u03b1', '\u03c7', '\u03b5\u03b1',
+                '\u03b5\u03c7', '\u03b7\u03b1', or '\u03b7\u03c7', but are reserved for internal use.
 
         Raises:
             ValueError: Invalid value specified for the symbolic constant. Only checked if `ground_slash.debug()` returns `True`.
         """  # noqa
+        # interned instance (already initialized)
+        if hasattr(self, "val"):
+            return
+
         # check if symbolic constant name is valid
         if ground_slash.debug() and not SYM_CONST_RE.fullmatch(
             val
@@ -592,6 +722,10 @@ class SymbolicConstant(Term):
             raise ValueError(f"Invalid value for {type(self)}: {val}")
 
         self.val = val
+        self._hash = hash((type(self), val))
+
+    def __getnewargs__(self: Self) -> Tuple[str]:
+        return (self.val,)
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a symbolic constant.
@@ -612,10 +746,12 @@ class SymbolicConstant(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, type(self)) and other.val == self.val
+        return self is other or (
+            isinstance(other, type(self)) and other.val == self.val
+        )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.val))
+        return self._hash
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -648,8 +784,24 @@ class SymbolicConstant(Term):
         else:
             return True
 
+    def substitute(self: Self, subst: Substitution) -> Term:
+        """Applies a substitution to the term.
+
+        Symbolic constants are only replaced by renamings (see `Renaming`).
+
+        Args:
+            subst: `Substitution` instance.
 
-class String(Term):
+        Returns:
+            (Possibly substituted) `Term` instance.
+        """
+        if isinstance(subst, Renaming):
+            return subst[self]
+
+        return self
+
+
+class String(InternedTerm):
     """Represents a string.
 
     Attributes:
@@ -657,6 +809,8 @@ class String(Term):
         ground: Boolean indicating whether or not the term is ground (always `True`).
     """
 
+    __slots__ = ("val", "_hash")
+
     ground: bool = True
 
     def __init__(self: Self, val: str) -> None:
@@ -665,7 +819,15 @@ class String(Term):
         Args:
             val: String representing the string value.
         """
+        # interned instance (already initialized)
+        if hasattr(self, "val"):
+            return
+
         self.val = val
+        self._hash = hash((type(self), val))
+
+    def __getnewargs__(self: Self) -> Tuple[str]:
+        return (self.val,)
 
     def __str__(self: Self) -> str:
         """Returns the string representation for a string.
@@ -686,10 +848,12 @@ class String(Term):
         Returns:
             Boolean indicating whether or not the term is considered equal to the given object.
         """  # noqa
-        return isinstance(other, type(self)) and other.val == self.val
+        return self is other or (
+            isinstance(other, type(self)) and other.val == self.val
+        )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), self.val))
+        return self._hash
 
     def precedes(self: Self, other: Term) -> bool:
         """Checks precendence of w.r.t. a given term.
@@ -730,6 +894,8 @@ class TermTuple:
         ground: Boolean indicating whether or not all terms are ground.
     """
 
+    __slots__ = ("terms", "_hash", "_ground")
+
     def __init__(self: Self, *terms: Term) -> None:
         """Initializes the term tuple instance.
 
@@ -737,6 +903,8 @@ class TermTuple:
             *terms: sequence of terms.
         """
         self.terms = terms
+        # hash value (computed once on first use)
+        self._hash: Optional[int] = None
 
     def __len__(self: Self) -> int:
         return len(self.terms)
@@ -753,14 +921,22 @@ class TermTuple:
         Returns:
             Boolean indicating whether or not the term tuple is considered equal to the given object.
         """  # noqa
-        return (
+        return self is other or (
             isinstance(other, type(self))
+            and hash(self) == hash(other)
             and len(self) == len(other)
             and all(t1 == t2 for t1, t2 in zip(self, other))
         )
 
     def __hash__(self: Self) -> int:
-        return hash((type(self), *self.terms))
+        if self._hash is None:
+            self._hash = hash((type(self), *self.terms))
+
+        return self._hash
+
+    def __reduce__(self: Self) -> Tuple[Any, ...]:
+        # re-initialize on unpickling (drops cached hash value)
+        return (type(self), self.terms)
 
     def __str__(self: Self) -> str:
         """TODO"""
@@ -783,7 +959,7 @@ class TermTuple:
     def __getitem__(self: Self, index: int) -> "Term":
         return self.terms[index]
 
-    @cached_property
+    @cached_slot
     def ground(self: Self) -> bool:
         return all(term.ground for term in self.terms)
 
@@ -838,7 +1014,7 @@ class TermTuple:
         """  # noqa
         return TermTuple(*tuple(term.replace_arith(var_table) for term in self.terms))
 
-    @cached_property
+    @property
     def weight(self: Self) -> int:
         """Returns the weight of the term tuple.
 
@@ -850,7 +1026,7 @@ class TermTuple:
 
         return 0
 
-    @cached_property
+    @property
     def pos_weight(self: Self) -> int:
         """Returns the positive weight of the term tuple.
 
@@ -862,7 +1038,7 @@ class TermTuple:
 
         return 0
 
-    @cached_property
+    @property
     def neg_weight(self: Self) -> int:
         """Returns the negative weight of the term tuple.
 
@@ -891,18 +1067,36 @@ class TermTuple:
 
         subst = Substitution()
 
-        for term1, term2 in zip(self.terms, other.terms):
-            match = term1.match(term2)
+        return subst if self.match_into(other, subst) else None
+
+    def match_into(
+        self: Self, other: "TermTuple", subst: Dict["Variable", "Term"]
+    ) -> bool:
+        """Matches the term tuple with another one of same length, extending a given substitution.
+
+        Ground constants are compared first, before any variables are assigned.
+
+        Args:
+            other: `TermTuple` instance to be matched to.
+            subst: Dictionary mapping `Variable` instances to `Term` instances.
 
-            if match is None:
-                return None
+        Returns:
+            Boolean indicating whether or not the term tuple could be matched without any assignment conflicts.
+        """  # noqa
+        pairs = tuple(zip(self.terms, other.terms))
 
-            try:
-                subst = subst + match
-            except AssignmentError:
-                return None
+        # reject early on mismatching constants
+        for term1, term2 in pairs:
+            if isinstance(term1, InternedTerm) and term1.ground and not term1 == term2:
+                return False
 
-        return subst
+        for term1, term2 in pairs:
+            if isinstance(term1, InternedTerm) and term1.ground:
+                continue
+            if not term1.match_into(term2, subst):
+                return False
+
+        return True
 
     def substitute(self: Self, subst: "Substitution") -> "TermTuple":
         """Applies a substitution to the term tuple.
@@ -915,8 +1109,8 @@ class TermTuple:
         Returns:
             `TermTuple` instance with (possibly substituted) terms.
         """
-        if self.ground:
-            return deepcopy(self)
+        if self.ground and not isinstance(subst, Renaming):
+            return self
 
         # substitute terms recursively
         terms = (term.substitute(subst) for term in self)
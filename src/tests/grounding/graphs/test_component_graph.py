@@ -132,6 +132,44 @@ class TestComponentGraph:
         assert u2_comp.sequence() == [(u2,)]
         assert v2_comp.sequence() == [(v2,)]
         assert v3_comp.sequence() == [(v3,)]
-        assert set(pX_qX_comp.sequence()) == {(pX,), (qX,)}
+        # q(X) depends positively on p(X)
+        assert pX_qX_comp.sequence() == [(pX,), (qX,)]
         assert x_comp.sequence() == [(x,)]
         assert y_comp.sequence() == [(y,)]
+
+    def test_component_graph_stratification(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        input = r"""
+        p :- not q.
+        q :- not p.
+        r :- not s.
+        s :- not r.
+        t :- p, r.
+        u :- t.
+        v.
+        w :- v, not x.
+        """
+
+        prog = Program.from_string(input, mode)
+        p, q, r, s, t, u, v, w = prog.statements
+
+        # create component graph
+        graph = ComponentGraph(prog.statements)
+
+        assert len(graph.nodes) == 6  # no extra components
+        stratified = {
+            frozenset(component.nodes): component.stratified
+            for component in graph.nodes
+        }
+
+        # negative cycles
+        assert not stratified[frozenset({p, q})]
+        assert not stratified[frozenset({r, s})]
+        # depending (transitively) on multiple unstratified components
+        assert not stratified[frozenset({t})]
+        assert not stratified[frozenset({u})]
+        # only depending on stratified components
+        assert stratified[frozenset({v})]
+        assert stratified[frozenset({w})]
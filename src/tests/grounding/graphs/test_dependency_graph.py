@@ -62,3 +62,37 @@ class TestDependencyGraph:
         assert (y, qX) in graph.neg_edges
 
         assert len(graph.edges) == 8  # no extra edges
+
+    def test_dependency_graph_shared_predicates(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        input = r"""
+        e(1,2).
+        e(2,3).
+
+        p(X,Y) :- e(X,Y).
+        p(X,Z) :- p(X,Y), e(Y,Z).
+        q(X) :- p(X,_), not p(X,X).
+        """
+
+        prog = Program.from_string(input, mode)
+
+        assert len(prog.statements) == 5  # make sure we have no extra statements
+        e12, e23, p1, p2, q = prog.statements
+
+        # create dependency graph
+        graph = DependencyGraph(prog.statements)
+
+        # every rule using a predicate depends on every rule defining it
+        assert graph.pos_edges == {
+            (p1, e12),
+            (p1, e23),
+            (p2, e12),
+            (p2, e23),
+            (p2, p1),
+            (q, p1),
+            (q, p2),
+        }  # no self-dependencies
+        assert graph.neg_edges == {(q, p1), (q, p2)}
+        assert len(graph.edges) == 7
@@ -4,7 +4,7 @@ except ImportError:
     from typing_extensions import Self
 
 import ground_slash
-from ground_slash.grounding.graphs import compute_SCCs
+from ground_slash.grounding.graphs import compute_SCCs, map_SCCs
 
 
 class TestSCC:
@@ -21,3 +21,34 @@ class TestSCC:
 
         for scc in target_SCCs:
             assert scc in graph_SCCs
+
+        # SCCs are returned in reverse topological order
+        assert graph_SCCs.index({"B", "C"}) < graph_SCCs.index({"A"})
+        assert graph_SCCs.index({"B", "C"}) < graph_SCCs.index({"D"})
+
+    def test_compute_SCCs_deep(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        # long cycle (exceeds recursion limit of a recursive implementation)
+        n = 10000
+        nodes = set(range(n))
+        edges = {(i, (i + 1) % n) for i in range(n)}
+
+        assert compute_SCCs(nodes, edges) == [nodes]
+
+        # long chain
+        edges = {(i, i + 1) for i in range(n - 1)}
+        graph_SCCs = compute_SCCs(range(n), edges)
+
+        assert graph_SCCs == [{i} for i in reversed(range(n))]
+
+    def test_map_SCCs(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        sccs = [("A",), ("B", "C")]
+        scc_map = map_SCCs(sccs)
+
+        assert scc_map == {"A": sccs[0], "B": sccs[1], "C": sccs[1]}
+        assert scc_map["B"] is scc_map["C"]
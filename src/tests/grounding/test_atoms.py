@@ -0,0 +1,65 @@
+from array import array
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+import pytest  # type: ignore
+
+import ground_slash
+from ground_slash.grounding import AtomTable
+from ground_slash.program.literals import AggrBaseLiteral, Naf, PredLiteral
+from ground_slash.program.terms import Functional, Number, String, TermTuple, Variable
+
+
+class TestAtomTable:
+    def test_atom_table(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        p0 = PredLiteral("p", Number(0), String("x"))
+        p1 = PredLiteral("p", Number(1), Functional("f", Number(0)))
+        neg_p0 = PredLiteral("p", Number(0), String("x"), neg=True)
+        q = PredLiteral("q")
+
+        table = AtomTable((p0, p1))
+        assert len(table) == 2
+
+        # dense ids (in order of insertion)
+        assert table.add(p1) == 1
+        assert table.add(neg_p0) == 2
+        assert table.add(q) == 3
+        assert table.add(p0) == 0
+        assert len(table) == 4
+        # default-negation is not part of an atom
+        assert table.add(Naf(PredLiteral("q"))) == 3
+
+        # terms are shared across atoms
+        assert table.terms == [
+            Number(0),
+            String("x"),
+            Number(1),
+            Functional("f", Number(0)),
+        ]
+        assert table.term_id(String("x")) == 1
+
+        # columnar extensions
+        pred_id = table.pred_ids[("p", 2, False)]
+        assert table.columns[pred_id] == (array("q", [0, 2]), array("q", [1, 3]))
+        assert table.columns[table.pred_id("p", 2, True)] == (
+            array("q", [0]),
+            array("q", [1]),
+        )
+        assert table.columns[table.pred_id("q", 0)] == ()
+        assert table.columns[table.pred_id("r", 1)] == (array("q"),)
+        # rows of atoms in the extensions
+        assert list(table.atom_preds) == [pred_id, pred_id, 1, 2]
+        assert list(table.atom_rows) == [0, 1, 0, 0]
+
+        # non-ground atoms
+        with pytest.raises(ValueError):
+            table.add(PredLiteral("p", Variable("X")))
+        # special literals
+        with pytest.raises(ValueError):
+            table.add(AggrBaseLiteral(0, TermTuple(), TermTuple()))
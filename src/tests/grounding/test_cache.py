@@ -0,0 +1,133 @@
+import os
+import tempfile
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+import pytest  # type: ignore
+
+import ground_slash
+from ground_slash.grounding import Grounder, GroundingCache
+from ground_slash.grounding import grounder as grounder_module
+from ground_slash.grounding.graphs import ComponentGraph
+from ground_slash.program.literals import PredLiteral
+from ground_slash.program.program import Program
+from ground_slash.program.terms import Number
+
+
+class TestGroundingCache:
+    def test_cache(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        with tempfile.TemporaryDirectory() as path:
+            # invalid maximum size
+            with pytest.raises(ValueError):
+                GroundingCache(path, max_size=-1)
+
+            cache = GroundingCache(os.path.join(path, "cache"))
+            assert os.path.isdir(cache.path)
+
+            # keys are independent of order and duplicates of statements
+            prog = Program.from_string("p(1). q(X) :- p(X).")
+            assert cache.key(prog) == cache.key(
+                Program.from_string("q(X) :- p(X). p(1). p(1).")
+            )
+            assert cache.key(prog) != cache.key(Program.from_string("p(1)."))
+
+            # store & load
+            key = cache.key(prog)
+            assert cache.load(key) is None
+            cache.store(key, (1, "a"))
+            assert cache.load(key) == (1, "a")
+            # no temporary files are left behind
+            assert os.listdir(cache.path) == [key + cache.suffix]
+
+            # corrupt entry
+            with open(cache.entry(key), "wb") as f:
+                f.write(b"invalid")
+            assert cache.load(key) is None
+
+            # eviction of least recently used entries
+            cache.store("a", 0)
+            cache.store("b", 1)
+            size = os.path.getsize(cache.entry("a"))
+            os.utime(cache.entry("a"), ns=(0, 0))
+            os.utime(cache.entry("b"), ns=(1, 1))
+            cache.load("a")  # mark as recently used
+            cache.max_size = 2 * size
+            cache.store("c", 2)
+            assert cache.load("a") == 0
+            assert cache.load("b") is None
+            assert cache.load("c") == 2
+
+            # recent temporary files count towards the maximum size
+            tmp_path = os.path.join(cache.path, "d" + cache.tmp_suffix)
+            with open(tmp_path, "wb") as f:
+                f.write(b"0" * size)
+            os.utime(cache.entry("a"), ns=(0, 0))
+            cache.evict()
+            assert cache.load("a") is None
+            assert cache.load("c") == 2
+            assert os.path.exists(tmp_path)
+            # stale temporary files are removed
+            os.utime(tmp_path, ns=(0, 0))
+            cache.evict()
+            assert not os.path.exists(tmp_path)
+            assert cache.load("c") == 2
+
+            # clear cache (including temporary files)
+            with open(tmp_path, "wb") as f:
+                f.write(b"0")
+            cache.clear()
+            assert cache.load("a") is None and cache.load("c") is None
+            assert os.listdir(cache.path) == []
+
+    def test_grounder_cache(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog = Program.from_string(r"""
+            p(1). p(2).
+            q(X) :- p(X), not r(X).
+            r(X) :- p(X), X > 1.
+            s(X) :- q(X).
+            u(X) :- t(X), q(X).
+            """)
+        expected = set(Grounder(prog).ground().statements)
+
+        with tempfile.TemporaryDirectory() as path:
+            # grounding stores the result in the cache
+            assert set(Grounder(prog, cache=path).ground().statements) == expected
+            assert len(os.listdir(path)) == 1
+
+            # count computations of component graphs
+            graphs = []
+
+            def counting_graph(*args):
+                graphs.append(ComponentGraph(*args))
+                return graphs[-1]
+
+            grounder_module.ComponentGraph = counting_graph
+
+            try:
+                # cache hit (restores the state of the grounder as well)
+                grounder = Grounder(prog, cache=GroundingCache(path))
+                assert set(grounder.ground().statements) == expected
+                assert grounder.certain_literals.count(("r", 1)) == 1
+                # component graph is not computed on a cache hit
+                assert not graphs
+                assert grounder.components is None
+
+                # incremental instantiation after a cache hit
+                grounder.add_facts(PredLiteral("t", Number(1)))
+                assert {str(s) for s in grounder.ground_delta().statements} == {
+                    "t(1).",
+                    "u(1) :- t(1),q(1).",
+                }
+                # component graph is computed once it is needed
+                assert len(graphs) == 1
+            finally:
+                grounder_module.ComponentGraph = ComponentGraph
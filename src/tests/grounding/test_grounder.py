@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import FrozenSet, Set, Tuple
 
 try:
@@ -9,7 +10,8 @@ import clingo  # type: ignore
 import pytest  # type: ignore
 
 import ground_slash
-from ground_slash.grounding import Grounder
+from ground_slash.grounding import Grounder, LiteralStore
+from ground_slash.grounding import grounder as grounder_module
 from ground_slash.program.literals import (
     AggrCount,
     AggrLiteral,
@@ -160,6 +162,19 @@ class TestGrounder:
             )
             == set()
         )  # no match
+        # indexed set of possible literals
+        assert Grounder.matches(
+            PredLiteral("p", Variable("X"), Number(1)),
+            possible=LiteralStore(
+                {
+                    PredLiteral("p", Number(0), Number(1)),
+                    PredLiteral("p", Number(0), Number(2)),
+                    PredLiteral("q", Number(0), Number(1)),
+                }
+            ),
+        ) == {
+            Substitution({Variable("X"): Number(0)})
+        }  # match
         # ground negative predicate literal
         assert Grounder.matches(Naf(Neg(PredLiteral("p", Number(0))))) == {
             Substitution()
@@ -266,6 +281,78 @@ class TestGrounder:
             == set()
         )  # not all literals have matches in 'possible'
 
+        # ----- semi-naive evaluation -----
+
+        # only instances with at least one new positive body literal
+        assert Grounder.ground_statement(
+            NormalRule(
+                PredLiteral("p", Variable("X"), Variable("Y")),
+                [PredLiteral("q", Variable("X")), PredLiteral("q", Variable("Y"))],
+            ),
+            possible={PredLiteral("q", Number(0)), PredLiteral("q", Number(1))},
+            prev_possible={PredLiteral("q", Number(0))},
+            duplicate=True,
+        ) == {
+            NormalRule(
+                PredLiteral("p", Number(0), Number(1)),
+                [PredLiteral("q", Number(0)), PredLiteral("q", Number(1))],
+            ),
+            NormalRule(
+                PredLiteral("p", Number(1), Number(0)),
+                [PredLiteral("q", Number(1)), PredLiteral("q", Number(0))],
+            ),
+            NormalRule(
+                PredLiteral("p", Number(1), Number(1)),
+                [PredLiteral("q", Number(1)), PredLiteral("q", Number(1))],
+            ),
+        }
+        # no new literals
+        assert (
+            Grounder.ground_statement(
+                NormalRule(
+                    PredLiteral("p", Variable("X")), [PredLiteral("q", Variable("X"))]
+                ),
+                possible={PredLiteral("q", Number(0))},
+                prev_possible={PredLiteral("q", Number(0))},
+                duplicate=True,
+            )
+            == set()
+        )
+        # no positive body literals (already instantiated before)
+        assert (
+            Grounder.ground_statement(
+                NormalRule(PredLiteral("p", Number(1))),
+                possible={PredLiteral("q", Number(0))},
+                duplicate=True,
+            )
+            == set()
+        )
+
+        # ----- lazy instantiation -----
+
+        rule = NormalRule(
+            PredLiteral("p", Variable("X")),
+            [PredLiteral("q", Variable("X"), Variable("Y"))],
+        )
+        possible = {
+            PredLiteral("q", Number(0), Number(0)),
+            PredLiteral("q", Number(0), Number(1)),
+        }
+        instances = Grounder.iter_statement(rule, possible=possible)
+        assert not isinstance(instances, set)
+        assert sorted(str(instance) for instance in instances) == [
+            "p(0) :- q(0,0).",
+            "p(0) :- q(0,1).",
+        ]
+        assert set(Grounder.iter_statement(rule, possible=possible)) == (
+            Grounder.ground_statement(rule, possible=possible)
+        )
+        # invalid statements are rejected immediately
+        with pytest.raises(ValueError):
+            Grounder.iter_statement(
+                NormalRule(PredLiteral("p", Variable("X"))),
+            )
+
         # ----- disjunctive facts -----
 
         # ground fact
@@ -414,6 +501,125 @@ class TestGrounder:
             == set()
         )  # not all literals have matches in 'possible'
 
+    def test_compile_plan(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        rule = Program.from_string("p(X,Y) :- q(X), r(X,Y).", mode).statements[0]
+        plans = dict()
+        possible = LiteralStore([PredLiteral("r", Number(0), Number(0))])
+
+        # 'q' has no literals yet (processed first)
+        plan = Grounder.compile_plan(
+            rule, rule.body, possible, frozenset(), plans=plans
+        )
+        assert plan.order[0].name == "q"
+        assert (
+            Grounder.compile_plan(rule, rule.body, possible, frozenset(), plans=plans)
+            is plan
+        )
+
+        # cached plan is re-compiled once the cardinalities change significantly
+        possible.update(PredLiteral("q", Number(i)) for i in range(4))
+        new_plan = Grounder.compile_plan(
+            rule, rule.body, possible, frozenset(), plans=plans
+        )
+        assert new_plan is not plan
+        assert new_plan.order[0].name == "r"
+
+    def test_partition_statement(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        # rule joining all pairs of images
+        rule = Program.from_string(
+            "addition(I,J,D+E) :- img(I,D), img(J,E), not bad(I).", mode
+        ).statements[0]
+        possible = {PredLiteral("img", Number(i), Number(i % 3)) for i in range(8)} | {
+            PredLiteral("bad", Number(0))
+        }
+        certain = {PredLiteral("bad", Number(0))}
+
+        instances = Grounder.ground_statement(rule, certain=certain, possible=possible)
+        assert len(instances) == 7 * 8
+
+        # partitioning does not pay off for small extensions
+        assert (
+            Grounder.partition_statement(rule, None, certain, possible, workers=2)
+            is None
+        )
+
+        min_partition_size = Grounder.min_partition_size
+        Grounder.min_partition_size = 4
+
+        try:
+            # driver literal is the first positive literal in join order
+            plan = Grounder.compile_plan(
+                rule, rule.body, LiteralStore(possible), frozenset()
+            )
+            driver, candidates = Grounder.select_driver(plan, LiteralStore(possible))
+            assert driver is plan.order[0]
+            assert len(candidates) == 8
+
+            assert (
+                Grounder.partition_statement(rule, None, certain, possible, workers=2)
+                == instances
+            )
+            assert (
+                Grounder.ground_statement(
+                    rule, certain=certain, possible=possible, workers=3
+                )
+                == instances
+            )
+            # process pool is shared across calls
+            pool = grounder_module._process_pools[2]
+            assert (
+                Grounder.partition_statement(rule, None, certain, possible, workers=2)
+                == instances
+            )
+            assert grounder_module._process_pools[2] is pool
+
+            # partitions are submitted to specified executor (without shutting it down)
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                assert (
+                    Grounder.partition_statement(
+                        rule, None, certain, possible, workers=2, executor=executor
+                    )
+                    == instances
+                )
+                assert (
+                    Grounder.ground_statement(
+                        rule,
+                        certain=certain,
+                        possible=possible,
+                        workers=2,
+                        executor=executor,
+                    )
+                    == instances
+                )
+                assert executor.submit(abs, -1).result() == 1
+        finally:
+            Grounder.min_partition_size = min_partition_size
+
+    def test_plan_cache(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        rule = Program.from_string("p(X,Y) :- q(X), r(X,Y).", mode).statements[0]
+        plans = dict()
+        possible = LiteralStore([PredLiteral("r", Number(0), Number(0))])
+
+        set(Grounder.ground_statement(rule, possible=possible, plans=plans))
+        assert len(plans) == 1
+        # cached order is reused
+        set(Grounder.ground_statement(rule, possible=possible, plans=plans))
+        assert len(plans) == 1
+
+        # order is re-computed once the cardinalities change significantly
+        possible.update(PredLiteral("q", Number(i)) for i in range(4))
+        set(Grounder.ground_statement(rule, possible=possible, plans=plans))
+        assert len(plans) == 2
+
     def test_ground_unsafe(self: Self, mode: str):
         # make sure debug mode is enabled
         assert ground_slash.debug()
@@ -428,11 +634,253 @@ class TestGrounder:
         with pytest.raises(ValueError):
             Grounder(prog)
 
+    def test_ground_backend(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog = Program.from_string("p(1).", mode)
+        # unknown join backend
+        with pytest.raises(ValueError):
+            Grounder(prog, backend="unknown")
+
     def test_ground_component(self: Self, mode: str):
         # make sure debug mode is enabled
         assert ground_slash.debug()
 
-        # TODO
+        # recursive component
+        prog = Program.from_string(
+            r"""
+            path(X,Y) :- edge(X,Y).
+            path(X,Z) :- path(X,Y), edge(Y,Z).
+            """,
+            mode,
+        )
+        edges = {
+            PredLiteral("edge", Number(0), Number(1)),
+            PredLiteral("edge", Number(1), Number(2)),
+        }
+        literals_J = LiteralStore(edges)
+
+        instances = Grounder(prog).ground_component(prog, edges, literals_J)
+        assert {str(instance) for instance in instances} == {
+            "path(0,1) :- edge(0,1).",
+            "path(1,2) :- edge(1,2).",
+            "path(0,2) :- path(0,1),edge(1,2).",
+        }
+        # specified literals are not modified
+        assert set(literals_J) == edges
+
+    def test_rewrite(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog = Program.from_string(
+            r"""
+            a :- #count{ X: p(X) } >= 1.
+            { q(X): p(X) } :- a.
+            """,
+            mode,
+        )
+        grounder = Grounder(prog)
+
+        (
+            prog_alpha,
+            prog_aggr_eps,
+            prog_aggr_eta,
+            aggr_map,
+            prog_choice_eps,
+            prog_choice_eta,
+            choice_map,
+        ) = grounder.rewrite(prog)
+        assert len(prog_alpha.statements) == 2
+        assert len(aggr_map) == len(choice_map) == 1
+        # rewritings are cached for the statements of a component
+        assert grounder.rewrite(Program(prog.statements)) is grounder.rewrite(prog)
+        assert grounder.rewrite(Program(prog.statements[:1])) is not grounder.rewrite(
+            prog
+        )
+
+    def test_ground_parallel(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog_str = r"""
+        node(1). node(2). node(3).
+        edge(1,2). edge(2,3). edge(3,1).
+
+        col(r). col(g).
+        1 <= { color(X,C):col(C) } <= 1 :- node(X).
+        :- edge(X,Y), color(X,C), color(Y,C).
+
+        path(X,Y) :- edge(X,Y).
+        path(X,Z) :- path(X,Y), edge(Y,Z).
+
+        source(X) :- node(X), #count{ Y: edge(X,Y) } >= 1.
+        reach(X) :- path(1,X), not source(X).
+        """
+        prog = Program.from_string(prog_str, mode)
+
+        # invalid number of workers
+        with pytest.raises(ValueError):
+            Grounder(prog, workers=0)
+
+        serial = Grounder(prog).ground()
+
+        # instantiate all independent components in worker processes
+        min_parallel_size = Grounder.min_parallel_size
+        Grounder.min_parallel_size = 0
+
+        try:
+            parallel = Grounder(prog, workers=2).ground()
+        finally:
+            Grounder.min_parallel_size = min_parallel_size
+
+        assert set(parallel.statements) == set(serial.statements)
+
+        # input literals are only selected for components sent to the pool
+        selected = []
+        select_literals = grounder_module._select_literals
+
+        def counting_select(*args):
+            selected.append(args)
+            return select_literals(*args)
+
+        grounder_module._select_literals = counting_select
+
+        try:
+            parallel = Grounder(prog, workers=2).ground()
+        finally:
+            grounder_module._select_literals = select_literals
+
+        assert set(parallel.statements) == set(serial.statements)
+        assert not selected
+
+        # a single process pool is shared by components and partitioned statements
+        pools = []
+
+        class CountingPool(ProcessPoolExecutor):
+            def __init__(self: Self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        min_partition_size = Grounder.min_partition_size
+        Grounder.min_partition_size = 1
+        grounder_module.ProcessPoolExecutor = CountingPool
+
+        try:
+            grounder = Grounder(prog, workers=2)
+            parallel = grounder.ground()
+        finally:
+            Grounder.min_partition_size = min_partition_size
+            grounder_module.ProcessPoolExecutor = ProcessPoolExecutor
+
+        assert set(parallel.statements) == set(serial.statements)
+        assert len(pools) == 1
+        # pool is shut down after the instantiation
+        assert grounder.executor is None
+
+    def test_ground_many(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        rules_str = r"""
+        col(r). col(g).
+        1 <= { color(X,C):col(C) } <= 1 :- node(X).
+        :- edge(X,Y), color(X,C), color(Y,C).
+
+        path(X,Y) :- edge(X,Y).
+        path(X,Z) :- path(X,Y), edge(Y,Z).
+
+        source(X) :- node(X), #count{ Y: edge(X,Y) } >= 1.
+        reach(X) :- path(1,X), not source(X).
+        """
+        rules = Program.from_string(rules_str, mode)
+
+        nodes = [PredLiteral("node", Number(i)) for i in range(1, 4)]
+        edges = [
+            PredLiteral("edge", Number(1), Number(2)),
+            PredLiteral("edge", Number(2), Number(3)),
+            PredLiteral("edge", Number(3), Number(1)),
+        ]
+        fact_sets = [nodes[:2] + edges[:1], nodes + edges, []]
+
+        expected = [
+            set(
+                Grounder(Program(rules.statements + Grounder.as_facts(facts)))
+                .ground()
+                .statements
+            )
+            for facts in fact_sets
+        ]
+
+        # serial instantiation (in order)
+        results = list(Grounder.ground_many(rules, fact_sets))
+        assert [i for i, _ in results] == [0, 1, 2]
+        assert [set(prog.statements) for _, prog in results] == expected
+
+        # parallel instantiation (as completed)
+        results = dict(Grounder.ground_many(rules, fact_sets, workers=2))
+        assert [set(results[i].statements) for i in range(3)] == expected
+
+        # invalid fact
+        with pytest.raises(ValueError):
+            list(Grounder.ground_many(rules, [[Naf(PredLiteral("node", Number(1)))]]))
+        # invalid number of workers
+        with pytest.raises(ValueError):
+            list(Grounder.ground_many(rules, fact_sets, workers=0))
+
+    def test_ground_delta(self: Self, mode: str):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog_str = r"""
+        edge(1,2).
+        path(X,Y) :- edge(X,Y).
+        path(X,Z) :- path(X,Y), edge(Y,Z).
+        """
+        new_facts = (
+            PredLiteral("edge", Number(2), Number(3)),
+            NormalRule(PredLiteral("edge", Number(3), Number(1))),
+        )
+
+        grounder = Grounder(Program.from_string(prog_str, mode))
+        # not instantiated yet
+        ground_prog = grounder.ground_delta()
+        assert {str(statement) for statement in ground_prog.statements} == {
+            "edge(1,2).",
+            "path(1,2) :- edge(1,2).",
+        }
+
+        # invalid facts
+        with pytest.raises(ValueError):
+            grounder.add_facts(PredLiteral("edge", Variable("X"), Number(1)))
+        with pytest.raises(ValueError):
+            grounder.add_facts(Naf(PredLiteral("edge", Number(1), Number(1))))
+
+        grounder.add_facts(*new_facts)
+        delta_prog = grounder.ground_delta()
+
+        # only new instances are computed
+        assert not set(delta_prog.statements) & set(ground_prog.statements)
+        assert set(ground_prog.statements) | set(delta_prog.statements) == set(
+            Grounder(Program.from_string(prog_str + "edge(2,3). edge(3,1).", mode))
+            .ground()
+            .statements
+        )
+        # nothing new to be instantiated
+        assert grounder.ground_delta().statements == tuple()
+
+        # facts affecting default negation cannot be added incrementally
+        grounder = Grounder(
+            Program.from_string(
+                prog_str + "start(X) :- edge(X,Y), not edge(Y,X).", mode
+            )
+        )
+        grounder.ground()
+        grounder.add_facts(PredLiteral("edge", Number(2), Number(1)))
+
+        with pytest.raises(ValueError):
+            grounder.ground_delta()
 
     def test_example_1(self: Self, mode: str):
         # make sure debug mode is enabled
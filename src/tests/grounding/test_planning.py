@@ -0,0 +1,194 @@
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+import pytest  # type: ignore
+
+import ground_slash
+from ground_slash.grounding import LiteralStore
+from ground_slash.grounding.planning import (
+    CheckStep,
+    JoinPlan,
+    MatchStep,
+    estimate,
+    join_order,
+    required_vars,
+)
+from ground_slash.program.literals import (
+    AggrCount,
+    AggrElement,
+    AggrLiteral,
+    Equal,
+    Guard,
+    Less,
+    Naf,
+    PredLiteral,
+)
+from ground_slash.program.operators import RelOp
+from ground_slash.program.statements import NormalRule
+from ground_slash.program.substitution import Substitution
+from ground_slash.program.terms import Add, Functional, Number, TermTuple, Variable
+
+
+class TestPlanning:
+    def test_required_vars(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        X, Y = Variable("X"), Variable("Y")
+
+        # variables of positive literals can be bound by matching
+        assert required_vars(PredLiteral("p", X, Y)) == set()
+        # except for variables in arithmetic terms
+        assert required_vars(PredLiteral("p", X, Add(Y, Number(1)))) == {Y}
+        # checks need all variables to be bound
+        assert required_vars(Naf(PredLiteral("p", X, Y))) == {X, Y}
+        assert required_vars(Less(X, Number(1))) == {X}
+
+    def test_estimate(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        X, Y = Variable("X"), Variable("Y")
+
+        store = LiteralStore(
+            {PredLiteral("p", Number(i), Number(i % 2)) for i in range(4)}
+        )
+
+        # no statistics available
+        assert estimate(PredLiteral("p", X, Y), set(), set()) == 1.0
+        # unknown predicate
+        assert estimate(PredLiteral("q", X), store, set()) == 0.0
+        # unbound arguments
+        assert estimate(PredLiteral("p", X, Y), store, set()) == 4.0
+        # ground arguments
+        assert estimate(PredLiteral("p", X, Number(0)), store, set()) == 2.0
+        # bound variables
+        assert estimate(PredLiteral("p", X, Y), store, {X}) == 1.0
+        assert estimate(PredLiteral("p", X, Y), store, {Y}) == 2.0
+
+    def test_join_order(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        X, Y, Z = Variable("X"), Variable("Y"), Variable("Z")
+
+        p = PredLiteral("p", X, Y)
+        q = PredLiteral("q", Y, Z)
+        r = PredLiteral("r", Z)
+        naf_r = Naf(PredLiteral("r", X))
+        less = Less(X, Y)
+
+        store = LiteralStore(
+            {PredLiteral("p", Number(i), Number(i)) for i in range(10)}
+            | {PredLiteral("q", Number(i), Number(i)) for i in range(3)}
+            | {PredLiteral("r", Number(0))}
+        )
+
+        # without statistics: original order (checks as early as possible)
+        assert join_order((naf_r, p, less, q)) == (p, naf_r, less, q)
+        # most selective literal first
+        assert join_order((p, q, r), store) == (r, q, p)
+        assert join_order((p, q, less), store) == (q, p, less)
+        # initially bound variables
+        assert join_order((p, q), store, {X}) == (p, q)
+        # forced first literal
+        assert join_order((p, q, r), store, first=p) == (p, q, r)
+        # first literal is ignored if it cannot be processed first
+        s = PredLiteral("s", Add(X, Number(1)))
+        assert join_order((p, s), store, first=s) == (p, s)
+        # ground literals
+        assert join_order((less, PredLiteral("t")), store, {X, Y}) == (
+            less,
+            PredLiteral("t"),
+        )
+
+        # unsafe literals
+        with pytest.raises(ValueError):
+            join_order((naf_r, less))
+        with pytest.raises(ValueError):
+            join_order((Equal(X, Number(0)),))
+        # aggregate literals
+        with pytest.raises(ValueError):
+            join_order(
+                (
+                    AggrLiteral(
+                        AggrCount(),
+                        (AggrElement(TermTuple(X), (p,)),),
+                        Guard(RelOp.LESS, Number(3), False),
+                    ),
+                ),
+            )
+
+    def test_join_plan(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        X, Y = Variable("X"), Variable("Y")
+
+        q01 = PredLiteral("q", Number(0), Number(1))
+        q11 = PredLiteral("q", Number(1), Number(1))
+        q12 = PredLiteral("q", Number(1), Number(2))
+        r1 = PredLiteral("r", Number(1))
+        store = LiteralStore({q01, q11, q12, r1})
+
+        # p(X,Y) :- q(X,Y), not r(Y), X < Y.
+        rule = NormalRule(
+            PredLiteral("p", X, Y),
+            (PredLiteral("q", X, Y), Naf(PredLiteral("r", Y)), Less(X, Y)),
+        )
+
+        def instance(x: int, y: int) -> NormalRule:
+            return rule.substitute(Substitution({X: Number(x), Y: Number(y)}))
+
+        plan = JoinPlan.compile(rule, possible=store)
+        assert plan.order == rule.body.literals
+        assert isinstance(plan.steps[0], MatchStep)
+        assert isinstance(plan.steps[1], CheckStep)
+        assert isinstance(plan.steps[2], CheckStep)
+        assert plan.steps[0].simple
+        # variables are bound to slots of the binding frame
+        assert set(plan.variables) == {X, Y}
+        assert all(plan.variables[plan.slots[var]] == var for var in (X, Y))
+        assert plan.steps[0].binds == ((0, plan.slots[X]), (1, plan.slots[Y]))
+        # default negation is checked against certain literals only
+        assert plan.run(set(), store) == {
+            instance(0, 1),
+            instance(1, 2),
+        }
+        assert plan.run({r1}, store) == {
+            instance(1, 2),
+        }
+        # lazy instantiation
+        assert sorted(map(str, plan.instances({r1}, store))) == [str(instance(1, 2))]
+        # plans can be run repeatedly (also against plain sets)
+        assert plan.run({r1}, {q01, q12}) == plan.run({r1}, store)
+        # sources and excluded literals
+        assert plan.run(
+            set(), store, sources={PredLiteral("q", X, Y): (store, {q01})}
+        ) == {instance(1, 2)}
+        # initial substitution
+        plan = JoinPlan.compile(rule, possible=store, bound={X})
+        assert plan.steps[0].lookups == ((0, plan.slots[X]),)
+        assert plan.run(set(), store, Substitution({X: Number(1)})) == {
+            instance(1, 2),
+        }
+
+        # repeated variables: p(X) :- q(X,X).
+        rule = NormalRule(PredLiteral("p", X), (PredLiteral("q", X, X),))
+        plan = JoinPlan.compile(rule)
+        assert plan.steps[0].equals == ((0, 1),)
+        assert plan.run(set(), store) == {instance(1, 1)}
+
+        # ground literals: p :- q(0,1).
+        rule = NormalRule(PredLiteral("p"), (q01,))
+        assert JoinPlan.compile(rule).run(set(), store) == {rule}
+        assert JoinPlan.compile(rule).run(set(), {q11}) == set()
+
+        # functional terms are matched generically: p(X) :- f(g(X)).
+        f = PredLiteral("f", Functional("g", Number(0)))
+        rule = NormalRule(PredLiteral("p", X), (PredLiteral("f", Functional("g", X)),))
+        plan = JoinPlan.compile(rule)
+        assert not plan.steps[0].simple
+        assert plan.run(set(), LiteralStore({f})) == {instance(0, 0)}
@@ -0,0 +1,194 @@
+from array import array
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+import ground_slash
+from ground_slash.grounding import AtomTable, LiteralStore
+from ground_slash.program.literals import AggrBaseLiteral, Neg, PredLiteral
+from ground_slash.program.terms import (
+    Add,
+    Functional,
+    Number,
+    SymbolicConstant,
+    TermTuple,
+    Variable,
+)
+
+
+class TestLiteralStore:
+    def test_literal_store(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        p0a = PredLiteral("p", Number(0), SymbolicConstant("a"))
+        p1a = PredLiteral("p", Number(1), SymbolicConstant("a"))
+        p1b = PredLiteral("p", Number(1), SymbolicConstant("b"))
+        q0 = PredLiteral("q", Number(0))
+        neg_q1 = Neg(PredLiteral("q", Number(1)))
+
+        store = LiteralStore({p0a, p1a, q0})
+        assert len(store) == 3
+        assert p0a in store and p1a in store and q0 in store
+        assert p1b not in store
+        assert set(store) == {p0a, p1a, q0}
+
+        # adding
+        store.add(p1b)
+        store.add(p1b)  # duplicate
+        store.update({neg_q1})
+        assert len(store) == 5
+        assert store.count(("p", 2)) == 3
+        assert store.count(("q", 1)) == 2  # classical negation shares the signature
+        assert store.count(("r", 0)) == 0
+
+        # copies/unions are independent of the original store
+        other = store.union({PredLiteral("r")})
+        assert PredLiteral("r") in other
+        assert PredLiteral("r") not in store
+        assert other.count(("p", 2)) == 3
+
+        # candidates for unbound arguments
+        assert store.candidates(PredLiteral("p", Variable("X"), Variable("Y"))) == {
+            p0a,
+            p1a,
+            p1b,
+        }
+        # candidates for bound arguments
+        assert store.candidates(PredLiteral("p", Number(1), Variable("Y"))) == {
+            p1a,
+            p1b,
+        }
+        assert store.candidates(
+            PredLiteral("p", Variable("X"), SymbolicConstant("a"))
+        ) == {
+            p0a,
+            p1a,
+        }
+        assert store.candidates(PredLiteral("p", Number(0), SymbolicConstant("b"))) in (
+            {p0a},
+            {p1b},
+        )  # smallest bucket (superset of all matches)
+        assert store.candidates(PredLiteral("p", Number(2), Variable("Y"))) == set()
+        # unknown predicate
+        assert store.candidates(PredLiteral("r", Variable("X"))) == set()
+        # ground arithmetic terms are not used for lookups (matched by value)
+        assert store.candidates(
+            PredLiteral("p", Add(Number(0), Number(1)), SymbolicConstant("b"))
+        ) == {p1b}
+        # functional terms
+        f = PredLiteral("f", Functional("g", Number(0)))
+        store.add(f)
+        assert store.candidates(PredLiteral("f", Functional("g", Number(0)))) == {f}
+        assert store.candidates(PredLiteral("f", Functional("g", Number(1)))) == set()
+        assert store.candidates(PredLiteral("f", Functional("g", Variable("X")))) == {f}
+
+    def test_statistics(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        store = LiteralStore(
+            {
+                PredLiteral("p", Number(0), SymbolicConstant("a")),
+                PredLiteral("p", Number(1), SymbolicConstant("a")),
+                PredLiteral("p", Number(2), SymbolicConstant("b")),
+            }
+        )
+
+        # number of literals with a term at a position
+        assert store.count(("p", 2), 1, SymbolicConstant("a")) == 2
+        assert store.count(("p", 2), 0, Number(3)) == 0
+        # number of distinct terms at a position
+        assert store.distinct(("p", 2), 0) == 3
+        assert store.distinct(("p", 2), 1) == 2
+        assert store.distinct(("q", 1), 0) == 0
+
+        # statistics are updated and copied correctly
+        other = store.copy()
+        other.add(PredLiteral("p", Number(0), SymbolicConstant("c")))
+        assert other.distinct(("p", 2), 0) == 3
+        assert other.distinct(("p", 2), 1) == 3
+        assert store.distinct(("p", 2), 1) == 2
+
+        # lookups by positions and terms
+        assert store.lookup(("p", 2), ((0, Number(0)),)) == {
+            PredLiteral("p", Number(0), SymbolicConstant("a"))
+        }
+        assert store.lookup(("p", 2), ()) == store.pred_index[("p", 2)]
+        assert store.lookup(("p", 2), ((1, SymbolicConstant("c")),)) == set()
+        assert store.lookup(("r", 0), ()) == set()
+
+    def test_layers(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        p0 = PredLiteral("p", Number(0))
+        p1 = PredLiteral("p", Number(1))
+        p2 = PredLiteral("p", Number(2))
+
+        base_1 = LiteralStore({p0, p1})
+        base_2 = LiteralStore({p1})
+        store = LiteralStore(bases=(base_1, base_2))
+
+        # base literals are part of the store (without duplicates)
+        assert len(store) == 2
+        assert sorted(store, key=str) == [p0, p1]
+        assert p0 in store and p2 not in store
+        assert set(store.lookup(("p", 1), ())) == {p0, p1}
+        assert list(store.lookup(("p", 1), ((0, Number(1)),))) == [p1]
+        assert store.distinct(("p", 1), 0) == 2
+
+        # literals are only added to the top layer
+        assert not store.add(p0)
+        assert store.add(p2)
+        assert p2 in store and p2 not in base_1
+        assert store.literals == {p2}
+        assert set(store.candidates(PredLiteral("p", Variable("X")))) == {p0, p1, p2}
+
+        # changes to the bases are reflected
+        base_2.add(PredLiteral("q"))
+        assert PredLiteral("q") in store
+        assert len(store) == 4
+        assert store >= {p0, p1, p2, PredLiteral("q")}
+
+    def test_encoded(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        p0 = PredLiteral("p", Number(0))
+        p1 = PredLiteral("p", Number(1))
+        p2 = PredLiteral("p", Number(2))
+
+        atoms = AtomTable()
+        base = LiteralStore({p0, p1}, atoms=atoms)
+        # table is inherited from the bases
+        store = LiteralStore(bases=(base,))
+        assert store.atoms is atoms
+        store.add(p2)
+        store.add(PredLiteral("q", Number(0)))
+
+        # literals are registered in the shared table (rows per layer)
+        pred_id = atoms.pred_ids[("p", 1, False)]
+        assert len(atoms) == 4
+        assert sorted(atoms.columns[pred_id][0][row] for row in base.rows[pred_id]) == [
+            0,
+            1,
+        ]
+        assert store.encoded(atoms, pred_id) == [array("q", [2]), base.rows[pred_id]]
+        # copies share the table
+        assert store.copy().encoded(atoms, pred_id) == store.encoded(atoms, pred_id)
+
+        # stores without (or with another) table
+        assert LiteralStore({p0}).encoded(atoms, pred_id) is None
+        assert LiteralStore({p0}, atoms=AtomTable()).encoded(atoms, pred_id) is None
+        assert LiteralStore(bases=(LiteralStore({p0}),)).encoded(atoms, pred_id) is None
+        # other predicates only
+        assert LiteralStore({PredLiteral("q")}).encoded(atoms, pred_id) == []
+
+        # special literals cannot be encoded
+        aggr = AggrBaseLiteral(0, TermTuple(), TermTuple())
+        store = LiteralStore({aggr}, atoms=atoms)
+        assert store.unencoded == {aggr.pred()}
+        assert store.encoded(atoms, atoms.pred_id(*aggr.pred())) is None
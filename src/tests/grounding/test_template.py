@@ -0,0 +1,226 @@
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+import pytest  # type: ignore
+
+import ground_slash
+from ground_slash.grounding import Grounder, Template
+from ground_slash.program.literals import Naf, PredLiteral
+from ground_slash.program.program import Program
+from ground_slash.program.statements import NormalRule
+from ground_slash.program.terms import Number, SymbolicConstant, Variable
+
+
+def sample(*images: str):
+    """Helper function returning the facts for a sample of image pairs."""
+    facts = [PredLiteral("img", SymbolicConstant(image)) for image in images]
+    facts += [
+        PredLiteral("pair", SymbolicConstant(first), SymbolicConstant(second))
+        for first, second in zip(images[::2], images[1::2])
+    ]
+
+    return facts
+
+
+class TestTemplate:
+    def test_template(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog = Program.from_string(r"""
+            #npp(digit(I), [0,1]) :- img(I).
+            addition(I,J,D+E) :- pair(I,J), digit(I,D), digit(J,E).
+            seen(f(I)) :- img(I).
+            """)
+        template = Template(prog, sample("a", "b"))
+
+        # constants of the template facts act as placeholders
+        assert template.placeholders == {
+            SymbolicConstant("a"): Variable("P0"),
+            SymbolicConstant("b"): Variable("P1"),
+        }
+        # program does not depend on the order of terms
+        assert template.order is None
+
+        # invalid facts
+        with pytest.raises(ValueError):
+            Template(prog, [PredLiteral("img", Variable("X"))])
+        with pytest.raises(ValueError):
+            template.match([Naf(PredLiteral("img", SymbolicConstant("c")))])
+
+        # isomorphic facts
+        facts = sample("ca", "cb")
+        assert template.match(facts) == {
+            SymbolicConstant("a"): SymbolicConstant("ca"),
+            SymbolicConstant("b"): SymbolicConstant("cb"),
+        }
+        assert set(template.instantiate(facts).statements) == set(
+            Grounder(
+                Program(prog.statements + tuple(NormalRule(fact) for fact in facts))
+            )
+            .ground()
+            .statements
+        )
+        assert "seen(f(ca)) :- img(ca)." in {
+            str(statement) for statement in template.instantiate(facts).statements
+        }
+
+        # non-isomorphic facts
+        assert template.match(sample("ca", "cb", "cc", "cd")) is None
+        assert (
+            template.match(
+                [
+                    PredLiteral("img", SymbolicConstant("ca")),
+                    PredLiteral("img", SymbolicConstant("cb")),
+                    PredLiteral("pair", SymbolicConstant("ca"), SymbolicConstant("ca")),
+                ]
+            )
+            is None
+        )
+        assert (
+            template.match(
+                [
+                    PredLiteral("img", SymbolicConstant("ca")),
+                    PredLiteral("img", Number(1)),
+                    PredLiteral("pair", SymbolicConstant("ca"), Number(1)),
+                ]
+            )
+            is None
+        )
+        # predicate names do not clash with constants
+        assert template.match(sample("digit", "cb")) is not None
+        assert template.match(sample("a", "seen")) is not None
+
+        # fall back to regular grounding
+        facts = sample("ca", "cb", "cc", "cd")
+        assert set(template.instantiate(facts).statements) == set(
+            Grounder(
+                Program(prog.statements + tuple(NormalRule(fact) for fact in facts))
+            )
+            .ground()
+            .statements
+        )
+
+    def test_template_order(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog = Program.from_string(r"""
+            less(I,J) :- pair(I,J), I < J.
+            small(I) :- img(I), I < m.
+            """)
+        template = Template(prog, sample("a", "b"))
+
+        # 'm' is a constant of the program (not a placeholder)
+        assert set(template.placeholders) == {
+            SymbolicConstant("a"),
+            SymbolicConstant("b"),
+        }
+        assert template.order == (
+            SymbolicConstant("a"),
+            SymbolicConstant("b"),
+            SymbolicConstant("m"),
+        )
+
+        # renaming preserves the order of constants
+        assert template.match(sample("c", "d")) is not None
+        # renaming changes the order of constants
+        assert template.match(sample("d", "c")) is None
+        assert template.match(sample("c", "n")) is None
+        # renaming clashes with other constants
+        assert template.match(sample("c", "m")) is None
+
+        for images in (("c", "d"), ("d", "c"), ("c", "n")):
+            facts = sample(*images)
+            assert set(template.instantiate(facts).statements) == set(
+                Grounder(
+                    Program(prog.statements + tuple(NormalRule(fact) for fact in facts))
+                )
+                .ground()
+                .statements
+            )
+
+        # first candidate mapping (a -> d, b -> c) violates the order of constants
+        template = Template(
+            prog, [PredLiteral("img", SymbolicConstant(image)) for image in "ab"]
+        )
+        facts = [PredLiteral("img", SymbolicConstant(image)) for image in "dc"]
+
+        assert template.match(facts) == {
+            SymbolicConstant("a"): SymbolicConstant("c"),
+            SymbolicConstant("b"): SymbolicConstant("d"),
+        }
+        assert set(template.instantiate(facts).statements) == set(
+            Grounder(
+                Program(prog.statements + tuple(NormalRule(fact) for fact in facts))
+            )
+            .ground()
+            .statements
+        )
+
+    def test_template_symbols(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        # placeholder 'a' is also used as a function symbol
+        prog = Program.from_string(r"""
+            seen(a(I)) :- img(I).
+            many :- #count{ I: img(I) } >= 2.
+            single(I) :- img(I), not pair(I,I).
+            """)
+        template = Template(prog, sample("a", "b"))
+
+        assert set(template.placeholders) == {
+            SymbolicConstant("a"),
+            SymbolicConstant("b"),
+        }
+        # aggregate guards and default negation do not introduce any constants
+        # or dependencies on the order of terms
+        assert template.constants == set()
+        assert template.order is None
+
+        facts = sample("cb", "ca")
+        assert template.match(facts) is not None
+
+        ground_prog = Grounder(
+            Program(prog.statements + tuple(NormalRule(fact) for fact in facts))
+        ).ground()
+        statements = {str(statement) for statement in ground_prog.statements}
+        instantiated = {
+            str(statement) for statement in template.instantiate(facts).statements
+        }
+        # NOTE: aggregate elements may be ordered differently
+        (many,) = [statement for statement in instantiated if statement[:4] == "many"]
+        assert "ca:img(ca)" in many and "cb:img(cb)" in many
+        assert instantiated - {many} == {
+            statement for statement in statements if statement[:4] != "many"
+        }
+        # function symbols are not renamed
+        assert "seen(a(ca)) :- img(ca)." in instantiated
+
+    def test_template_choice(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog = Program.from_string(r"""
+            {sel(I)} :- img(I).
+            1 <= {pick(I,J); pick(J,I)} <= 1 :- pair(I,J).
+            """)
+        template = Template(prog, sample("a", "b"))
+
+        facts = sample("ca", "cb")
+        instantiated = template.instantiate(facts)
+
+        # choice elements are lifted and renamed
+        assert "{sel(ca)} :- img(ca)." in {
+            str(statement) for statement in instantiated.statements
+        }
+        assert set(instantiated.statements) == set(
+            Grounder(
+                Program(prog.statements + tuple(NormalRule(fact) for fact in facts))
+            )
+            .ground()
+            .statements
+        )
@@ -0,0 +1,251 @@
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+import pytest  # type: ignore
+
+import ground_slash
+from ground_slash.grounding import AtomTable, Grounder, LiteralStore
+from ground_slash.grounding.planning import JoinPlan
+from ground_slash.grounding.vectorized import (
+    VectorizedJoinPlan,
+    join_indices,
+    term_values,
+)
+from ground_slash.program.literals import Equal, Less, Naf, PredLiteral, Unequal
+from ground_slash.program.program import Program
+from ground_slash.program.statements import NormalRule
+from ground_slash.program.substitution import Substitution
+from ground_slash.program.terms import (
+    Add,
+    Div,
+    Functional,
+    Minus,
+    Mult,
+    Number,
+    String,
+    Sub,
+    Variable,
+)
+
+np = pytest.importorskip("numpy")
+
+
+class TestVectorized:
+    def test_join_indices(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        # cross product
+        left, right = join_indices([], [], 2, 3)
+        assert sorted(zip(left.tolist(), right.tolist())) == [
+            (i, j) for i in range(2) for j in range(3)
+        ]
+        # single key
+        left, right = join_indices([np.array([0, 1, 1])], [np.array([1, 2, 1])], 3, 3)
+        assert sorted(zip(left.tolist(), right.tolist())) == [
+            (1, 0),
+            (1, 2),
+            (2, 0),
+            (2, 2),
+        ]
+        # composite keys
+        left, right = join_indices(
+            [np.array([0, 0]), np.array([1, 2])],
+            [np.array([0, 0, 1]), np.array([2, 1, 1])],
+            2,
+            3,
+        )
+        assert sorted(zip(left.tolist(), right.tolist())) == [(0, 1), (1, 0)]
+        # no matches
+        left, right = join_indices([np.array([0])], [np.array([], dtype=int)], 1, 0)
+        assert len(left) == len(right) == 0
+
+    def test_vectorized_join_plan(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        X, Y, Z = Variable("X"), Variable("Y"), Variable("Z")
+
+        store = LiteralStore(
+            {PredLiteral("q", Number(i), Number(i % 3)) for i in range(6)}
+            | {PredLiteral("r", Number(i)) for i in range(3)}
+            | {PredLiteral("q", Number(1), Number(1))}
+        )
+        certain = {PredLiteral("r", Number(0))}
+
+        rules = (
+            # p(X,Z) :- q(X,Y), q(Y,Z), not r(Z), X < Z.
+            NormalRule(
+                PredLiteral("p", X, Z),
+                (
+                    PredLiteral("q", X, Y),
+                    PredLiteral("q", Y, Z),
+                    Naf(PredLiteral("r", Z)),
+                    Less(X, Z),
+                ),
+            ),
+            # p(X) :- q(X,X), r(X).
+            NormalRule(
+                PredLiteral("p", X), (PredLiteral("q", X, X), PredLiteral("r", X))
+            ),
+            # p(X,Y) :- q(X,Y), r(Z), Y = Z+1.
+            NormalRule(
+                PredLiteral("p", X, Y),
+                (
+                    PredLiteral("q", X, Y),
+                    PredLiteral("r", Z),
+                    Equal(Y, Add(Z, Number(1))),
+                ),
+            ),
+            # p :- r(2).
+            NormalRule(PredLiteral("p"), (PredLiteral("r", Number(2)),)),
+            # p(X) :- f(g(X)) (not vectorized).
+            NormalRule(PredLiteral("p", X), (PredLiteral("f", Functional("g", X)),)),
+        )
+
+        for rule in rules:
+            plan = VectorizedJoinPlan.compile(rule, possible=store)
+            expected = JoinPlan.compile(rule, possible=store).run(certain, store)
+
+            assert plan.run(certain, store) == expected
+            # plans can be run repeatedly (also against plain sets)
+            assert plan.run(certain, set(store)) == expected
+
+        # initial substitution and sources
+        rule = rules[0]
+        plan = VectorizedJoinPlan.compile(rule, possible=store, bound={X})
+        subst = Substitution({X: Number(1)})
+        sources = {
+            PredLiteral("q", Y, Z): (store, {PredLiteral("q", Number(1), Number(1))})
+        }
+        assert plan.run(certain, store, subst, sources) == JoinPlan.compile(
+            rule, possible=store, bound={X}
+        ).run(certain, store, subst, sources)
+
+        # functional terms fall back to tuple-at-a-time matching
+        assert not VectorizedJoinPlan.compile(rules[-1]).vectorized
+
+    def test_encoded_extension(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        X, Y = Variable("X"), Variable("Y")
+
+        atoms = AtomTable()
+        store = LiteralStore(
+            {PredLiteral("q", Number(i), Number(i % 3)) for i in range(6)},
+            atoms=atoms,
+        )
+        delta = LiteralStore({PredLiteral("r", Number(1))}, atoms=atoms)
+        possible = LiteralStore(bases=(store, delta))
+
+        # p(X,Y) :- q(X,Y), r(Y).
+        rule = NormalRule(
+            PredLiteral("p", X, Y), (PredLiteral("q", X, Y), PredLiteral("r", Y))
+        )
+        plan = VectorizedJoinPlan.compile(rule, possible=possible)
+        expected = JoinPlan.compile(rule, possible=possible).run(set(), possible)
+
+        # candidates are gathered from the shared atom table (instead of encoded)
+        assert plan.run(set(), possible) == expected
+        assert plan.table is atoms
+        assert not plan.encoded
+
+        # candidates excluded by another store of the same table
+        step = next(step for step in plan.steps if step.literal.name == "q")
+        excluded = LiteralStore({PredLiteral("q", Number(0), Number(0))}, atoms=atoms)
+        rows = plan.encoded_extension(step, possible, excluded)
+        assert sorted(map(tuple, rows.tolist())) == sorted(
+            (atoms.term_id(Number(i)), atoms.term_id(Number(i % 3)))
+            for i in range(1, 6)
+        )
+        # stores without the table are encoded one by one
+        assert plan.encoded_extension(step, possible, {PredLiteral("r")}) is None
+        assert plan.encoded_extension(step, LiteralStore(set(store)), None) is None
+        assert plan.run(set(), set(possible)) == expected
+        assert plan.encoded
+
+    def test_backend(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        prog_str = r"""
+        edge(1,2). edge(2,3). edge(3,1). edge(3,4).
+        path(X,Y) :- edge(X,Y).
+        path(X,Z) :- path(X,Y), edge(Y,Z).
+        n(X) :- edge(X,_).
+        big(X) :- n(X), #count{Y: path(X,Y)} >= 4.
+        {sel(X): n(X)} <= 1.
+        far(X,Y+1) :- path(X,Y), not sel(X), X < Y.
+        """
+
+        prog = Program.from_string(prog_str)
+        expected = Grounder(prog).ground()
+        ground_prog = Grounder(prog, backend="numpy").ground()
+
+        assert set(ground_prog.statements) == set(expected.statements)
+
+    def test_batch_evaluation(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        X, Y = Variable("X"), Variable("Y")
+
+        # p(X,Y) :- q(X,Y).
+        plan = VectorizedJoinPlan.compile(
+            NormalRule(PredLiteral("p", X, Y), (PredLiteral("q", X, Y),))
+        )
+        table = plan.table
+        columns = {
+            plan.slots[X]: np.array(
+                [table.term_id(term) for term in (Number(1), Number(4), Number(-3))]
+            ),
+            plan.slots[Y]: np.array(
+                [table.term_id(term) for term in (Number(2), Number(0), String("a"))]
+            ),
+        }
+        numbers = plan.numbers()
+
+        # arithmetic terms
+        assert plan.eval_arith(
+            Add(X, Mult(Number(2), Minus(X))), columns, 3, numbers
+        ).tolist() == [-1, -4, 3]
+        assert plan.eval_arith(Div(X, Number(2)), columns, 3, numbers).tolist() == [
+            0,
+            2,
+            -2,
+        ]
+        # non-numeric terms and division by zero
+        assert plan.eval_arith(Add(X, Y), columns, 3, numbers) is None
+        assert plan.eval_arith(Div(X, Sub(X, X)), columns, 3, numbers) is None
+
+        # built-in literals
+        assert plan.eval_builtin(Less(X, Number(2)), columns, 3, numbers).tolist() == [
+            True,
+            False,
+            True,
+        ]
+        assert plan.eval_builtin(
+            Equal(Y, String("a")), columns, 3, numbers
+        ).tolist() == [False, False, True]
+        assert plan.eval_builtin(
+            Unequal(X, Sub(Number(5), Number(1))), columns, 3, numbers
+        ).tolist() == [True, False, True]
+        # total order for non-numeric terms is evaluated one by one
+        assert plan.eval_builtin(Less(X, Y), columns, 3, numbers) is None
+
+        # values are cached per table and only computed for new terms
+        other = VectorizedJoinPlan.compile(
+            NormalRule(PredLiteral("p", X), (PredLiteral("q", X),))
+        )
+        other.table = table
+        n = len(table.terms)
+        table.term_id(Number(7))
+        table.term_id(Number(2**40))
+        values, numeric = other.numbers()
+        assert term_values[table].size == n + 2
+        assert values[:n].tolist() == numbers[0].tolist()
+        assert values[n:].tolist() == [7, 0]
+        assert numeric[n:].tolist() == [True, False]
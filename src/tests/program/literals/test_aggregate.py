@@ -688,6 +688,17 @@ class TestAggregate:
                 ),
             )
         )
+        # order of elements is irrelevant
+        reordered_literal = AggrLiteral(
+            aggr_func,
+            ground_elements[::-1],
+            guards=(
+                Guard(RelOp.LESS, Number(3), False),
+                Guard(RelOp.LESS, Number(3), True),
+            ),
+        )
+        assert ground_literal == reordered_literal
+        assert hash(ground_literal) == hash(reordered_literal)
         # ground
         assert ground_literal.ground
         assert not var_literal.ground
@@ -31,6 +31,9 @@ class TestNaf:
         assert literal.name == literal_.name and literal.terms == literal_.terms
         assert not Naf(PredLiteral("p", Number(0), Variable("Y")), False).naf
         assert Naf(PredLiteral("p", Number(0), Variable("Y")), True).naf
+        # original literal is not modified
+        assert not literal.naf
+        assert Naf(literal_, False) == literal and literal_.naf
 
         # aggregate literal
         literal = AggrLiteral(AggrCount(), tuple(), Guard(RelOp.LESS, Number(3), False))
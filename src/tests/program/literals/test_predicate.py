@@ -9,7 +9,14 @@ import ground_slash
 from ground_slash.program.literals import LiteralCollection, Naf, Neg, PredLiteral
 from ground_slash.program.safety_characterization import SafetyTriplet
 from ground_slash.program.substitution import Substitution
-from ground_slash.program.terms import ArithVariable, Minus, Number, String, Variable
+from ground_slash.program.terms import (
+    ArithVariable,
+    Functional,
+    Minus,
+    Number,
+    String,
+    Variable,
+)
 from ground_slash.program.variable_table import VariableTable
 
 
@@ -37,6 +44,21 @@ class TestPredicate:
         assert literal == PredLiteral("p", Number(0), String("x"))
         # hashing
         assert hash(literal) == hash(PredLiteral("p", Number(0), String("x")))
+        # hashes are cached and reset when the negation changes
+        other = PredLiteral("p", Number(0), String("x"))
+        assert other._hash is None
+        hash(other)
+        assert other._hash == hash(literal)
+        other.set_naf()
+        assert other._hash is None
+        assert hash(other) != hash(literal) and other != literal
+        other.set_naf(False)
+        other.set_neg()
+        assert hash(other) != hash(literal) and other != literal
+        other.set_neg(False)
+        assert hash(other) == hash(literal) and other == literal
+        assert abs(Naf(literal)) == literal
+        assert hash(abs(Naf(literal))) == hash(literal)
         # arity
         assert literal.arity == 2
         # predicate tuple
@@ -85,6 +107,15 @@ class TestPredicate:
         ) == PredLiteral(
             "p", Number(1), Number(0)
         )  # NOTE: substitution is invalid
+        # ground literals are not copied
+        literal = PredLiteral("p", Number(0), String("f"))
+        assert literal.substitute(Substitution({Variable("X"): Number(1)})) is literal
+        # only non-ground terms are rebuilt
+        literal = PredLiteral("p", Variable("X"), Functional("f", Number(0)))
+        assert (
+            literal.substitute(Substitution({Variable("X"): Number(1)})).terms[1]
+            is literal.terms[1]
+        )
         # match
         assert PredLiteral("p", Variable("X"), String("f")).match(
             PredLiteral("p", Number(1), String("f"))
@@ -1,3 +1,5 @@
+import pickle
+
 try:
     from typing import Self
 except ImportError:
@@ -56,6 +58,10 @@ class TestNormal:
         # safety
         assert ground_rule.safe
         assert not var_rule.safe
+        # compact representation (no instance dictionary)
+        assert not hasattr(ground_rule, "__dict__")
+        assert not hasattr(ground_rule.atom, "__dict__")
+        assert not hasattr(ground_rule.body, "__dict__")
         # variables
         assert ground_rule.vars() == ground_rule.global_vars() == set()
         assert var_rule.vars() == var_rule.global_vars() == {Variable("X")}
@@ -73,6 +79,10 @@ class TestNormal:
         ) == NormalRule(
             PredLiteral("p", Number(1), Number(0))
         )  # NOTE: substitution is invalid
+        # ground rules are not copied
+        assert ground_rule.substitute(Substitution({Variable("X"): Number(1)})) is (
+            ground_rule
+        )
 
         # rewrite aggregates
         assert rule == rule.rewrite_aggregates(0, dict())
@@ -119,6 +129,11 @@ class TestNormal:
                 [PredLiteral("q", Variable("X"))],
             )
         )
+        # pickling (cached hash values are not retained)
+        restored = pickle.loads(pickle.dumps(safe_var_rule))
+        assert restored._hash is None and restored.atom._hash is None
+        assert restored == safe_var_rule
+        assert hash(restored) == hash(safe_var_rule)
         # ground
         assert ground_rule.ground
         assert not unsafe_var_rule.ground
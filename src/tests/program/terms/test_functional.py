@@ -3,6 +3,8 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+import pickle
+
 import pytest  # type: ignore
 
 import ground_slash
@@ -16,6 +18,7 @@ from ground_slash.program.terms import (
     Number,
     String,
     Supremum,
+    TermTuple,
     Variable,
 )
 from ground_slash.program.variable_table import VariableTable
@@ -103,3 +106,36 @@ class TestFunctional:
             )
             is None
         )  # assignment conflict
+        # nested functional terms (matched in a single pass)
+        assert TermTuple(
+            Variable("X"), Functional("f", Variable("X"), Variable("Y"))
+        ).match(
+            TermTuple(Number(1), Functional("f", Number(1), String("f")))
+        ) == Substitution(
+            {Variable("X"): Number(1), Variable("Y"): String("f")}
+        )
+        assert (
+            TermTuple(Variable("X"), Functional("f", Variable("X"))).match(
+                TermTuple(Number(1), Functional("f", Number(2)))
+            )
+            is None
+        )  # assignment conflict across nesting levels
+
+    def test_interning(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        # ground functional terms are interned
+        term = Functional("f", Number(1), Functional("g", String("x")))
+        assert term is Functional("f", Number(1), Functional("g", String("x")))
+        assert pickle.loads(pickle.dumps(term)) is term
+        # keyword construction yields the same instance
+        assert Functional(symbol="f") is Functional("f")
+        # non-ground functional terms are not
+        term = Functional("f", Variable("X"))
+        assert term is not Functional("f", Variable("X"))
+        assert term == Functional("f", Variable("X"))
+        # substitution yields interned terms
+        assert term.substitute(Substitution({Variable("X"): Number(1)})) is Functional(
+            "f", Number(1)
+        )
@@ -3,6 +3,9 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+import pickle
+from copy import deepcopy
+
 import pytest  # type: ignore
 
 import ground_slash
@@ -91,7 +94,12 @@ class TestTerm:
         # invalid initialization
         with pytest.raises(ValueError):
             Variable("x")
+        with pytest.raises(ValueError):
+            Variable("1X")
         # valid initialization
+        assert str(Variable("X2")) == "X2"
+        assert str(Variable("P10")) == "P10"
+        assert str(Variable("Y_789")) == "Y_789"
         term = Variable("X")
         # string representation
         assert str(term) == "X"
@@ -224,7 +232,12 @@ class TestTerm:
             SymbolicConstant("1")
         with pytest.raises(ValueError):
             SymbolicConstant("Z")
+        with pytest.raises(ValueError):
+            SymbolicConstant("2b")
 
+        # valid initialization
+        assert str(SymbolicConstant("b2")) == "b2"
+        assert str(SymbolicConstant("img_10")) == "img_10"
         term = SymbolicConstant("b")
         # string representation
         assert str(term) == "b"
@@ -294,6 +307,36 @@ class TestTerm:
         assert String("a").match(String("b")) is None
         assert String("a").match(String("a")) == Substitution()
 
+    def test_interning(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        for term in (Number(5), SymbolicConstant("a"), String("a")):
+            # equal ground terms are identical
+            assert term is type(term)(term.val)
+            # keyword construction yields the same instance
+            assert term is type(term)(val=term.val)
+            # no copies
+            assert deepcopy(term) is term
+            assert pickle.loads(pickle.dumps(term)) is term
+            assert Substitution({Variable("X"): term})[Variable("X")] is term
+            # compact representation (no instance dictionary)
+            assert not hasattr(term, "__dict__")
+
+        # different types are not identified with each other
+        assert SymbolicConstant("a") is not String("a")
+        assert SymbolicConstant("a") != String("a")
+        # arithmetic results are interned as well
+        assert Number(2) + Number(3) is Number(5)
+        # invalid terms are still rejected
+        with pytest.raises(ValueError):
+            SymbolicConstant("A")
+        with pytest.raises(ValueError):
+            SymbolicConstant(val="A")
+        # invalid keyword arguments
+        with pytest.raises(TypeError):
+            Number(value=5)
+
     def test_term_tuple(self: Self):
         # make sure debug mode is enabled
         assert ground_slash.debug()
@@ -309,6 +352,8 @@ class TestTerm:
         assert hash(terms) == hash(TermTuple(Number(0), Variable("X")))
         # ground
         assert not terms.ground
+        assert terms._ground is False
+        assert not hasattr(terms, "__dict__")
         # variables
         assert terms.vars() == terms.global_vars() == {Variable("X")}
         # replace arithmetic terms
@@ -346,6 +391,19 @@ class TestTerm:
             )
             is None
         )  # assignment conflict
+        # match into existing substitution
+        subst = {Variable("Y"): Number(0)}
+        assert TermTuple(Variable("X"), Variable("Y")).match_into(
+            TermTuple(Number(1), Number(0)), subst
+        )
+        assert subst == {Variable("X"): Number(1), Variable("Y"): Number(0)}
+        assert not TermTuple(Variable("Y")).match_into(TermTuple(Number(1)), subst)
+        # constants are checked before any variables are assigned
+        subst = dict()
+        assert not TermTuple(Variable("X"), String("f")).match_into(
+            TermTuple(Number(1), String("g")), subst
+        )
+        assert subst == dict()
 
         # combining terms
         assert terms + TermTuple(String("")) == TermTuple(
@@ -158,6 +158,13 @@ class TestProgram:
         assert Program.from_string("p(p).", mode).statements[0].atom.terms[
             0
         ] == SymbolicConstant("p")
+        # identifiers containing digits
+        assert Program.from_string("p(a23) :- q(X42).", mode).statements[0] == (
+            NormalRule(
+                PredLiteral("p", SymbolicConstant("a23")),
+                [PredLiteral("q", Variable("X42"))],
+            )
+        )
         # functional term (empty vs. symbolic constant)
         assert Program.from_string("p(p()).", mode).statements[0].atom.terms[
             0
@@ -6,8 +6,19 @@ except ImportError:
 import pytest  # type: ignore
 
 import ground_slash
-from ground_slash.program.substitution import AssignmentError, Substitution
-from ground_slash.program.terms import Number, String, Variable
+from ground_slash.program.literals import PredLiteral
+from ground_slash.program.substitution import (
+    AssignmentError,
+    Renaming,
+    Substitution,
+)
+from ground_slash.program.terms import (
+    Functional,
+    Number,
+    String,
+    SymbolicConstant,
+    Variable,
+)
 
 
 class TestSubstitution:
@@ -85,3 +96,25 @@ class TestSubstitution:
         assert subst1.compose(subst2).compose(subst3).compose(
             subst4
         ) == Substitution.composition(subst1, subst2, subst3, subst4)
+
+    def test_renaming(self: Self):
+        # make sure debug mode is enabled
+        assert ground_slash.debug()
+
+        literal = PredLiteral(
+            "p", SymbolicConstant("a"), Functional("a", SymbolicConstant("b"))
+        )
+
+        # symbolic constants are not replaced by regular substitutions
+        assert (
+            literal.substitute(Substitution({SymbolicConstant("a"): Variable("X")}))
+            is literal
+        )
+        # renamings also apply to ground expressions (but not to function symbols)
+        renamed = literal.substitute(
+            Renaming(
+                {SymbolicConstant("a"): Variable("X"), SymbolicConstant("b"): Number(1)}
+            )
+        )
+        assert renamed == PredLiteral("p", Variable("X"), Functional("a", Number(1)))
+        assert not renamed.ground